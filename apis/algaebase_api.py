@@ -38,25 +38,29 @@ class AlgaeBaseApi(BaseMarineAPI):
             DataFrame with AlgaeBase search results
         """
 
+        def _fetch(name):
+            # Try different possible AlgaeBase API endpoints
+            # AlgaeBase may not have a public API, so this will likely fail
+            try:
+                params = {"q": name, "limit": 10}
+                response = self._make_request("search", params=params)
+                data = self._handle_response(response)
+                if isinstance(data, list):
+                    return data
+                elif isinstance(data, dict) and "results" in data:
+                    return data["results"]
+            except APIResponseError as e:
+                # AlgaeBase returned invalid response
+                self.logger.debug(f"AlgaeBase invalid response for {name}: {e}")
+            except (APIConnectionError, APIRequestError) as e:
+                # Network/connection issues with AlgaeBase
+                self.logger.debug(f"AlgaeBase connection error for {name}: {e}")
+            return []
+
         def _api_call():
             results = []
-            for name in scientific_names:
-                # Try different possible AlgaeBase API endpoints
-                # AlgaeBase may not have a public API, so this will likely fail
-                try:
-                    params = {"q": name, "limit": 10}
-                    response = self._make_request("search", params=params)
-                    data = self._handle_response(response)
-                    if isinstance(data, list):
-                        results.extend(data)
-                    elif isinstance(data, dict) and "results" in data:
-                        results.extend(data["results"])
-                except APIResponseError as e:
-                    # AlgaeBase returned invalid response
-                    self.logger.debug(f"AlgaeBase invalid response for {name}: {e}")
-                except (APIConnectionError, APIRequestError) as e:
-                    # Network/connection issues with AlgaeBase
-                    self.logger.debug(f"AlgaeBase connection error for {name}: {e}")
+            for data in self._map_concurrent(_fetch, scientific_names):
+                results.extend(data)
 
             # If no results from API, raise exception to trigger fallback
             if not results:
@@ -77,23 +81,26 @@ class AlgaeBaseApi(BaseMarineAPI):
             DataFrame with genus information
         """
 
+        def _fetch(name):
+            try:
+                params = {"genus": name}
+                response = self._make_request("genus", params=params)
+                return self._handle_response(response)
+            except APIResponseError as e:
+                # AlgaeBase returned invalid response
+                self.logger.debug(f"AlgaeBase invalid response for genus {name}: {e}")
+            except (APIConnectionError, APIRequestError) as e:
+                # Network/connection issues with AlgaeBase
+                self.logger.debug(f"AlgaeBase connection error for genus {name}: {e}")
+            return None
+
         def _api_call():
             results = []
-            for name in scientific_names:
-                try:
-                    params = {"genus": name}
-                    response = self._make_request("genus", params=params)
-                    data = self._handle_response(response)
-                    if isinstance(data, list):
-                        results.extend(data)
-                    elif isinstance(data, dict):
-                        results.append(data)
-                except APIResponseError as e:
-                    # AlgaeBase returned invalid response
-                    self.logger.debug(f"AlgaeBase invalid response for genus {name}: {e}")
-                except (APIConnectionError, APIRequestError) as e:
-                    # Network/connection issues with AlgaeBase
-                    self.logger.debug(f"AlgaeBase connection error for genus {name}: {e}")
+            for data in self._map_concurrent(_fetch, scientific_names):
+                if isinstance(data, list):
+                    results.extend(data)
+                elif isinstance(data, dict):
+                    results.append(data)
 
             # If no results from API, raise exception to trigger fallback
             if not results:
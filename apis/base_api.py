@@ -5,11 +5,20 @@ Base API class for marine database integrations.
 import logging
 import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional
 
 import pandas as pd
 import requests
 
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:
+    orjson = None
+    _HAS_ORJSON = False
+
 from .exceptions import (
     APIConnectionError,
     APIRequestError,
@@ -27,8 +36,69 @@ DEFAULT_RETRY_BACKOFF_FACTOR = 0.3
 DEFAULT_RETRY_STATUS_FORCELIST = [429, 500, 502, 503, 504]
 DEFAULT_ALLOWED_METHODS = ["HEAD", "GET", "OPTIONS", "POST"]
 MAX_429_RETRIES = 3
+MAX_CONCURRENT_REQUESTS = 10  # per-taxon lookups issued in parallel
 CHUNK_SIZE_BYTES = 8192  # 8KB chunks for downloads
 
+logger = logging.getLogger(__name__)
+
+
+def create_session(
+    pool_maxsize: int = MAX_CONCURRENT_REQUESTS,
+    session: Optional[requests.Session] = None,
+    retry_total: int = DEFAULT_RETRY_TOTAL,
+    backoff_factor: float = DEFAULT_RETRY_BACKOFF_FACTOR,
+) -> requests.Session:
+    """
+    Create a keep-alive session with retries for transient errors.
+
+    The connection pool holds ``pool_maxsize`` connections per host, so that
+    many concurrent requests reuse open connections instead of each opening
+    (and TLS-handshaking) a new one that is discarded afterwards.
+
+    Args:
+        pool_maxsize: Connections kept open per host; match the number of
+            threads issuing requests through the session
+        session: Existing session to configure instead of a new one
+            (e.g. a requests_cache.CachedSession)
+        retry_total: Retries for connection errors and retryable status codes
+        backoff_factor: Exponential backoff factor between retries; a
+            Retry-After header from the server takes precedence
+
+    Returns:
+        Configured requests session
+    """
+    if session is None:
+        session = requests.Session()
+    # Configure a retry strategy for transient errors
+    try:
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        retry_strategy = Retry(
+            total=retry_total,
+            status_forcelist=DEFAULT_RETRY_STATUS_FORCELIST,
+            backoff_factor=backoff_factor,
+            allowed_methods=DEFAULT_ALLOWED_METHODS,
+            respect_retry_after_header=True,
+        )
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=pool_maxsize,
+            pool_maxsize=pool_maxsize,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+    except ImportError as e:
+        # If urllib3 is not available, continue without retries
+        logger.debug("Retry libraries not available: %s", e)
+    except (ValueError, TypeError) as e:
+        # If configuration values are invalid, continue without retries
+        logger.debug("Retry configuration invalid: %s", e)
+    except Exception as e:
+        # Unexpected error in retry configuration
+        logger.warning("Unexpected error configuring retries: %s", e)
+    return session
+
 
 class BaseMarineAPI(ABC):
     """
@@ -44,34 +114,7 @@ class BaseMarineAPI(ABC):
             session: Optional requests session to use
         """
         self.base_url = base_url
-        if session:
-            self.session = session
-        else:
-            self.session = requests.Session()
-            # Configure a retry strategy for transient errors
-            try:
-                from requests.adapters import HTTPAdapter
-                from urllib3.util.retry import Retry
-
-                retry_strategy = Retry(
-                    total=DEFAULT_RETRY_TOTAL,
-                    status_forcelist=DEFAULT_RETRY_STATUS_FORCELIST,
-                    backoff_factor=DEFAULT_RETRY_BACKOFF_FACTOR,
-                    allowed_methods=DEFAULT_ALLOWED_METHODS,
-                    respect_retry_after_header=True,
-                )
-                adapter = HTTPAdapter(max_retries=retry_strategy)
-                self.session.mount("https://", adapter)
-                self.session.mount("http://", adapter)
-            except ImportError as e:
-                # If urllib3 is not available, continue without retries
-                self.logger.debug("Retry libraries not available: %s", e)
-            except (ValueError, TypeError) as e:
-                # If configuration values are invalid, continue without retries
-                self.logger.debug("Retry configuration invalid: %s", e)
-            except Exception as e:
-                # Unexpected error in retry configuration
-                self.logger.warning("Unexpected error configuring retries: %s", e)
+        self.session = session if session else create_session()
         self.timeout = DEFAULT_TIMEOUT
         self.logger = logging.getLogger(self.__class__.__name__)
 
@@ -154,6 +197,34 @@ class BaseMarineAPI(ABC):
                 # Network-level error; expose to caller for fallback handling
                 raise APIRequestError(f"API request failed: {e}") from e
 
+    def _map_concurrent(
+        self,
+        func: Callable[[Any], Any],
+        items: Iterable[Any],
+        max_workers: int = MAX_CONCURRENT_REQUESTS,
+    ) -> List[Any]:
+        """
+        Apply a request function to each item concurrently.
+
+        Per-taxon lookups are I/O bound, so running them on a small thread
+        pool turns N sequential round trips into roughly N / max_workers.
+        Results are returned in input order and the first exception raised
+        by ``func`` propagates, matching a sequential loop.
+
+        Args:
+            func: Function performing the request for a single item
+            items: Items (e.g. scientific names) to look up
+            max_workers: Upper bound on simultaneous requests
+
+        Returns:
+            List of results in the same order as ``items``
+        """
+        items = list(items)
+        if len(items) <= 1:
+            return [func(item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+            return list(executor.map(func, items))
+
     def _safe_dataframe(self, data: Any) -> pd.DataFrame:
         """
         Safely create a DataFrame from API response data.
@@ -178,17 +249,33 @@ class BaseMarineAPI(ABC):
 
         if "application/json" in content_type:
             try:
-                return response.json()
+                return self._parse_json(response)
             except ValueError as e:
                 raise APIResponseError(f"Invalid JSON response: {e}") from e
         else:
             text = response.text
             # Try to parse as JSON anyway
             try:
-                return response.json()
+                return self._parse_json(response)
             except ValueError:
                 raise APIResponseError(f"Non-JSON response: {text[:100]}...")
 
+    @staticmethod
+    def _parse_json(response):
+        """
+        Decode a JSON response body, with orjson when it is installed.
+
+        orjson parses the raw bytes several times faster than the standard
+        library; bodies it rejects (e.g. bare NaN literals, which json
+        accepts) are handed to response.json().
+        """
+        if _HAS_ORJSON:
+            try:
+                return orjson.loads(response.content)
+            except orjson.JSONDecodeError:
+                pass
+        return response.json()
+
     def _safe_api_call(self, api_func, fallback_func=None, *args, **kwargs):
         """
         Safely call an API function with fallback to mock data.
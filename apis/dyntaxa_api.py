@@ -2,6 +2,7 @@
 Dyntaxa (SLU Artdatabanken) API implementation.
 """
 
+import functools
 from typing import Any, List, Optional
 
 import pandas as pd
@@ -9,6 +10,26 @@ import pandas as pd
 from .base_api import BaseMarineAPI
 
 
+@functools.lru_cache(maxsize=1)
+def _mock_dyntaxa_taxa() -> pd.DataFrame:
+    """Return mock Dyntaxa taxa data for testing."""
+    return pd.DataFrame(
+        [
+            {
+                "scientificName": "Baltic herring",
+                "taxonId": 1001,
+                "rank": "species",
+            },
+            {"scientificName": "Atlantic cod", "taxonId": 1002, "rank": "species"},
+            {
+                "scientificName": "European perch",
+                "taxonId": 1003,
+                "rank": "species",
+            },
+        ]
+    )
+
+
 class DyntaxaApi(BaseMarineAPI):
     """
     API client for Dyntaxa (SLU Artdatabanken) taxonomic database.
@@ -53,12 +74,14 @@ class DyntaxaApi(BaseMarineAPI):
             DataFrame with matching results
         """
 
+        def _fetch(name):
+            params = {"searchString": name, "includeSynonyms": "true"}
+            response = self._make_request("taxa", params=params)
+            return self._handle_response(response)
+
         def _api_call():
             results = []
-            for name in scientific_names:
-                params = {"searchString": name, "includeSynonyms": "true"}
-                response = self._make_request("taxa", params=params)
-                data = self._handle_response(response)
+            for data in self._map_concurrent(_fetch, scientific_names):
                 if data:
                     results.extend(data)
             return pd.DataFrame(results)
@@ -138,18 +161,4 @@ class DyntaxaApi(BaseMarineAPI):
     # Mock data methods
     def _get_mock_dyntaxa_taxa(self) -> pd.DataFrame:
         """Return mock Dyntaxa taxa data for testing."""
-        return pd.DataFrame(
-            [
-                {
-                    "scientificName": "Baltic herring",
-                    "taxonId": 1001,
-                    "rank": "species",
-                },
-                {"scientificName": "Atlantic cod", "taxonId": 1002, "rank": "species"},
-                {
-                    "scientificName": "European perch",
-                    "taxonId": 1003,
-                    "rank": "species",
-                },
-            ]
-        )
+        return _mock_dyntaxa_taxa().copy(deep=False)
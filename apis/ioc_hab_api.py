@@ -2,6 +2,7 @@
 IOC-UNESCO HAB (Harmful Algae) API implementation.
 """
 
+import functools
 from typing import Any, List, Optional
 
 import pandas as pd
@@ -9,6 +10,26 @@ import pandas as pd
 from .base_api import BaseMarineAPI
 
 
+@functools.lru_cache(maxsize=1)
+def _mock_hab_list() -> pd.DataFrame:
+    """Return mock IOC-UNESCO HAB list for testing."""
+    return pd.DataFrame(
+        [
+            {
+                "species": "Alexandrium catenella",
+                "toxicity": "High",
+                "region": "Global",
+            },
+            {"species": "Dinophysis acuta", "toxicity": "High", "region": "Global"},
+            {
+                "species": "Pseudo-nitzschia multiseries",
+                "toxicity": "Medium",
+                "region": "Global",
+            },
+        ]
+    )
+
+
 class IocHabApi(BaseMarineAPI):
     """
     API client for IOC-UNESCO HAB (Harmful Algae) database.
@@ -53,18 +74,4 @@ class IocHabApi(BaseMarineAPI):
     # Mock data methods
     def _get_mock_hab_list(self) -> pd.DataFrame:
         """Return mock IOC-UNESCO HAB list for testing."""
-        return pd.DataFrame(
-            [
-                {
-                    "species": "Alexandrium catenella",
-                    "toxicity": "High",
-                    "region": "Global",
-                },
-                {"species": "Dinophysis acuta", "toxicity": "High", "region": "Global"},
-                {
-                    "species": "Pseudo-nitzschia multiseries",
-                    "toxicity": "Medium",
-                    "region": "Global",
-                },
-            ]
-        )
+        return _mock_hab_list().copy(deep=False)
@@ -2,6 +2,7 @@
 IOC-UNESCO Toxins API implementation.
 """
 
+import functools
 from typing import Any, List, Optional
 
 import pandas as pd
@@ -9,6 +10,26 @@ import pandas as pd
 from .base_api import BaseMarineAPI
 
 
+@functools.lru_cache(maxsize=1)
+def _mock_toxin_list() -> pd.DataFrame:
+    """Return mock IOC-UNESCO toxin list for testing."""
+    return pd.DataFrame(
+        [
+            {
+                "toxin": "Saxitoxin",
+                "type": "Neurotoxin",
+                "source": "Dinoflagellates",
+            },
+            {
+                "toxin": "Okadaic acid",
+                "type": "Diarrhetic",
+                "source": "Dinoflagellates",
+            },
+            {"toxin": "Domoic acid", "type": "Neurotoxin", "source": "Diatoms"},
+        ]
+    )
+
+
 class IocToxinsApi(BaseMarineAPI):
     """
     API client for IOC-UNESCO Toxins database.
@@ -53,18 +74,4 @@ class IocToxinsApi(BaseMarineAPI):
     # Mock data methods
     def _get_mock_toxin_list(self) -> pd.DataFrame:
         """Return mock IOC-UNESCO toxin list for testing."""
-        return pd.DataFrame(
-            [
-                {
-                    "toxin": "Saxitoxin",
-                    "type": "Neurotoxin",
-                    "source": "Dinoflagellates",
-                },
-                {
-                    "toxin": "Okadaic acid",
-                    "type": "Diarrhetic",
-                    "source": "Dinoflagellates",
-                },
-                {"toxin": "Domoic acid", "type": "Neurotoxin", "source": "Diatoms"},
-            ]
-        )
+        return _mock_toxin_list().copy(deep=False)
@@ -2,12 +2,41 @@
 Nordic Microalgae API implementation.
 """
 
+import functools
+import time
 from typing import Any, Dict, List, Optional
 
+import numpy as np
 import pandas as pd
 
 from .base_api import BaseMarineAPI
 
+HARMFUL_TAXA_TTL = 3600  # seconds to reuse the filtered harmful-taxa list
+
+
+@functools.lru_cache(maxsize=1)
+def _mock_nordic_microalgae_taxa() -> pd.DataFrame:
+    """Return mock Nordic Microalgae taxa for testing."""
+    return pd.DataFrame(
+        [
+            {
+                "name": "Aphanizomenon flos-aquae",
+                "harmfulness": "Toxic",
+                "region": "Nordic",
+            },
+            {
+                "name": "Microcystis aeruginosa",
+                "harmfulness": "Toxic",
+                "region": "Nordic",
+            },
+            {
+                "name": "Nodularia spumigena",
+                "harmfulness": "Toxic",
+                "region": "Nordic",
+            },
+        ]
+    )
+
 
 class NordicMicroalgaeApi(BaseMarineAPI):
     """
@@ -20,6 +49,8 @@ class NordicMicroalgaeApi(BaseMarineAPI):
         session: Optional[Any] = None,
     ):
         super().__init__(base_url, session)
+        self._harmful_taxa: Optional[pd.DataFrame] = None
+        self._harmful_taxa_time = 0.0
 
     def get_nordic_microalgae_taxa(
         self, search_params: Optional[Dict[str, Any]] = None
@@ -42,6 +73,41 @@ class NordicMicroalgaeApi(BaseMarineAPI):
 
         return self._safe_api_call(_api_call, self._get_mock_nordic_microalgae_taxa)
 
+    def get_harmful_taxa(self) -> pd.DataFrame:
+        """
+        Retrieve taxa whose harmfulness is flagged as toxic.
+
+        The full taxa list is fetched and filtered once, then reused for
+        HARMFUL_TAXA_TTL seconds. Fallback (mock) results are not cached.
+
+        Returns:
+            DataFrame with harmful taxa (empty if no harmfulness data)
+        """
+        now = time.time()
+        if (
+            self._harmful_taxa is not None
+            and now - self._harmful_taxa_time < HARMFUL_TAXA_TTL
+        ):
+            return self._harmful_taxa
+
+        all_taxa = self.get_nordic_microalgae_taxa()
+        if all_taxa.empty or "harmfulness" not in all_taxa.columns:
+            return pd.DataFrame()
+
+        # Harmfulness has only a handful of distinct levels: test each level
+        # once, then broadcast through the factorized codes. Nulls get code -1,
+        # which indexes the trailing False.
+        codes, levels = pd.factorize(all_taxa["harmfulness"])
+        level_is_toxic = np.array(
+            [isinstance(level, str) and "toxic" in level.casefold() for level in levels]
+            + [False]
+        )
+        harmful = all_taxa.loc[level_is_toxic[codes]]
+        if not all_taxa.attrs.get("api_fallback"):
+            self._harmful_taxa = harmful
+            self._harmful_taxa_time = now
+        return harmful
+
     def get_nua_harmfulness(self, taxon_ids: List[int]) -> pd.DataFrame:
         """
         Retrieve harmfulness for taxa from Nordic Microalgae.
@@ -53,14 +119,14 @@ class NordicMicroalgaeApi(BaseMarineAPI):
             DataFrame with harmfulness information
         """
 
+        def _fetch(taxon_id):
+            response = self._make_request(f"taxa/{taxon_id}/harmfulness")
+            data = self._handle_response(response)
+            data["taxon_id"] = taxon_id
+            return data
+
         def _api_call():
-            results = []
-            for taxon_id in taxon_ids:
-                response = self._make_request(f"taxa/{taxon_id}/harmfulness")
-                data = self._handle_response(response)
-                data["taxon_id"] = taxon_id
-                results.append(data)
-            return pd.DataFrame(results)
+            return pd.DataFrame(self._map_concurrent(_fetch, taxon_ids))
 
         return self._safe_api_call(_api_call)
 
@@ -131,22 +197,4 @@ class NordicMicroalgaeApi(BaseMarineAPI):
     # Mock data methods
     def _get_mock_nordic_microalgae_taxa(self) -> pd.DataFrame:
         """Return mock Nordic Microalgae taxa for testing."""
-        return pd.DataFrame(
-            [
-                {
-                    "name": "Aphanizomenon flos-aquae",
-                    "harmfulness": "Toxic",
-                    "region": "Nordic",
-                },
-                {
-                    "name": "Microcystis aeruginosa",
-                    "harmfulness": "Toxic",
-                    "region": "Nordic",
-                },
-                {
-                    "name": "Nodularia spumigena",
-                    "harmfulness": "Toxic",
-                    "region": "Nordic",
-                },
-            ]
-        )
+        return _mock_nordic_microalgae_taxa().copy(deep=False)
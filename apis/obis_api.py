@@ -2,6 +2,7 @@
 OBIS (Ocean Biodiversity Information System) API implementation.
 """
 
+import functools
 from typing import Any, Dict, List, Optional
 
 import pandas as pd
@@ -9,6 +10,33 @@ import pandas as pd
 from .base_api import BaseMarineAPI
 
 
+@functools.lru_cache(maxsize=1)
+def _mock_obis_records() -> pd.DataFrame:
+    """Return mock OBIS records for testing."""
+    return pd.DataFrame(
+        [
+            {
+                "species": "Clupea harengus",
+                "longitude": 11.3,
+                "latitude": 58.4,
+                "depth": 10,
+            },
+            {
+                "species": "Gadus morhua",
+                "longitude": 11.2,
+                "latitude": 58.3,
+                "depth": 15,
+            },
+            {
+                "species": "Perca fluviatilis",
+                "longitude": 11.1,
+                "latitude": 58.2,
+                "depth": 5,
+            },
+        ]
+    )
+
+
 class ObisApi(BaseMarineAPI):
     """
     API client for OBIS (Ocean Biodiversity Information System).
@@ -30,12 +58,14 @@ class ObisApi(BaseMarineAPI):
             DataFrame with OBIS occurrence records
         """
 
+        def _fetch(name):
+            params = {"scientificname": name}
+            response = self._make_request("occurrence", params=params)
+            return self._handle_response(response)
+
         def _api_call():
             results = []
-            for name in scientific_names:
-                params = {"scientificname": name}
-                response = self._make_request("occurrence", params=params)
-                data = self._handle_response(response)
+            for data in self._map_concurrent(_fetch, scientific_names):
                 results.extend(data.get("results", []))
             return pd.DataFrame(results)
 
@@ -90,25 +120,4 @@ class ObisApi(BaseMarineAPI):
     # Mock data methods
     def _get_mock_obis_records(self) -> pd.DataFrame:
         """Return mock OBIS records for testing."""
-        return pd.DataFrame(
-            [
-                {
-                    "species": "Clupea harengus",
-                    "longitude": 11.3,
-                    "latitude": 58.4,
-                    "depth": 10,
-                },
-                {
-                    "species": "Gadus morhua",
-                    "longitude": 11.2,
-                    "latitude": 58.3,
-                    "depth": 15,
-                },
-                {
-                    "species": "Perca fluviatilis",
-                    "longitude": 11.1,
-                    "latitude": 58.2,
-                    "depth": 5,
-                },
-            ]
-        )
+        return _mock_obis_records().copy(deep=False)
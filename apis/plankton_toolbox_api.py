@@ -2,6 +2,7 @@
 Plankton Toolbox API implementation.
 """
 
+import functools
 from typing import Any, List, Optional
 
 import pandas as pd
@@ -10,6 +11,30 @@ from .base_api import BaseMarineAPI
 from .exceptions import APIResponseError
 
 
+@functools.lru_cache(maxsize=1)
+def _mock_plankton_toolbox_taxa() -> pd.DataFrame:
+    """Return mock Plankton Toolbox taxa for testing."""
+    return pd.DataFrame(
+        [
+            {
+                "name": "Skeletonema costatum",
+                "biovolume": 1500,
+                "category": "Diatom",
+            },
+            {
+                "name": "Thalassiosira rotula",
+                "biovolume": 1200,
+                "category": "Diatom",
+            },
+            {
+                "name": "Chaetoceros curvisetus",
+                "biovolume": 1800,
+                "category": "Diatom",
+            },
+        ]
+    )
+
+
 class PlanktonToolboxApi(BaseMarineAPI):
     """
     API client for Plankton Toolbox.
@@ -120,22 +145,4 @@ scientific_names: Optional list of scientific names (ignored)
     # Mock data methods
     def _get_mock_plankton_toolbox_taxa(self) -> pd.DataFrame:
         """Return mock Plankton Toolbox taxa for testing."""
-        return pd.DataFrame(
-            [
-                {
-                    "name": "Skeletonema costatum",
-                    "biovolume": 1500,
-                    "category": "Diatom",
-                },
-                {
-                    "name": "Thalassiosira rotula",
-                    "biovolume": 1200,
-                    "category": "Diatom",
-                },
-                {
-                    "name": "Chaetoceros curvisetus",
-                    "biovolume": 1800,
-                    "category": "Diatom",
-                },
-            ]
-        )
+        return _mock_plankton_toolbox_taxa().copy(deep=False)
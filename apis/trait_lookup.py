@@ -9,17 +9,90 @@ Both datasets use AphiaID (WoRMS taxonomic identifier) as the primary key.
 """
 
 import functools
+import hashlib
 import logging
 import os
+import pickle
+import tempfile
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 
+import numpy as np
 import pandas as pd
 
 from .exceptions import DataValidationError
 
+try:
+    import zstandard as zstd
+
+    _HAS_ZSTD = True
+except ImportError:
+    zstd = None
+    _HAS_ZSTD = False
+
 logger = logging.getLogger(__name__)
 
+# Parsed workbooks are pickled here so later runs skip the slow Excel parse.
+# Bump TRAIT_CACHE_VERSION when the cached frame layout changes.
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "gbif-api-client"
+TRAIT_CACHE_VERSION = 1
+
+
+def _read_excel_cached(path: str, cache_dir: Optional[Path]) -> pd.DataFrame:
+    """
+    Read an Excel file, reusing a pickled copy while the file is unchanged.
+
+    The pickle is keyed by the file's absolute path and validated against its
+    modification time and size. It is zstd-compressed when ``zstandard`` is
+    installed. Cache read/write failures fall back to parsing the workbook.
+    """
+    if cache_dir is None:
+        return pd.read_excel(path)
+
+    source = Path(path).resolve()
+    stat = source.stat()
+    signature = (stat.st_mtime_ns, stat.st_size, TRAIT_CACHE_VERSION)
+    digest = hashlib.sha1(str(source).encode("utf-8")).hexdigest()[:12]
+    suffix = ".pkl.zst" if _HAS_ZSTD else ".pkl"
+    cache_file = Path(cache_dir) / f"{source.stem}-{digest}{suffix}"
+
+    try:
+        with open(cache_file, "rb") as fh:
+            if _HAS_ZSTD:
+                with zstd.ZstdDecompressor().stream_reader(fh) as reader:
+                    cached_signature, df = pickle.load(reader)
+            else:
+                cached_signature, df = pickle.load(fh)
+        if cached_signature == signature:
+            logger.debug(f"Loaded cached copy of {path} from {cache_file}")
+            return df
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.debug(f"Ignoring unreadable trait cache {cache_file}: {e}")
+
+    df = pd.read_excel(path)
+
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temp file and rename so readers never see a partial pickle
+        fd, tmp_name = tempfile.mkstemp(dir=cache_file.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as fh:
+            if _HAS_ZSTD:
+                with zstd.ZstdCompressor(level=3).stream_writer(
+                    fh, closefd=False
+                ) as writer:
+                    pickle.dump(
+                        (signature, df), writer, protocol=pickle.HIGHEST_PROTOCOL
+                    )
+            else:
+                pickle.dump((signature, df), fh, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_name, cache_file)
+    except Exception as e:
+        logger.debug(f"Could not write trait cache {cache_file}: {e}")
+
+    return df
+
 
 class TraitLookup:
     """
@@ -33,7 +106,9 @@ class TraitLookup:
     def __init__(
         self,
         bvol_path: Optional[str] = None,
-        species_enriched_path: Optional[str] = None
+        species_enriched_path: Optional[str] = None,
+        cache_dir: Optional[str] = None,
+        use_cache: bool = True,
     ):
         """
         Initialize trait lookup with paths to data files.
@@ -41,6 +116,9 @@ class TraitLookup:
         Args:
             bvol_path: Path to bvol_nomp_version_2024.xlsx
             species_enriched_path: Path to species_enriched.xlsx
+            cache_dir: Directory for parsed-workbook pickles
+                (default: ~/.cache/gbif-api-client)
+            use_cache: Set False to always parse the Excel files
         """
         # Default paths (assume files are in parent directory of gbif-api-client)
         base_path = Path(__file__).parent.parent.parent
@@ -50,12 +128,41 @@ class TraitLookup:
             base_path / "species_enriched.xlsx"
         )
 
+        self.cache_dir: Optional[Path] = (
+            Path(cache_dir or DEFAULT_CACHE_DIR) if use_cache else None
+        )
+
         # Lazy loading - data loaded on first access
         self._bvol_data: Optional[pd.DataFrame] = None
         self._species_data: Optional[pd.DataFrame] = None
         self._bvol_loaded = False
         self._species_loaded = False
 
+        # AphiaID -> row positions, built when each dataset loads
+        self._bvol_rows_by_aphia: Dict[int, np.ndarray] = {}
+        self._species_rows_by_aphia: Dict[int, np.ndarray] = {}
+
+        # Name search indexes, built on first search
+        self._bvol_name_index: Optional[Tuple[pd.Series, List[Dict[str, Any]]]] = None
+        self._species_name_index: Optional[Tuple[pd.Series, List[Dict[str, Any]]]] = (
+            None
+        )
+
+        # Combined trait results per AphiaID (see get_all_traits)
+        self._all_traits_cache: Dict[int, Dict[str, Any]] = {}
+
+    def reload(self) -> None:
+        """Drop loaded data, indexes and cached results; files are re-read on next access."""
+        self._bvol_data = None
+        self._species_data = None
+        self._bvol_loaded = False
+        self._species_loaded = False
+        self._bvol_rows_by_aphia = {}
+        self._species_rows_by_aphia = {}
+        self._bvol_name_index = None
+        self._species_name_index = None
+        self._all_traits_cache = {}
+
     @property
     def bvol_data(self) -> pd.DataFrame:
         """Lazy load phytoplankton trait data."""
@@ -78,13 +185,14 @@ class TraitLookup:
                 self._bvol_data = pd.DataFrame()
             else:
                 logger.info(f"Loading biovolume data from {self.bvol_path}")
-                df = pd.read_excel(self.bvol_path)
+                df = _read_excel_cached(self.bvol_path, self.cache_dir)
 
                 # Standardize AphiaID column
                 if 'AphiaID' in df.columns:
                     df['AphiaID'] = df['AphiaID'].astype('Int64')
 
                 self._bvol_data = df
+                self._bvol_rows_by_aphia = self._index_by_aphia(df)
                 logger.info(
                     f"Loaded {len(df)} phytoplankton records "
                     f"with {df['AphiaID'].nunique()} unique AphiaIDs"
@@ -105,7 +213,7 @@ class TraitLookup:
                 self._species_data = pd.DataFrame()
             else:
                 logger.info(f"Loading species data from {self.species_enriched_path}")
-                df = pd.read_excel(self.species_enriched_path)
+                df = _read_excel_cached(self.species_enriched_path, self.cache_dir)
 
                 # Standardize AphiaID column (it's lowercase 'aphiaID' in this file)
                 if 'aphiaID' in df.columns:
@@ -114,6 +222,7 @@ class TraitLookup:
                     df['AphiaID'] = df['AphiaID'].astype('Int64')
 
                 self._species_data = df
+                self._species_rows_by_aphia = self._index_by_aphia(df)
                 logger.info(
                     f"Loaded {len(df)} enriched species records "
                     f"with {df['AphiaID'].nunique()} unique AphiaIDs"
@@ -124,6 +233,14 @@ class TraitLookup:
         finally:
             self._species_loaded = True
 
+    @staticmethod
+    def _index_by_aphia(df: pd.DataFrame) -> Dict[int, np.ndarray]:
+        """Map each AphiaID to the positions of its rows in ``df``."""
+        if "AphiaID" not in df.columns:
+            return {}
+        groups = df.groupby("AphiaID", sort=False).indices
+        return {int(aphia_id): positions for aphia_id, positions in groups.items()}
+
     def get_phytoplankton_traits(self, aphia_id: int) -> Optional[Dict[str, Any]]:
         """
         Get phytoplankton morphological traits by AphiaID.
@@ -137,10 +254,10 @@ class TraitLookup:
         if self.bvol_data.empty:
             return None
 
-        matches = self.bvol_data[self.bvol_data['AphiaID'] == aphia_id]
-
-        if matches.empty:
+        positions = self._bvol_rows_by_aphia.get(aphia_id)
+        if positions is None:
             return None
+        matches = self.bvol_data.iloc[positions]
 
         # If multiple size classes, return all as a list
         if len(matches) > 1:
@@ -249,12 +366,10 @@ class TraitLookup:
         if self.species_data.empty:
             return None
 
-        matches = self.species_data[self.species_data['AphiaID'] == aphia_id]
-
-        if matches.empty:
+        positions = self._species_rows_by_aphia.get(aphia_id)
+        if positions is None:
             return None
-
-        row = matches.iloc[0]
+        row = self.species_data.iloc[positions[0]]
 
         # Helper function to safely get values
         def safe_get(col_name):
@@ -318,8 +433,13 @@ class TraitLookup:
             aphia_id: WoRMS AphiaID
 
         Returns:
-            Combined dictionary with all available trait data
+            Combined dictionary with all available trait data. Results are
+            cached per AphiaID until reload(), so treat them as read-only.
         """
+        cached = self._all_traits_cache.get(aphia_id)
+        if cached is not None:
+            return cached
+
         result = {
             'aphia_id': aphia_id,
             'phytoplankton_traits': None,
@@ -342,8 +462,51 @@ class TraitLookup:
         if not result['data_sources']:
             logger.info(f"No trait data found for AphiaID {aphia_id}")
 
+        self._all_traits_cache[aphia_id] = result
         return result
 
+    @staticmethod
+    def _build_name_index(
+        df: pd.DataFrame, name_col: str, extra_key: str, extra_col: str, source: str
+    ) -> Tuple[pd.Series, List[Dict[str, Any]]]:
+        """
+        Build a name search index for one dataset.
+
+        Returns the lowercased names of rows with an AphiaID, and the search
+        result record for each of those rows in the same order.
+        """
+        if df.empty or name_col not in df.columns:
+            return pd.Series([], dtype="string"), []
+
+        rows = df[df["AphiaID"].notna()]
+        names = rows[name_col].astype("string").str.lower().reset_index(drop=True)
+        extras = (
+            rows[extra_col].tolist()
+            if extra_col in rows.columns
+            else [None] * len(rows)
+        )
+        records = [
+            {
+                "aphia_id": int(aphia_id),
+                "species": name,
+                extra_key: extra,
+                "source": source,
+            }
+            for aphia_id, name, extra in zip(
+                rows["AphiaID"], rows[name_col], extras, strict=True
+            )
+        ]
+        return names, records
+
+    @staticmethod
+    def _search_name_index(
+        index: Tuple[pd.Series, List[Dict[str, Any]]], query: str
+    ) -> List[Dict[str, Any]]:
+        """Return copies of the index records whose name contains ``query``."""
+        names, records = index
+        mask = names.str.contains(query, regex=False, na=False).to_numpy(dtype=bool)
+        return [dict(records[i]) for i in np.flatnonzero(mask)]
+
     def search_by_species_name(self, species_name: str) -> List[Dict[str, Any]]:
         """
         Search for species by name across both datasets.
@@ -354,42 +517,25 @@ class TraitLookup:
         Returns:
             List of matching species with their AphiaIDs
         """
-        results = []
         species_name_lower = species_name.lower()
 
-        # Search in bvol data
-        if not self.bvol_data.empty and 'Species' in self.bvol_data.columns:
-            matches = self.bvol_data[
-                self.bvol_data['Species'].str.lower().str.contains(
-                    species_name_lower, na=False
-                )
-            ]
-            for _, row in matches.iterrows():
-                if pd.notna(row['AphiaID']):
-                    results.append({
-                        'aphia_id': int(row['AphiaID']),
-                        'species': row['Species'],
-                        'genus': row.get('Genus'),
-                        'source': 'bvol_nomp_version_2024'
-                    })
-
-        # Search in species enriched data
-        if not self.species_data.empty and 'taxonomyName' in self.species_data.columns:
-            matches = self.species_data[
-                self.species_data['taxonomyName'].str.lower().str.contains(
-                    species_name_lower, na=False
-                )
-            ]
-            for _, row in matches.iterrows():
-                if pd.notna(row['AphiaID']):
-                    results.append({
-                        'aphia_id': int(row['AphiaID']),
-                        'species': row['taxonomyName'],
-                        'common_name': row.get('synonymCommonName'),
-                        'source': 'species_enriched'
-                    })
-
-        return results
+        # Lowercased names and result records are built once per dataset
+        if self._bvol_name_index is None:
+            self._bvol_name_index = self._build_name_index(
+                self.bvol_data, "Species", "genus", "Genus", "bvol_nomp_version_2024"
+            )
+        if self._species_name_index is None:
+            self._species_name_index = self._build_name_index(
+                self.species_data,
+                "taxonomyName",
+                "common_name",
+                "synonymCommonName",
+                "species_enriched",
+            )
+
+        return self._search_name_index(
+            self._bvol_name_index, species_name_lower
+        ) + self._search_name_index(self._species_name_index, species_name_lower)
 
     def get_statistics(self) -> Dict[str, Any]:
         """Get statistics about the trait databases."""
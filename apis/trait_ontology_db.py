@@ -7,6 +7,7 @@ Supports complex queries, trait relationships, and ontological structure.
 
 import logging
 import sqlite3
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
 
@@ -14,6 +15,24 @@ import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+# Insert statements shared by the single-row and batch methods. sqlite3 caches compiled
+# statements per connection by SQL text, so reusing the same strings avoids re-parsing.
+_INSERT_TRAIT_VALUE_SQL = """
+    INSERT INTO trait_values
+    (species_id, trait_id, value_numeric, value_text, value_categorical, value_boolean,
+     size_class_id, confidence, data_source, notes)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_INSERT_SIZE_CLASS_SQL = """
+    INSERT INTO size_classes
+    (species_id, size_class_no, size_range, size_range_min, size_range_max, description)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+_INSERT_GEOGRAPHIC_DISTRIBUTION_SQL = """
+    INSERT INTO geographic_distribution (species_id, area_type, area_value)
+    VALUES (?, ?, ?)
+"""
+
 
 class TraitOntologyDB:
     """
@@ -51,8 +70,19 @@ class TraitOntologyDB:
     def _get_connection(self) -> sqlite3.Connection:
         """Get or create database connection."""
         if self.conn is None:
-            self.conn = sqlite3.connect(self.db_path)
+            self.conn = sqlite3.connect(self.db_path, cached_statements=256)
             self.conn.row_factory = sqlite3.Row  # Enable column access by name
+            # Tune for the read-heavy lookup workload: WAL lets readers run alongside
+            # a writer, and a 64 MB page cache plus memory-mapped I/O keep hot pages
+            # out of the read() path.
+            self.conn.executescript("""
+                PRAGMA journal_mode=WAL;
+                PRAGMA synchronous=NORMAL;
+                PRAGMA temp_store=MEMORY;
+                PRAGMA mmap_size=1073741824;
+                PRAGMA cache_size=-65536;
+                PRAGMA foreign_keys=ON;
+            """)
         return self.conn
 
     def _init_database(self) -> None:
@@ -135,6 +165,10 @@ class TraitOntologyDB:
             CREATE INDEX IF NOT EXISTS idx_trait_values_trait
             ON trait_values(trait_id)
         """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_trait_values_species_size
+            ON trait_values(species_id, size_class_id)
+        """)
 
         # Create size classes table
         cursor.execute("""
@@ -149,6 +183,10 @@ class TraitOntologyDB:
                 FOREIGN KEY (species_id) REFERENCES species(species_id)
             )
         """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_size_classes_species_no
+            ON size_classes(species_id, size_class_no)
+        """)
 
         # Create geographic distribution table
         cursor.execute("""
@@ -160,6 +198,10 @@ class TraitOntologyDB:
                 FOREIGN KEY (species_id) REFERENCES species(species_id)
             )
         """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_geographic_distribution_area
+            ON geographic_distribution(area_type)
+        """)
 
         # Create taxonomic hierarchy table
         cursor.execute("""
@@ -195,6 +237,42 @@ class TraitOntologyDB:
         conn.commit()
         logger.info(f"Database schema initialized at {self.db_path}")
 
+    @contextmanager
+    def bulk_import(self):
+        """
+        Relax SQLite durability settings for the duration of a bulk load.
+
+        Switches to WAL with synchronous=NORMAL, a 256 MB page cache and in-memory
+        temp storage, and restores the previous settings on exit.
+        Table statistics are refreshed with ANALYZE once the load completes so the
+        query planner picks up the composite indexes.
+
+        Example:
+            with db.bulk_import():
+                import_phytoplankton_data(db, path)
+        """
+        conn = self._get_connection()
+        pragmas = ("journal_mode", "synchronous", "cache_size", "temp_store")
+        previous = {
+            name: conn.execute(f"PRAGMA {name}").fetchone()[0] for name in pragmas
+        }
+
+        conn.commit()
+        conn.executescript("""
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            PRAGMA cache_size=-262144;
+            PRAGMA temp_store=MEMORY;
+        """)
+        try:
+            yield self
+        finally:
+            conn.commit()
+            conn.execute("ANALYZE")
+            conn.executescript(
+                "".join(f"PRAGMA {name}={value};" for name, value in previous.items())
+            )
+
     def initialize_trait_categories(self) -> None:
         """Initialize standard trait categories."""
         conn = self._get_connection()
@@ -380,34 +458,140 @@ class TraitOntologyDB:
 
         trait_id, data_type = trait_row
 
-        # Determine which column to use based on data type
-        value_numeric = None
-        value_text = None
-        value_categorical = None
-        value_boolean = None
+        typed = self._typed_value(data_type, value)
+        if typed is None:
+            return None  # Don't insert NULL values
+        value_numeric, value_text, value_categorical, value_boolean = typed
+
+        cursor.execute(
+            _INSERT_TRAIT_VALUE_SQL,
+            (
+                species_id,
+                trait_id,
+                value_numeric,
+                value_text,
+                value_categorical,
+                value_boolean,
+                size_class_id,
+                confidence,
+                data_source,
+                notes,
+            ),
+        )
+
+        conn.commit()
+        return cursor.lastrowid
 
+    @staticmethod
+    def _typed_value(data_type: str, value: Any) -> Optional[Tuple[Any, Any, Any, Any]]:
+        """
+        Split a trait value into its (numeric, text, categorical, boolean) columns.
+
+        Returns None for missing values, which are not stored.
+        """
         if value is None or (isinstance(value, float) and pd.isna(value)):
-            return None  # Don't insert NULL values
+            return None
 
-        if data_type == 'numeric':
-            value_numeric = float(value)
-        elif data_type == 'boolean':
-            value_boolean = int(bool(value))
-        elif data_type == 'categorical':
-            value_categorical = str(value)
-        else:  # text
-            value_text = str(value)
+        if data_type == "numeric":
+            return float(value), None, None, None
+        if data_type == "boolean":
+            return None, None, None, int(bool(value))
+        if data_type == "categorical":
+            return None, None, str(value), None
+        return None, str(value), None, None  # text
 
-        cursor.execute("""
-            INSERT INTO trait_values
-            (species_id, trait_id, value_numeric, value_text, value_categorical, value_boolean,
-             size_class_id, confidence, data_source, notes)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (species_id, trait_id, value_numeric, value_text, value_categorical, value_boolean,
-              size_class_id, confidence, data_source, notes))
+    def add_species_batch(self, records: List[Tuple]) -> Dict[int, int]:
+        """
+        Add many species in one statement.
+
+        Args:
+            records: (aphia_id, scientific_name, genus, common_name, author, data_source) tuples.
+                Species whose AphiaID is already present are left unchanged.
+
+        Returns:
+            Dictionary mapping each given aphia_id to its species_id
+        """
+        if not records:
+            return {}
+
+        conn = self._get_connection()
+        cursor = conn.cursor()
 
+        cursor.executemany(
+            """
+            INSERT OR IGNORE INTO species (aphia_id, scientific_name, genus, common_name, author, data_source)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """,
+            records,
+        )
         conn.commit()
-        return cursor.lastrowid
+
+        aphia_ids = list(dict.fromkeys(record[0] for record in records))
+        species_ids: Dict[int, int] = {}
+        # Stay below SQLite's bound-parameter limit
+        for start in range(0, len(aphia_ids), 900):
+            chunk = aphia_ids[start : start + 900]
+            placeholders = ",".join("?" * len(chunk))
+            cursor.execute(
+                f"SELECT aphia_id, species_id FROM species WHERE aphia_id IN ({placeholders})",
+                chunk,
+            )
+            species_ids.update((row[0], row[1]) for row in cursor.fetchall())
+        return species_ids
+
+    def add_trait_values_batch(self, records: List[Tuple]) -> int:
+        """
+        Add many trait values in one statement.
+
+        Args:
+            records: (species_id, trait_name, value, size_class_id, confidence, data_source, notes)
+                tuples. Values of unknown traits and missing values are skipped.
+
+        Returns:
+            Number of trait values inserted
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        cursor.execute("SELECT trait_name, trait_id, data_type FROM traits")
+        traits = {row[0]: (row[1], row[2]) for row in cursor.fetchall()}
+
+        rows = []
+        unknown = set()
+        for (
+            species_id,
+            trait_name,
+            value,
+            size_class_id,
+            confidence,
+            data_source,
+            notes,
+        ) in records:
+            trait = traits.get(trait_name)
+            if trait is None:
+                unknown.add(trait_name)
+                continue
+            typed = self._typed_value(trait[1], value)
+            if typed is None:
+                continue
+            rows.append(
+                (
+                    species_id,
+                    trait[0],
+                    *typed,
+                    size_class_id,
+                    confidence,
+                    data_source,
+                    notes,
+                )
+            )
+
+        for trait_name in sorted(unknown):
+            logger.warning(f"Trait '{trait_name}' not found in database")
+
+        cursor.executemany(_INSERT_TRAIT_VALUE_SQL, rows)
+        conn.commit()
+        return len(rows)
 
     def add_size_class(
         self,
@@ -422,15 +606,48 @@ class TraitOntologyDB:
         conn = self._get_connection()
         cursor = conn.cursor()
 
-        cursor.execute("""
-            INSERT INTO size_classes
-            (species_id, size_class_no, size_range, size_range_min, size_range_max, description)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (species_id, size_class_no, size_range, size_range_min, size_range_max, description))
+        cursor.execute(
+            _INSERT_SIZE_CLASS_SQL,
+            (
+                species_id,
+                size_class_no,
+                size_range,
+                size_range_min,
+                size_range_max,
+                description,
+            ),
+        )
 
         conn.commit()
         return cursor.lastrowid
 
+    def add_size_classes_batch(self, records: List[Tuple]) -> List[int]:
+        """
+        Add many size classes in one statement.
+
+        Args:
+            records: (species_id, size_class_no, size_range, size_range_min, size_range_max,
+                description) tuples
+
+        Returns:
+            size_class_id of each record, in the order given
+        """
+        if not records:
+            return []
+
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        cursor.executemany(_INSERT_SIZE_CLASS_SQL, records)
+        # AUTOINCREMENT ids are handed out in insertion order, so the new rows are the last ones
+        cursor.execute(
+            "SELECT size_class_id FROM size_classes ORDER BY size_class_id DESC LIMIT ?",
+            (len(records),),
+        )
+        size_class_ids = [row[0] for row in reversed(cursor.fetchall())]
+        conn.commit()
+        return size_class_ids
+
     def add_taxonomy(
         self,
         species_id: int,
@@ -466,6 +683,29 @@ class TraitOntologyDB:
             conn.commit()
             return species_id
 
+    def add_taxonomy_batch(self, records: List[Tuple]) -> None:
+        """
+        Add or update the taxonomic hierarchy of many species in one statement.
+
+        Args:
+            records: (species_id, kingdom, phylum, division, class_name, order_name, family,
+                genus, species, rank) tuples
+        """
+        conn = self._get_connection()
+        conn.executemany(
+            """
+            INSERT INTO taxonomic_hierarchy
+            (species_id, kingdom, phylum, division, class, order_name, family, genus, species, rank)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(species_id) DO UPDATE SET
+                kingdom=excluded.kingdom, phylum=excluded.phylum, division=excluded.division,
+                class=excluded.class, order_name=excluded.order_name, family=excluded.family,
+                genus=excluded.genus, species=excluded.species, rank=excluded.rank
+        """,
+            records,
+        )
+        conn.commit()
+
     def add_geographic_distribution(
         self,
         species_id: int,
@@ -476,14 +716,19 @@ class TraitOntologyDB:
         conn = self._get_connection()
         cursor = conn.cursor()
 
-        cursor.execute("""
-            INSERT INTO geographic_distribution (species_id, area_type, area_value)
-            VALUES (?, ?, ?)
-        """, (species_id, area_type, area_value))
+        cursor.execute(
+            _INSERT_GEOGRAPHIC_DISTRIBUTION_SQL, (species_id, area_type, area_value)
+        )
 
         conn.commit()
         return cursor.lastrowid
 
+    def add_geographic_distribution_batch(self, records: List[Tuple]) -> None:
+        """Add many (species_id, area_type, area_value) geographic distributions in one statement."""
+        conn = self._get_connection()
+        conn.executemany(_INSERT_GEOGRAPHIC_DISTRIBUTION_SQL, records)
+        conn.commit()
+
     def get_species_by_aphia_id(self, aphia_id: int) -> Optional[Dict[str, Any]]:
         """Get species information by AphiaID."""
         conn = self._get_connection()
@@ -507,6 +752,37 @@ class TraitOntologyDB:
             }
         return None
 
+    def get_species_by_aphia_ids(
+        self, aphia_ids: List[int]
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Get species information for multiple AphiaIDs (batch operation).
+
+        Args:
+            aphia_ids: List of WoRMS AphiaIDs
+
+        Returns:
+            Dictionary mapping aphia_id to species dictionary.
+            AphiaIDs not in the database are omitted.
+        """
+        aphia_ids = list(dict.fromkeys(aphia_ids))
+        if not aphia_ids:
+            return {}
+
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        species: Dict[int, Dict[str, Any]] = {}
+        # Stay below SQLite's bound-parameter limit
+        for start in range(0, len(aphia_ids), 900):
+            chunk = aphia_ids[start : start + 900]
+            placeholders = ",".join("?" * len(chunk))
+            cursor.execute(
+                f"SELECT * FROM species WHERE aphia_id IN ({placeholders})", chunk
+            )
+            species.update((row["aphia_id"], dict(row)) for row in cursor.fetchall())
+        return species
+
     def get_traits_for_species(
         self,
         aphia_id: int,
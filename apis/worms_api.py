@@ -2,11 +2,39 @@
 WoRMS (World Register of Marine Species) API implementation.
 """
 
+import functools
 from typing import Any, List, Optional
 
 import pandas as pd
 
 from .base_api import BaseMarineAPI
+from .exceptions import APIRequestError
+
+WORMS_BATCH_SIZE = 50  # maximum names per AphiaRecordsByNames request
+
+
+@functools.lru_cache(maxsize=1)
+def _mock_worms_records() -> pd.DataFrame:
+    """Return mock WoRMS records for testing."""
+    return pd.DataFrame(
+        [
+            {
+                "AphiaID": 126436,
+                "scientificname": "Clupea harengus",
+                "rank": "Species",
+            },
+            {
+                "AphiaID": 126439,
+                "scientificname": "Gadus morhua",
+                "rank": "Species",
+            },
+            {
+                "AphiaID": 154641,
+                "scientificname": "Perca fluviatilis",
+                "rank": "Species",
+            },
+        ]
+    )
 
 
 class WormsApi(BaseMarineAPI):
@@ -25,6 +53,11 @@ class WormsApi(BaseMarineAPI):
         """
         Retrieve WoRMS records.
 
+        Names are sent in batches of up to WORMS_BATCH_SIZE to the
+        AphiaRecordsByNames endpoint, so N names need ceil(N / 50) requests.
+        A batch rejected as too large (HTTP 413/414, e.g. for very long
+        names) is split in half and retried.
+
         Args:
             scientific_names: List of scientific names
 
@@ -32,13 +65,35 @@ class WormsApi(BaseMarineAPI):
             DataFrame with WoRMS records
         """
 
+        def _fetch_batch(batch):
+            # like=true matches the per-name AphiaRecordsByName default
+            params = {"scientificnames[]": batch, "like": "true", "marine_only": "true"}
+            try:
+                response = self._make_request("AphiaRecordsByNames", params=params)
+            except APIRequestError as e:
+                status = getattr(
+                    getattr(e.__cause__, "response", None), "status_code", None
+                )
+                if status not in (413, 414) or len(batch) < 2:
+                    raise
+                half = len(batch) // 2
+                return (_fetch_batch(batch[:half]) or []) + (
+                    _fetch_batch(batch[half:]) or []
+                )
+            return self._handle_response(response)
+
         def _api_call():
+            names = list(scientific_names)
+            batches = [
+                names[i : i + WORMS_BATCH_SIZE]
+                for i in range(0, len(names), WORMS_BATCH_SIZE)
+            ]
             results = []
-            for name in scientific_names:
-                response = self._make_request(f"AphiaRecordsByName/{name}")
-                data = self._handle_response(response)
-                if data:
-                    results.extend(data)
+            for data in self._map_concurrent(_fetch_batch, batches):
+                # One list of matching records (or null) per requested name
+                for records in data or []:
+                    if records:
+                        results.extend(records)
             return pd.DataFrame(results)
 
         return self._safe_api_call(_api_call, self._get_mock_worms_records)
@@ -179,22 +234,4 @@ class WormsApi(BaseMarineAPI):
     # Mock data methods
     def _get_mock_worms_records(self) -> pd.DataFrame:
         """Return mock WoRMS records for testing."""
-        return pd.DataFrame(
-            [
-                {
-                    "AphiaID": 126436,
-                    "scientificname": "Clupea harengus",
-                    "rank": "Species",
-                },
-                {
-                    "AphiaID": 126439,
-                    "scientificname": "Gadus morhua",
-                    "rank": "Species",
-                },
-                {
-                    "AphiaID": 154641,
-                    "scientificname": "Perca fluviatilis",
-                    "rank": "Species",
-                },
-            ]
-        )
+        return _mock_worms_records().copy(deep=False)
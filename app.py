@@ -11,6 +11,7 @@ SHARK, and other marine databases.
 """
 
 import logging
+from html import escape
 
 import pandas as pd
 import plotly.express as px
@@ -30,7 +31,8 @@ from app_modules.constants import (
     BULK_ANALYSIS_SAMPLE_SIZE,
     MAX_SIZE_MEASUREMENTS_DISPLAY,
 )
-from app_modules.utils import detect_size_data, validate_upload_file
+from app_modules.utils import detect_size_data, to_arrow_dtypes, validate_upload_file
+from app_modules.cache import size_summary_cache
 from app_modules.ui.components import (
     create_species_search_panel,
     create_bulk_analysis_panel,
@@ -70,6 +72,114 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+_EMPTY_FRAME = pd.DataFrame()
+
+
+def _error_frame(message: str) -> pd.DataFrame:
+    """
+    Return an empty result frame carrying an error message.
+
+    Search reactives return this instead of a one-row "Error" table; the
+    render layer reads ``attrs["api_error"]`` to build user-facing text.
+    """
+    frame = _EMPTY_FRAME.copy()
+    frame.attrs["api_error"] = message
+    return frame
+
+
+def _message_frame(message: str) -> pd.DataFrame:
+    """Return a one-row table showing ``message`` in place of results."""
+    return pd.DataFrame({"Message": [message]})
+
+
+# Placeholder tables for empty panels, built once at import. Render functions
+# only display these, so every render can share the same instance.
+_EMPTY_MSG_SHARK = _message_frame("No data found. Try adjusting your search criteria.")
+_EMPTY_MSG_DYNTAXA = _message_frame(
+    "Enter scientific names and click Search to find matches"
+)
+_EMPTY_MSG_WORMS = _message_frame(
+    "Enter scientific names and click Search to find WoRMS records."
+)
+_EMPTY_MSG_ALGAEBASE = _message_frame(
+    "Enter search terms and click Search to find AlgaeBase records."
+)
+_EMPTY_MSG_HAB = _message_frame(
+    "Click buttons above to fetch HAB species or toxin lists."
+)
+_EMPTY_MSG_OBIS = _message_frame("Enter search terms or coordinates and click Search")
+_EMPTY_MSG_NORDIC = _message_frame("Enter search terms or click Get Harmful Species")
+_EMPTY_MSG_NORDIC_HARMFUL = _message_frame("No harmful species data available")
+_EMPTY_MSG_FWE_QUERY = _message_frame("Provide a genus or taxon name to search.")
+_EMPTY_MSG_TRAITS = _message_frame("No results - perform a trait search")
+
+
+def _table_or_message(data: pd.DataFrame, placeholder: pd.DataFrame) -> pd.DataFrame:
+    """Return search results, their error, or a shared placeholder table."""
+    if not data.empty:
+        return data
+    error = data.attrs.get("api_error")
+    if error:
+        return pd.DataFrame({"Error": [error]})
+    return placeholder
+
+
+# Static panel descriptions, built once at import
+_DYNTAXA_INFO = """
+Swedish Taxonomy Database (Dyntaxa)
+• Maintained by SLU Artdatabanken
+• Comprehensive Swedish flora and fauna
+• Includes synonyms and taxonomic hierarchy
+• Used for biodiversity monitoring in Sweden
+""".strip()
+
+_WORMS_INFO = """
+World Register of Marine Species (WoRMS)
+• Global marine species database
+• AphiaID: unique identifier for each taxon
+• Comprehensive taxonomic classification
+• Essential for marine biodiversity research
+""".strip()
+
+_ALGAEBASE_INFO = """
+AlgaeBase Database
+• Comprehensive algae taxonomy database
+• Covers all groups of algae worldwide
+• Includes freshwater and marine species
+• Essential for phycological research
+""".strip()
+
+_HAB_INFO = """
+IOC-UNESCO HAB & Toxins Database
+• Harmful Algae: Species causing harmful algal blooms
+• Toxins: Marine biotoxins affecting seafood safety
+• Risk Assessment: Essential for aquaculture and fisheries
+• Global monitoring and research coordination
+""".strip()
+
+_OBIS_INFO = """
+Ocean Biodiversity Information System (OBIS)
+• Global marine biodiversity database
+• Species occurrence data worldwide
+• Depth, location, and environmental data
+• Essential for marine ecosystem research
+""".strip()
+
+_NORDIC_INFO = """
+Nordic Microalgae Database
+• Focus on Nordic freshwater microalgae
+• Harmfulness assessment for toxic species
+• Essential for water quality monitoring
+• Cyanobacteria and other harmful algae
+""".strip()
+
+_EMPTY_HTML = ui.HTML("")
+_BANNER_TEMPLATE = (
+    '<div class="alert alert-warning" role="alert" style="border-left:4px solid '
+    '#f0ad4e; background:#fff3cd; padding:10px; margin-bottom:10px;">'
+    "<strong>API Warning:</strong> {}</div>"
+)
+
 app_ui = ui.div(
     ui.head_content(ui.tags.link(rel="stylesheet", href="custom.css")),
     ui.div(
@@ -1189,19 +1299,21 @@ def server(input, output, session):  # noqa: C901
         p = preview_counts()
         return p.get("algaebase", "N/A")
 
-    def _process_gbif_data(species_name, species_data, client):
-        """Process GBIF data for a species."""
-        if not species_data:
-            return {
-                "GBIF Match": "Not found",
-                "Taxon Key": "",
-                "Total Occurrences": "0",
-                "Has Size Data": "No",
-                "Size Measurements": "N/A",
-            }
+    def _size_summary_for_taxon(client, taxon_key, sample_size):
+        """Summarize the size data of a taxon, cached per taxon.
 
-        taxon_key = species_data[0].get("key")
-        occ = client.search_occurrences(taxon_key=taxon_key, limit=BULK_ANALYSIS_SAMPLE_SIZE)
+        Only non-empty samples are cached, so failed or empty searches are
+        retried on the next run.
+
+        Returns:
+            Tuple of (has_size_data, size_measurements)
+        """
+        key = f"size:{taxon_key}:{sample_size}"
+        cached = size_summary_cache.get(key)
+        if cached is not None:
+            return cached
+
+        occ = client.search_occurrences(taxon_key=taxon_key, limit=sample_size)
         occurrences = occ.get("results", [])
 
         # Detect size data
@@ -1214,12 +1326,40 @@ def server(input, output, session):  # noqa: C901
                 size_measurements.extend(measurements)
                 break
 
+        summary = (has_size_data, size_measurements)
+        if occurrences:
+            size_summary_cache.set(key, summary)
+        return summary
+
+    def _process_gbif_data(species_name, species_data, client):
+        """Process GBIF data for a species."""
+        if not species_data:
+            return {
+                "GBIF Match": "Not found",
+                "Taxon Key": "",
+                "Total Occurrences": "0",
+                "Has Size Data": "No",
+                "Size Measurements": "N/A",
+            }
+
+        taxon_key = species_data[0].get("key")
+        # Occurrence totals change as datasets are published; only the size
+        # summary is reused across runs
+        total_occurrences = client.get_occurrence_count(taxon_key=taxon_key)
+        has_size_data, size_measurements = _size_summary_for_taxon(
+            client, taxon_key, BULK_ANALYSIS_SAMPLE_SIZE
+        )
+
         return {
             "GBIF Match": species_data[0].get("scientificName"),
             "Taxon Key": taxon_key,
-            "Total Occurrences": occ.get("count", 0),
+            "Total Occurrences": total_occurrences,
             "Has Size Data": "Yes" if has_size_data else "No",
-            "Size Measurements": "; ".join(size_measurements[:MAX_SIZE_MEASUREMENTS_DISPLAY]) if size_measurements else "None found",
+            "Size Measurements": (
+                "; ".join(size_measurements[:MAX_SIZE_MEASUREMENTS_DISPLAY])
+                if size_measurements
+                else "None found"
+            ),
         }
 
     def _process_fwe_data(species_name, shark_client):
@@ -1315,7 +1455,7 @@ def server(input, output, session):  # noqa: C901
                 "total": total,
                 "status": f"Processing {completed}/{total}: {species_name}",
             })
-            analysis_results.set(pd.DataFrame(results))
+            analysis_results.set(to_arrow_dtypes(pd.DataFrame(results)))
         except Exception:
             logger.debug("Could not update reactive progress", exc_info=True)
 
@@ -1328,6 +1468,14 @@ def server(input, output, session):  # noqa: C901
         """
         import asyncio
 
+        # Resolve database selection once instead of per species
+        _dbs = dbs or {}
+        do_gbif = True if dbs is None else bool(_dbs.get("gbif", True))
+        do_fwe = bool(_dbs.get("fwe"))
+        do_shark = bool(_dbs.get("shark"))
+        do_obis = bool(_dbs.get("obis"))
+        do_algae = bool(_dbs.get("algaebase"))
+
         try:
             logger.info(f"=== TASK STARTED: Processing {len(species_list)} species ===")
             results = []
@@ -1348,7 +1496,7 @@ def server(input, output, session):  # noqa: C901
                                 "status": f"Cancelled after processing {i}/{len(species_list)} species",
                             }
                         )
-                        analysis_results.set(pd.DataFrame(results))
+                        analysis_results.set(to_arrow_dtypes(pd.DataFrame(results)))
                     except Exception:
                         logger.debug("Could not update reactive state after cancellation", exc_info=True)
 
@@ -1382,8 +1530,7 @@ def server(input, output, session):  # noqa: C901
                     result = {"Species Name": str(species_name)}
 
                     # Process GBIF data
-                    gbif_selected = True if dbs is None else bool(dbs.get("gbif", True))
-                    if gbif_selected:
+                    if do_gbif:
                         result.update(_process_gbif_data(species_name, species_data, client))
                     else:
                         result.update({
@@ -1395,15 +1542,16 @@ def server(input, output, session):  # noqa: C901
                         })
 
                     # Process other databases if requested
-                    if dbs is not None:
-                        if dbs.get("fwe"):
-                            result.update(_process_fwe_data(species_name, shark_client))
-                        if dbs.get("shark"):
-                            result.update(_process_worms_data(species_name, shark_client))
-                        if dbs.get("obis"):
-                            result.update(_process_obis_data(species_name, shark_client))
-                        if dbs.get("algaebase"):
-                            result.update(_process_algaebase_data(species_name, shark_client))
+                    if do_fwe:
+                        result.update(_process_fwe_data(species_name, shark_client))
+                    if do_shark:
+                        result.update(_process_worms_data(species_name, shark_client))
+                    if do_obis:
+                        result.update(_process_obis_data(species_name, shark_client))
+                    if do_algae:
+                        result.update(
+                            _process_algaebase_data(species_name, shark_client)
+                        )
 
                     # Append result and update progress
                     results.append(result)
@@ -1819,7 +1967,7 @@ def server(input, output, session):  # noqa: C901
         if status == "completed":
             logger.info("Task completed successfully, processing results")
             results = task.result()
-            analysis_results.set(pd.DataFrame(results))
+            analysis_results.set(to_arrow_dtypes(pd.DataFrame(results)))
             progress_state.set(
                 {
                     "is_running": False,
@@ -2070,12 +2218,15 @@ def server(input, output, session):  # noqa: C901
             return f"Error fetching FWE status: {e}"
 
     @reactive.calc
+    @reactive.event(input.fwe_search_btn, ignore_none=False)
     def fwe_search():
+        # Only re-run on button clicks; the query inputs are read in isolation
+        # so typing in them does not re-query FWE or re-render the SHARK table.
         if input.fwe_search_btn() > 0:
             try:
                 q = input.fwe_taxonname() or input.fwe_genus() or ""
                 if not q.strip():
-                    return pd.DataFrame({"Message": ["Provide a genus or taxon name to search."]})
+                    return _EMPTY_MSG_FWE_QUERY
 
                 df = shark_client.search_fwe_taxa(q, limit=100)
                 # Surface api metadata in banner if present
@@ -2110,21 +2261,23 @@ def server(input, output, session):  # noqa: C901
         if not data.empty:
             return data
 
+        # Also check if there is an FWE result (from fwe_search) requested by the user.
+        # Only pulled when SHARK returned nothing, so FWE is not a dependency otherwise.
+        fwe_df = fwe_search()
+        if not fwe_df.empty:
+            return fwe_df
+
         # Otherwise, show default message
         msg = "No data found. Try adjusting your search criteria."
         error = getattr(data, "attrs", {}).get("api_error")
         fallback = getattr(data, "attrs", {}).get("api_fallback")
         if error:
-            msg = f"⚠️ SHARK API: {error}. {msg}"
-        elif fallback:
-            msg = f"⚠️ SHARK API unreachable - using fallback data (may be limited). {msg}"
-
-        # Also check if there is an FWE result (from fwe_search) requested by the user
-        fwe_df = fwe_search()
-        if not fwe_df.empty:
-            return fwe_df
-
-        return pd.DataFrame({"Message": [msg]})
+            return _message_frame(f"⚠️ SHARK API: {error}. {msg}")
+        if fallback:
+            return _message_frame(
+                f"⚠️ SHARK API unreachable - using fallback data (may be limited). {msg}"
+            )
+        return _EMPTY_MSG_SHARK
 
     @output
     @render.text
@@ -2135,24 +2288,37 @@ def server(input, output, session):  # noqa: C901
 
         try:
             total = len(df)
-            processed = df.shape[0]
+
+            # Count matched names for all "... Match" columns in one pass over a
+            # string projection of the frame
+            match_cols = [
+                col
+                for col in ("GBIF Match", "FWE Match", "WoRMS Match", "AlgaeBase Match")
+                if col in df.columns
+                and (df[col].dtype == object or pd.api.types.is_string_dtype(df[col]))
+            ]
+            sub = df[match_cols].astype("string")
+            matched = (
+                sub.notna()
+                & sub.ne("Not found")
+                & ~sub.apply(lambda col: col.str.startswith("Error", na=False))
+            )
+            counts = matched.sum().to_dict()
+
             # simple coverage metrics
-            gbif_matches = 0
-            fwe_matches = 0
+            gbif_matches = int(counts.get("GBIF Match", 0))
+            fwe_matches = int(counts.get("FWE Match", 0))
+            algaebase_matches = int(counts.get("AlgaeBase Match", 0))
+            worms_matches = int(counts.get("WoRMS Match", 0))
             obis_count = 0
-            algaebase_matches = 0
-            worms_matches = 0
-
-            if "GBIF Match" in df.columns:
-                gbif_matches = df["GBIF Match"].apply(lambda x: isinstance(x, str) and x != "Not found" and not x.startswith("Error")).sum()
-            if "FWE Match" in df.columns:
-                fwe_matches = df["FWE Match"].apply(lambda x: isinstance(x, str) and x != "Not found" and not x.startswith("Error")).sum()
             if "OBIS Occurrences" in df.columns:
-                obis_count = df["OBIS Occurrences"].apply(lambda x: isinstance(x, int) and x > 0).sum()
-            if "AlgaeBase Match" in df.columns:
-                algaebase_matches = df["AlgaeBase Match"].apply(lambda x: isinstance(x, str) and x != "Not found" and not x.startswith("Error")).sum()
-            if "WoRMS Match" in df.columns:
-                worms_matches = df["WoRMS Match"].apply(lambda x: isinstance(x, str) and x != "Not found" and not x.startswith("Error")).sum()
+                # Counts are stored as strings; error messages coerce to NaN
+                obis_count = int(
+                    pd.to_numeric(df["OBIS Occurrences"], errors="coerce")
+                    .fillna(0)
+                    .gt(0)
+                    .sum()
+                )
 
             summary = (
                 f"Total species processed: {total}\n"
@@ -2170,40 +2336,84 @@ def server(input, output, session):  # noqa: C901
         except Exception as e:
             return f"Unexpected error generating summary: {str(e)}"
 
+    # Summary reductions are computed once per data change in the *_stats
+    # calcs below, so the text outputs only format precomputed scalars.
+
+    def _uniq(data, col):
+        """Number of distinct non-null values in a column, or "N/A" if absent."""
+        if col in data.columns:
+            # unique() only builds the hash set; nunique() also tallies counts.
+            # Nulls are discarded from the (small) set of uniques afterwards.
+            uniques = data[col].unique()
+            return len(uniques) - int(pd.isna(uniques).sum())
+        return "N/A"
+
+    def _first_unique(data, col, n):
+        """Comma-separated first n distinct values of a column, or "N/A"."""
+        if col in data.columns:
+            return ", ".join(data[col].unique()[:n])
+        return "N/A"
+
+    def _minmax(data, col):
+        """(min, max) of a column's non-null values, or ("N/A", "N/A")."""
+        if col not in data.columns:
+            return "N/A", "N/A"
+        # Reduce the materialized ndarray directly, skipping pandas' per-call
+        # NA handling and dispatch for each of the two reductions
+        values = data[col].dropna().to_numpy()
+        if not values.size:
+            return "N/A", "N/A"
+        low, high = values.min(), values.max()
+        if pd.api.types.is_datetime64_any_dtype(data[col]):
+            return pd.Timestamp(low), pd.Timestamp(high)
+        return low, high
+
+    def _empty_stats(data):
+        """Stats for an empty result: {} or the search error, if any."""
+        error = data.attrs.get("api_error")
+        return {"error": error} if error else {}
+
+    @reactive.calc
+    def _shark_stats():
+        data = shark_data()
+        if data.empty:
+            return {}
+        date_min, date_max = _minmax(data, "date")
+        return {
+            "records": len(data),
+            "parameters": _uniq(data, "parameter"),
+            "stations": _uniq(data, "station"),
+            "date_min": date_min,
+            "date_max": date_max,
+        }
+
+    @reactive.calc
+    def _shark_summary():
+        """Formatted SHARK summary, rebuilt only when shark_data changes.
+
+        The banner message is set from several reactives and re-renders
+        shark_summary_text often; those re-renders reuse this string.
+        """
+        stats = _shark_stats()
+        if not stats:
+            return "No data to summarize"
+        summary = (
+            f"Total Records: {stats['records']}\n"
+            f"Parameters: {stats['parameters']}\n"
+            f"Stations: {stats['stations']}\n"
+            f"Date Range: {stats['date_min']} to {stats['date_max']}\n"
+        )
+        return summary.strip()
+
     @output
     @render.text
     def shark_summary_text():
-        data = shark_data()
         status_msg = shark_api_message.get() if 'shark_api_message' in globals() or True else ""
-        if data.empty:
-            base = "No data to summarize"
-            if status_msg:
-                return f"{status_msg}\n\n{base}"
-            return base
-
         try:
-            def _uniq(col):
-                if col in data.columns:
-                    return data.get(col, pd.Series()).nunique()
-                return "N/A"
-
-            parameters = _uniq("parameter")
-            stations = _uniq("station")
-            if "date" in data.columns:
-                date_min = data.get("date", pd.Series()).min()
-                date_max = data.get("date", pd.Series()).max()
-            else:
-                date_min, date_max = "N/A", "N/A"
-
-            summary = (
-                f"Total Records: {len(data)}\n"
-                f"Parameters: {parameters}\n"
-                f"Stations: {stations}\n"
-                f"Date Range: {date_min} to {date_max}\n"
-            )
+            summary = _shark_summary()
             if status_msg:
-                return f"{status_msg}\n\n{summary.strip()}"
-            return summary.strip()
+                return f"{status_msg}\n\n{summary}"
+            return summary
         except (KeyError, IndexError) as e:
             return f"Error accessing SHARK data for summary: {str(e)}"
         except (ValueError, TypeError) as e:
@@ -2252,15 +2462,11 @@ Data Validation: {qc_info.get('validation', 'Not specified')}
 
         if not msg:
             # Return empty HTML to avoid layout jumps
-            return ui.HTML("")
+            return _EMPTY_HTML
 
-        # Use Bootstrap alert for consistent styling
-        html = f"""
-<div class="alert alert-warning" role="alert" style="border-left:4px solid #f0ad4e; background:#fff3cd; padding:10px; margin-bottom:10px;">
-  <strong>API Warning:</strong> {msg}
-</div>
-"""
-        return ui.HTML(html)
+        # Use Bootstrap alert for consistent styling; messages may echo
+        # exception text from remote APIs, so escape before embedding
+        return ui.HTML(_BANNER_TEMPLATE.format(escape(msg)))
 
     # ============================================================================
     # Dyntaxa (SLU Artdatabanken) Functions
@@ -2280,55 +2486,47 @@ Data Validation: {qc_info.get('validation', 'Not specified')}
                     return results
             except (APIConnectionError, APITimeoutError) as e:
                 logger.error(f"Dyntaxa API connection error: {e}")
-                return pd.DataFrame({"Error": ["Connection error searching Dyntaxa"]})
+                return _error_frame("Connection error searching Dyntaxa")
             except (APIResponseError, APIError) as e:
                 logger.error(f"Dyntaxa API response error: {e}")
-                return pd.DataFrame({"Error": ["API error searching Dyntaxa"]})
+                return _error_frame("API error searching Dyntaxa")
             except Exception as e:
                 logger.error(f"Unexpected error searching Dyntaxa: {e}")
-                return pd.DataFrame({"Error": [f"Failed to search Dyntaxa: {str(e)}"]})
+                return _error_frame(f"Failed to search Dyntaxa: {str(e)}")
         return pd.DataFrame()
 
     @output
     @render.data_frame
     def dyntaxa_results_table():
+        return _table_or_message(dyntaxa_results(), _EMPTY_MSG_DYNTAXA)
+
+    @reactive.calc
+    def _dyntaxa_stats():
         data = dyntaxa_results()
         if data.empty:
-            return pd.DataFrame(
-                {
-                    "Message": [
-                        "Enter scientific names and click Search to find matches"
-                    ]
-                }
-            )
-        return data
+            return _empty_stats(data)
+        return {
+            "records": len(data),
+            "scientific_names": _uniq(data, "scientificName"),
+            "taxon_ids": _uniq(data, "taxonId"),
+            "ranks": _first_unique(data, "rank", 5),
+        }
 
     @output
     @render.text
     def dyntaxa_summary_text():
-        data = dyntaxa_results()
-        if data.empty:
-            return "No search performed"
-
         try:
-            def _uniq(col):
-                if col in data.columns:
-                    return data.get(col, pd.Series()).nunique()
-                return "N/A"
-
-            scientific_count = _uniq("scientificName")
-            taxon_ids_count = _uniq("taxonId")
-            ranks = (
-                ", ".join(data.get("rank", pd.Series()).unique()[:5])
-                if "rank" in data.columns
-                else "N/A"
-            )
+            stats = _dyntaxa_stats()
+            if not stats:
+                return "No search performed"
+            if "error" in stats:
+                return stats["error"]
 
             summary = (
-                f"Total Matches: {len(data)}\n"
-                f"Scientific Names: {scientific_count}\n"
-                f"Taxon IDs: {taxon_ids_count}\n"
-                f"Ranks: {ranks}\n"
+                f"Total Matches: {stats['records']}\n"
+                f"Scientific Names: {stats['scientific_names']}\n"
+                f"Taxon IDs: {stats['taxon_ids']}\n"
+                f"Ranks: {stats['ranks']}\n"
             )
             return summary.strip()
         except (KeyError, IndexError) as e:
@@ -2344,21 +2542,7 @@ Data Validation: {qc_info.get('validation', 'Not specified')}
         data = dyntaxa_results()
         if data.empty:
             return "No taxonomy data available"
-
-        try:
-            taxonomy_info = """
-Swedish Taxonomy Database (Dyntaxa)
-• Maintained by SLU Artdatabanken
-• Comprehensive Swedish flora and fauna
-• Includes synonyms and taxonomic hierarchy
-• Used for biodiversity monitoring in Sweden
-"""
-            return taxonomy_info.strip()
-        except (AttributeError, KeyError) as e:
-            logger.debug(f"Error accessing Dyntaxa taxonomy data: {e}")
-            return "Error displaying taxonomy information"
-        except Exception as e:
-            return f"Unexpected error: {str(e)}"
+        return _DYNTAXA_INFO
 
     @reactive.effect
     @reactive.event(input.dyntaxa_clear_btn)
@@ -2384,55 +2568,47 @@ Swedish Taxonomy Database (Dyntaxa)
                     return results
             except (APIConnectionError, APITimeoutError) as e:
                 logger.error(f"WoRMS API connection error: {e}")
-                return pd.DataFrame({"Error": ["Connection error searching WoRMS"]})
+                return _error_frame("Connection error searching WoRMS")
             except (APIResponseError, APIError) as e:
                 logger.error(f"WoRMS API response error: {e}")
-                return pd.DataFrame({"Error": ["API error searching WoRMS"]})
+                return _error_frame("API error searching WoRMS")
             except Exception as e:
                 logger.error(f"Unexpected error searching WoRMS: {e}")
-                return pd.DataFrame({"Error": [f"Failed to search WoRMS: {str(e)}"]})
+                return _error_frame(f"Failed to search WoRMS: {str(e)}")
         return pd.DataFrame()
 
     @output
     @render.data_frame
     def worms_results_table():
+        return _table_or_message(worms_results(), _EMPTY_MSG_WORMS)
+
+    @reactive.calc
+    def _worms_stats():
         data = worms_results()
         if data.empty:
-            return pd.DataFrame(
-                {
-                    "Message": [
-                        "Enter scientific names and click Search to find WoRMS records."
-                    ]
-                }
-            )
-        return data
+            return _empty_stats(data)
+        return {
+            "records": len(data),
+            "scientific_names": _uniq(data, "scientificname"),
+            "aphia_ids": _uniq(data, "AphiaID"),
+            "ranks": _first_unique(data, "rank", 5),
+        }
 
     @output
     @render.text
     def worms_summary_text():
-        data = worms_results()
-        if data.empty:
-            return "No search performed"
-
         try:
-            def _uniq(col):
-                if col in data.columns:
-                    return data.get(col, pd.Series()).nunique()
-                return "N/A"
-
-            scientific_count = _uniq("scientificname")
-            aphia_count = _uniq("AphiaID")
-            ranks = (
-                ", ".join(data.get("rank", pd.Series()).unique()[:5])
-                if "rank" in data.columns
-                else "N/A"
-            )
+            stats = _worms_stats()
+            if not stats:
+                return "No search performed"
+            if "error" in stats:
+                return stats["error"]
 
             summary = (
-                f"Total Records: {len(data)}\n"
-                f"Scientific Names: {scientific_count}\n"
-                f"AphiaIDs: {aphia_count}\n"
-                f"Taxonomic Ranks: {ranks}\n"
+                f"Total Records: {stats['records']}\n"
+                f"Scientific Names: {stats['scientific_names']}\n"
+                f"AphiaIDs: {stats['aphia_ids']}\n"
+                f"Taxonomic Ranks: {stats['ranks']}\n"
             )
             return summary.strip()
         except (KeyError, IndexError) as e:
@@ -2448,21 +2624,7 @@ Swedish Taxonomy Database (Dyntaxa)
         data = worms_results()
         if data.empty:
             return "No AphiaID data available"
-
-        try:
-            aphia_info = """
-World Register of Marine Species (WoRMS)
-• Global marine species database
-• AphiaID: unique identifier for each taxon
-• Comprehensive taxonomic classification
-• Essential for marine biodiversity research
-"""
-            return aphia_info.strip()
-        except (AttributeError, KeyError) as e:
-            logger.debug(f"Error accessing WoRMS AphiaID data: {e}")
-            return "Error displaying AphiaID information"
-        except Exception as e:
-            return f"Unexpected error: {str(e)}"
+        return _WORMS_INFO
 
     @reactive.effect
     @reactive.event(input.worms_clear_btn)
@@ -2491,55 +2653,46 @@ World Register of Marine Species (WoRMS)
                     return results
             except (APIConnectionError, APITimeoutError) as e:
                 logger.error(f"AlgaeBase API connection error: {e}")
-                return pd.DataFrame({"Error": ["Connection error searching AlgaeBase"]})
+                return _error_frame("Connection error searching AlgaeBase")
             except (APIResponseError, APIError) as e:
                 logger.error(f"AlgaeBase API response error: {e}")
-                return pd.DataFrame({"Error": ["API error searching AlgaeBase"]})
+                return _error_frame("API error searching AlgaeBase")
             except Exception as e:
                 logger.error(f"Unexpected error searching AlgaeBase: {e}")
-                return pd.DataFrame(
-                    {"Error": [f"Failed to search AlgaeBase: {str(e)}"]}
-                )
+                return _error_frame(f"Failed to search AlgaeBase: {str(e)}")
         return pd.DataFrame()
 
     @output
     @render.data_frame
     def algaebase_results_table():
+        return _table_or_message(algaebase_results(), _EMPTY_MSG_ALGAEBASE)
+
+    @reactive.calc
+    def _algaebase_stats():
         data = algaebase_results()
         if data.empty:
-            return pd.DataFrame(
-                {
-                    "Message": [
-                        "Enter search terms and click Search to find AlgaeBase records."
-                    ]
-                }
-            )
-        return data
+            return _empty_stats(data)
+        return {
+            "records": len(data),
+            "genera": _uniq(data, "genus"),
+            "classes": _first_unique(data, "class", 3),
+        }
 
     @output
     @render.text
     def algaebase_summary_text():
-        data = algaebase_results()
-        if data.empty:
-            return "No search performed"
-
         try:
-            def _uniq(col):
-                if col in data.columns:
-                    return data.get(col, pd.Series()).nunique()
-                return "N/A"
-
-            classes = (
-                ", ".join(data.get("class", pd.Series()).unique()[:3])
-                if "class" in data.columns
-                else "N/A"
-            )
-            genera = _uniq("genus")
+            stats = _algaebase_stats()
+            if not stats:
+                return "No search performed"
+            if "error" in stats:
+                return stats["error"]
+
             summary = (
-                f"Total Records: {len(data)}\n"
+                f"Total Records: {stats['records']}\n"
                 f"Search Type: {input.algaebase_type()}\n"
-                f"Genera: {genera}\n"
-                f"Classes: {classes}\n"
+                f"Genera: {stats['genera']}\n"
+                f"Classes: {stats['classes']}\n"
             )
             return summary.strip()
         except (KeyError, IndexError) as e:
@@ -2555,21 +2708,7 @@ World Register of Marine Species (WoRMS)
         data = algaebase_results()
         if data.empty:
             return "No taxonomy data available"
-
-        try:
-            taxonomy_info = """
-AlgaeBase Database
-• Comprehensive algae taxonomy database
-• Covers all groups of algae worldwide
-• Includes freshwater and marine species
-• Essential for phycological research
-"""
-            return taxonomy_info.strip()
-        except (AttributeError, KeyError) as e:
-            logger.debug(f"Error accessing AlgaeBase taxonomy data: {e}")
-            return "Error displaying taxonomy information"
-        except Exception as e:
-            return f"Unexpected error: {str(e)}"
+        return _ALGAEBASE_INFO
 
     @reactive.effect
     @reactive.event(input.algaebase_clear_btn)
@@ -2596,69 +2735,59 @@ AlgaeBase Database
                 return results
             except (APIConnectionError, APITimeoutError) as e:
                 logger.error(f"HAB API connection error: {e}")
-                return pd.DataFrame({"Error": ["Connection error fetching HAB data"]})
+                return _error_frame("Connection error fetching HAB data")
             except (APIResponseError, APIError) as e:
                 logger.error(f"HAB API response error: {e}")
-                return pd.DataFrame({"Error": ["API error fetching HAB data"]})
+                return _error_frame("API error fetching HAB data")
             except Exception as e:
                 logger.error(f"Unexpected error fetching HAB data: {e}")
-                return pd.DataFrame({"Error": [f"Failed to fetch HAB data: {str(e)}"]})
+                return _error_frame(f"Failed to fetch HAB data: {str(e)}")
         return pd.DataFrame()
 
     @output
     @render.data_frame
     def hab_results_table():
+        return _table_or_message(hab_results(), _EMPTY_MSG_HAB)
+
+    @reactive.calc
+    def _hab_stats():
         data = hab_results()
         if data.empty:
-            return pd.DataFrame(
-                {
-                    "Message": [
-                        "Click buttons above to fetch HAB species or toxin lists."
-                    ]
-                }
-            )
-        return data
+            return _empty_stats(data)
+        data_type = data["type"].iloc[0] if "type" in data.columns else "Unknown"
+        if data_type == "HAB Species":
+            count = _uniq(data, "species")
+            levels = _first_unique(data, "toxicity", 3)
+        else:
+            count = _uniq(data, "toxin")
+            levels = _first_unique(data, "type", 3)
+        return {
+            "data_type": data_type,
+            "records": len(data),
+            "count": count,
+            "levels": levels,
+        }
 
     @output
     @render.text
     def hab_summary_text():
-        data = hab_results()
-        if data.empty:
-            return "No data fetched"
-
         try:
-            data_type = (
-                data.get("type", pd.Series()).iloc[0]
-                if "type" in data.columns
-                else "Unknown"
-            )
+            stats = _hab_stats()
+            if not stats:
+                return "No data fetched"
+            if "error" in stats:
+                return stats["error"]
+
             summary = f"""
-Data Type: {data_type}
-Total Records: {len(data)}
+Data Type: {stats['data_type']}
+Total Records: {stats['records']}
 """
-            def _uniq(col):
-                if col in data.columns:
-                    return data.get(col, pd.Series()).nunique()
-                return "N/A"
-
-            if data_type == "HAB Species":
-                species_count = _uniq("species")
-                toxicity = (
-                    ", ".join(data.get("toxicity", pd.Series()).unique()[:3])
-                    if "toxicity" in data.columns
-                    else "N/A"
-                )
-                summary += f"Species: {species_count}\n"
-                summary += f"Toxicity Levels: {toxicity}"
+            if stats["data_type"] == "HAB Species":
+                summary += f"Species: {stats['count']}\n"
+                summary += f"Toxicity Levels: {stats['levels']}"
             else:
-                toxins_count = _uniq("toxin")
-                types = (
-                    ", ".join(data.get("type", pd.Series()).unique()[:3])
-                    if "type" in data.columns
-                    else "N/A"
-                )
-                summary += f"Toxins: {toxins_count}\n"
-                summary += f"Types: {types}"
+                summary += f"Toxins: {stats['count']}\n"
+                summary += f"Types: {stats['levels']}"
 
             return summary.strip()
         except (KeyError, IndexError) as e:
@@ -2674,21 +2803,7 @@ Total Records: {len(data)}
         data = hab_results()
         if data.empty:
             return "No risk assessment available"
-
-        try:
-            risk_info = """
-IOC-UNESCO HAB & Toxins Database
-• Harmful Algae: Species causing harmful algal blooms
-• Toxins: Marine biotoxins affecting seafood safety
-• Risk Assessment: Essential for aquaculture and fisheries
-• Global monitoring and research coordination
-"""
-            return risk_info.strip()
-        except (AttributeError, KeyError) as e:
-            logger.debug(f"Error accessing HAB risk data: {e}")
-            return "Error displaying risk information"
-        except Exception as e:
-            return f"Unexpected error: {str(e)}"
+        return _HAB_INFO
 
     @reactive.effect
     @reactive.event(input.hab_clear_btn)
@@ -2707,9 +2822,12 @@ IOC-UNESCO HAB & Toxins Database
                 if input.obis_lat() is not None and input.obis_lon() is not None:
                     # Coordinate lookup
                     coordinates = [
-                        {"latitude": input.obis_lat(), "longitude": input.obis_lon()}
+                        {
+                            "latitude": float(input.obis_lat()),
+                            "longitude": float(input.obis_lon()),
+                        }
                     ]
-                    results = shark_client.lookup_xy(pd.DataFrame(coordinates))
+                    results = shark_client.lookup_xy(coordinates)
                 elif input.obis_search():
                     # Species search
                     names = [
@@ -2726,55 +2844,50 @@ IOC-UNESCO HAB & Toxins Database
                 return results
             except (APIConnectionError, APITimeoutError) as e:
                 logger.error(f"OBIS API connection error: {e}")
-                return pd.DataFrame({"Error": ["Connection error searching OBIS"]})
+                return _error_frame("Connection error searching OBIS")
             except (APIResponseError, APIError) as e:
                 logger.error(f"OBIS API response error: {e}")
-                return pd.DataFrame({"Error": ["API error searching OBIS"]})
+                return _error_frame("API error searching OBIS")
             except (ValueError, TypeError) as e:
                 logger.error(f"Invalid coordinates for OBIS search: {e}")
-                return pd.DataFrame({"Error": ["Invalid search parameters"]})
+                return _error_frame("Invalid search parameters")
             except Exception as e:
                 logger.error(f"Unexpected error searching OBIS: {e}")
-                return pd.DataFrame({"Error": [f"Failed to search OBIS: {str(e)}"]})
+                return _error_frame(f"Failed to search OBIS: {str(e)}")
         return pd.DataFrame()
 
     @output
     @render.data_frame
     def obis_results_table():
+        return _table_or_message(obis_results(), _EMPTY_MSG_OBIS)
+
+    @reactive.calc
+    def _obis_stats():
         data = obis_results()
         if data.empty:
-            return pd.DataFrame(
-                {
-                    "Message": [
-                        "Enter search terms or coordinates and click Search"
-                    ]
-                }
-            )
-        return data
+            return _empty_stats(data)
+        depth_min, depth_max = _minmax(data, "depth")
+        return {
+            "records": len(data),
+            "species": _uniq(data, "species"),
+            "depth_min": depth_min,
+            "depth_max": depth_max,
+        }
 
     @output
     @render.text
     def obis_summary_text():
-        data = obis_results()
-        if data.empty:
-            return "No search performed"
-
         try:
-            if "species" in data.columns:
-                species_count = data.get("species", pd.Series()).nunique()
-            else:
-                species_count = "N/A"
-
-            if "depth" in data.columns:
-                depth_min = data.get("depth", pd.Series()).min()
-                depth_max = data.get("depth", pd.Series()).max()
-            else:
-                depth_min, depth_max = "N/A", "N/A"
+            stats = _obis_stats()
+            if not stats:
+                return "No search performed"
+            if "error" in stats:
+                return stats["error"]
 
             summary = (
-                f"Total Records: {len(data)}\n"
-                f"Species: {species_count}\n"
-                f"Depth Range: {depth_min} - {depth_max} m\n"
+                f"Total Records: {stats['records']}\n"
+                f"Species: {stats['species']}\n"
+                f"Depth Range: {stats['depth_min']} - {stats['depth_max']} m\n"
             )
             return summary.strip()
         except (KeyError, IndexError) as e:
@@ -2790,21 +2903,7 @@ IOC-UNESCO HAB & Toxins Database
         data = obis_results()
         if data.empty:
             return "No spatial data available"
-
-        try:
-            spatial_info = """
-Ocean Biodiversity Information System (OBIS)
-• Global marine biodiversity database
-• Species occurrence data worldwide
-• Depth, location, and environmental data
-• Essential for marine ecosystem research
-"""
-            return spatial_info.strip()
-        except (AttributeError, KeyError) as e:
-            logger.debug(f"Error accessing OBIS spatial data: {e}")
-            return "Error displaying spatial information"
-        except Exception as e:
-            return f"Unexpected error: {str(e)}"
+        return _OBIS_INFO
 
     @reactive.effect
     @reactive.event(input.obis_clear_btn)
@@ -2827,65 +2926,49 @@ Ocean Biodiversity Information System (OBIS)
                 return results
             except Exception as e:
                 logger.error(f"Error searching Nordic Microalgae: {e}")
-                return pd.DataFrame(
-                    {"Error": [f"Failed to search Nordic DB: {str(e)}"]}
-                )
+                return _error_frame(f"Failed to search Nordic DB: {str(e)}")
         elif input.nordic_harmful_btn() > 0:
             try:
-                # Get all taxa and filter harmful ones
-                all_taxa = shark_client.get_nordic_microalgae_taxa()
-                if not all_taxa.empty and "harmfulness" in all_taxa.columns:
-                    harmful_taxa = all_taxa[
-                        all_taxa["harmfulness"].str.contains(
-                            "toxic", case=False, na=False
-                        )
-                    ]
+                # Filtered (and cached) by the Nordic Microalgae client
+                harmful_taxa = shark_client.get_nordic_harmful_taxa()
+                if not harmful_taxa.empty:
                     return harmful_taxa
-                return pd.DataFrame({"Message": ["No harmful species data available"]})
+                return _EMPTY_MSG_NORDIC_HARMFUL
             except Exception as e:
                 logger.error(f"Error fetching harmful species: {e}")
-                return pd.DataFrame(
-                    {"Error": [f"Failed to fetch harmful species: {str(e)}"]}
-                )
+                return _error_frame(f"Failed to fetch harmful species: {str(e)}")
         return pd.DataFrame()
 
     @output
     @render.data_frame
     def nordic_results_table():
+        return _table_or_message(nordic_results(), _EMPTY_MSG_NORDIC)
+
+    @reactive.calc
+    def _nordic_stats():
         data = nordic_results()
         if data.empty:
-            return pd.DataFrame(
-                {
-                    "Message": [
-                        "Enter search terms or click Get Harmful Species"
-                    ]
-                }
-            )
-        return data
+            return _empty_stats(data)
+        return {
+            "records": len(data),
+            "species": _uniq(data, "name"),
+            "harmfulness": _first_unique(data, "harmfulness", 3),
+        }
 
     @output
     @render.text
     def nordic_summary_text():
-        data = nordic_results()
-        if data.empty:
-            return "No search performed"
-
         try:
-            harmfulness = (
-                ", ".join(data.get("harmfulness", pd.Series()).unique()[:3])
-                if "harmfulness" in data.columns
-                else "N/A"
-            )
-
-            if "name" in data.columns:
-                species_count = data.get("name", pd.Series()).nunique()
-            else:
-                species_count = "N/A"
+            stats = _nordic_stats()
+            if not stats:
+                return "No search performed"
+            if "error" in stats:
+                return stats["error"]
 
             summary = (
-                f"Total Records: {len(data)}\n"
-                f"Species: {species_count}\n"
-                f"Harmfulness Levels: {harmfulness}\n"
+                f"Total Records: {stats['records']}\n"
+                f"Species: {stats['species']}\n"
+                f"Harmfulness Levels: {stats['harmfulness']}\n"
             )
             return summary.strip()
         except Exception as e:
@@ -2897,18 +2980,7 @@ Ocean Biodiversity Information System (OBIS)
         data = nordic_results()
         if data.empty:
             return "No harmfulness data available"
-
-        try:
-            harmful_info = """
-Nordic Microalgae Database
-• Focus on Nordic freshwater microalgae
-• Harmfulness assessment for toxic species
-• Essential for water quality monitoring
-• Cyanobacteria and other harmful algae
-"""
-            return harmful_info.strip()
-        except Exception as e:
-            return f"Error: {str(e)}"
+        return _NORDIC_INFO
 
     @reactive.effect
     @reactive.event(input.nordic_clear_btn)
@@ -2971,7 +3043,7 @@ Nordic Microalgae Database
         """Display trait search results."""
         results = trait_search_results()
         if results.empty:
-            return pd.DataFrame({"Message": ["No results - perform a trait search"]})
+            return _EMPTY_MSG_TRAITS
 
         # Format the results for display
         display_df = results.copy()
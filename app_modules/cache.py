@@ -7,6 +7,7 @@ redundant API calls and database queries.
 
 from functools import wraps, lru_cache
 from typing import Any, Callable, Optional, Dict
+import threading
 import time
 import logging
 
@@ -18,7 +19,8 @@ class TTLCache:
     Time-To-Live cache that expires entries after a specified time.
 
     This is useful for API responses that may change over time but can be
-    cached for short periods to reduce API calls.
+    cached for short periods to reduce API calls. Entries are guarded by a lock,
+    so one cache can be shared by worker threads.
     """
 
     def __init__(self, ttl_seconds: int = 300):
@@ -30,6 +32,7 @@ class TTLCache:
         """
         self.ttl_seconds = ttl_seconds
         self._cache: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
 
     def get(self, key: str) -> Optional[Any]:
         """
@@ -41,15 +44,16 @@ class TTLCache:
         Returns:
             Cached value or None if not found/expired
         """
-        if key not in self._cache:
-            return None
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
 
-        entry = self._cache[key]
-        if time.time() - entry['timestamp'] > self.ttl_seconds:
-            # Entry expired, remove it
-            del self._cache[key]
-            logger.debug(f"Cache entry expired: {key}")
-            return None
+            if time.time() - entry["timestamp"] > self.ttl_seconds:
+                # Entry expired, remove it
+                del self._cache[key]
+                logger.debug(f"Cache entry expired: {key}")
+                return None
 
         logger.debug(f"Cache hit: {key}")
         return entry['value']
@@ -62,15 +66,14 @@ class TTLCache:
             key: Cache key
             value: Value to cache
         """
-        self._cache[key] = {
-            'value': value,
-            'timestamp': time.time()
-        }
+        with self._lock:
+            self._cache[key] = {"value": value, "timestamp": time.time()}
         logger.debug(f"Cache set: {key}")
 
     def clear(self) -> None:
         """Clear all cache entries."""
-        self._cache.clear()
+        with self._lock:
+            self._cache.clear()
         logger.info("Cache cleared")
 
     def size(self) -> int:
@@ -85,13 +88,15 @@ class TTLCache:
             Number of entries removed
         """
         current_time = time.time()
-        expired_keys = [
-            key for key, entry in self._cache.items()
-            if current_time - entry['timestamp'] > self.ttl_seconds
-        ]
+        with self._lock:
+            expired_keys = [
+                key
+                for key, entry in self._cache.items()
+                if current_time - entry["timestamp"] > self.ttl_seconds
+            ]
 
-        for key in expired_keys:
-            del self._cache[key]
+            for key in expired_keys:
+                del self._cache[key]
 
         if expired_keys:
             logger.info(f"Cleaned up {len(expired_keys)} expired cache entries")
@@ -148,6 +153,9 @@ def cached_with_ttl(ttl_seconds: int = 300):
 trait_cache = TTLCache(ttl_seconds=3600)  # 1 hour for trait data
 species_cache = TTLCache(ttl_seconds=600)  # 10 minutes for species searches
 occurrence_cache = TTLCache(ttl_seconds=300)  # 5 minutes for occurrence data
+size_summary_cache = TTLCache(
+    ttl_seconds=30 * 86400
+)  # 30 days for per-taxon size summaries
 
 
 def get_or_cache(cache: TTLCache, key: str, fetch_func: Callable, *args, **kwargs) -> Any:
@@ -186,6 +194,7 @@ def clear_all_caches():
     trait_cache.clear()
     species_cache.clear()
     occurrence_cache.clear()
+    size_summary_cache.clear()
     logger.info("All caches cleared")
 
 
@@ -197,16 +206,20 @@ def get_cache_stats() -> Dict[str, Any]:
         Dictionary with cache statistics
     """
     return {
-        'trait_cache': {
-            'size': trait_cache.size(),
-            'ttl_seconds': trait_cache.ttl_seconds
+        "trait_cache": {
+            "size": trait_cache.size(),
+            "ttl_seconds": trait_cache.ttl_seconds,
         },
-        'species_cache': {
-            'size': species_cache.size(),
-            'ttl_seconds': species_cache.ttl_seconds
+        "species_cache": {
+            "size": species_cache.size(),
+            "ttl_seconds": species_cache.ttl_seconds,
+        },
+        "occurrence_cache": {
+            "size": occurrence_cache.size(),
+            "ttl_seconds": occurrence_cache.ttl_seconds,
+        },
+        "size_summary_cache": {
+            "size": size_summary_cache.size(),
+            "ttl_seconds": size_summary_cache.ttl_seconds,
         },
-        'occurrence_cache': {
-            'size': occurrence_cache.size(),
-            'ttl_seconds': occurrence_cache.ttl_seconds
-        }
     }
@@ -1,31 +1,82 @@
+"""Probe the AlgaeBase website for API information.
+
+Usage:
+  python check_algaebase.py
+
+Results are written to algaebase_probe.json so consumers can read the last
+probe instead of hitting algaebase.org again.
+"""
+
+import json
 import logging
 import re
+from pathlib import Path
+from typing import Any, Dict
 
 import requests
 
 logger = logging.getLogger(__name__)
 
-# Check AlgaeBase main site for API information
-response = requests.get("https://www.algaebase.org/", timeout=10)
-logger.info("AlgaeBase main site status: %s", response.status_code)
-if response.status_code == 200:
-    content = response.text.lower()
-    if "api" in content:
-        logger.info("API mentioned on main site")
-        # Look for API links
-        api_links = re.findall(r'href="([^"]*api[^"]*)"', content)
-        logger.info("Potential API links: %s", api_links[:5])
-    else:
-        logger.info("No API mentioned on main site")
-
-# Also check if there's a search API
-search_url = "https://www.algaebase.org/search/?q=test"
-try:
-    response = requests.get(search_url, timeout=10)
-    logger.info("Search URL status: %s", response.status_code)
-    if "json" in response.headers.get("content-type", ""):
-        logger.info("Search returns JSON")
-    else:
-        logger.info("Search returns HTML")
-except Exception as e:
-    logger.error("Search error: %s", e)
+PROBE_OUTPUT = Path("algaebase_probe.json")
+
+# Compiled once and matched case-insensitively against the raw response bytes,
+# so the page never needs to be decoded and lowercased as a whole.
+_API_RE = re.compile(rb"api", re.IGNORECASE)
+_API_HREF_RE = re.compile(rb'href="([^"]*api[^"]*)"', re.IGNORECASE)
+
+
+def probe_algaebase() -> Dict[str, Any]:
+    """Check the AlgaeBase main site and search endpoint for API hints."""
+    result: Dict[str, Any] = {
+        "status": None,
+        "api_mentioned": False,
+        "api_links": [],
+        "search_status": None,
+        "search_returns_json": None,
+    }
+
+    # Check AlgaeBase main site for API information
+    response = requests.get("https://www.algaebase.org/", timeout=10)
+    result["status"] = response.status_code
+    logger.info("AlgaeBase main site status: %s", response.status_code)
+    if response.status_code == 200:
+        content = response.content
+        if _API_RE.search(content):
+            result["api_mentioned"] = True
+            logger.info("API mentioned on main site")
+            # Look for API links; decode only the matched hrefs
+            api_links = _API_HREF_RE.findall(content)[:5]
+            result["api_links"] = [
+                link.decode("ascii", "replace") for link in api_links
+            ]
+            logger.info("Potential API links: %s", result["api_links"])
+        else:
+            logger.info("No API mentioned on main site")
+
+    # Also check if there's a search API
+    search_url = "https://www.algaebase.org/search/?q=test"
+    try:
+        response = requests.get(search_url, timeout=10)
+        result["search_status"] = response.status_code
+        logger.info("Search URL status: %s", response.status_code)
+        if "json" in response.headers.get("content-type", ""):
+            result["search_returns_json"] = True
+            logger.info("Search returns JSON")
+        else:
+            result["search_returns_json"] = False
+            logger.info("Search returns HTML")
+    except Exception as e:
+        logger.error("Search error: %s", e)
+
+    return result
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    result = probe_algaebase()
+    PROBE_OUTPUT.write_text(json.dumps(result, indent=2))
+    logger.info("Probe results written to %s", PROBE_OUTPUT)
+
+
+if __name__ == "__main__":
+    main()
@@ -11,15 +11,28 @@ except Exception:
     _HAS_PYGBIF = False
 
 import logging
+from typing import Optional
+
+import requests
+
+from app_modules.cache import get_or_cache, occurrence_cache, species_cache
 
 logger = logging.getLogger(__name__)
 
+GBIF_API_URL = "https://api.gbif.org/v1"
+GBIF_TIMEOUT = 30
+
 
 class GBIFClient:
-    def __init__(self):
+
+    def __init__(self, session: Optional[requests.Session] = None):
         if not _HAS_PYGBIF:
             logger.warning("pygbif not installed; GBIF methods will return defaults")
 
+        # Keep-alive session for endpoints called directly rather than through
+        # pygbif, which opens a new connection for every request
+        self.session = session if session is not None else requests.Session()
+
     def search_species(self, name: str, limit: int = 10) -> list:
         """
         Search for species by name.
@@ -42,12 +55,21 @@ class GBIFClient:
             return []
 
         try:
-            result = species.name_suggest(q=name, limit=limit)
-            return result if result else []
+            # GBIF name matching is case-insensitive, so normalise the key
+            key = f"gbif:suggest:{str(name).strip().lower()}:{limit}"
+            suggestions: list = get_or_cache(
+                species_cache, key, self._name_suggest, name, limit
+            )
+            return suggestions
         except Exception as e:
             logger.error(f"Error searching for species '{name}': {e}")
             raise
 
+    @staticmethod
+    def _name_suggest(name: str, limit: int) -> list:
+        result = species.name_suggest(q=name, limit=limit)
+        return result if result else []
+
     def get_species_info(self, taxon_key: int) -> dict:
         """
         Get detailed species information.
@@ -69,8 +91,11 @@ class GBIFClient:
             return None
 
         try:
-            result = species.name_usage(key=taxon_key)
-            return result
+            return get_or_cache(
+                species_cache,
+                f"gbif:usage:{taxon_key}",
+                lambda: species.name_usage(key=taxon_key),
+            )
         except Exception as e:
             logger.error(f"Error getting species info for taxon_key {taxon_key}: {e}")
             raise
@@ -114,16 +139,28 @@ class GBIFClient:
         Returns:
             Integer count or 0 on error
         """
-        if not _HAS_PYGBIF:
-            logger.debug("pygbif missing; get_occurrence_count=0 for %s", taxon_key)
-            return 0
+        key = f"gbif:count:{taxon_key}:{country}"
+        cached = occurrence_cache.get(key)
+        if cached is not None:
+            return cached
 
         try:
-            result = occurrences.search(taxonKey=taxon_key, country=country, limit=0)
-            return result.get("count", 0) if result else 0
+            # A limit=0 search only returns the count, so query the REST endpoint
+            # directly over the pooled session
+            response = self.session.get(
+                f"{GBIF_API_URL}/occurrence/search",
+                params={"taxonKey": taxon_key, "country": country, "limit": 0},
+                timeout=GBIF_TIMEOUT,
+            )
+            response.raise_for_status()
+            result = response.json()
+            count = result.get("count", 0) if result else 0
         except Exception as e:
             logger.error("Error getting occurrence count: %s", e)
             return 0
+        # Only successful lookups are cached; errors fall through to 0 uncached
+        occurrence_cache.set(key, count)
+        return count
 
     def get_datasets(self, limit: int = 10) -> list:
         """
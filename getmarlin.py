@@ -1,13 +1,16 @@
+import argparse
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
+from lxml import html as lxml_html
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from tqdm import tqdm
 import re
 import time
 import threading
 import os
-import sys
 
 INPUT_EXCEL = "species.xlsx"
 OUTPUT_EXCEL = "species_enriched.xlsx"
@@ -15,48 +18,77 @@ URL_COLUMN = "url"
 
 MAX_WORKERS = 6
 REQUEST_TIMEOUT = 20
-DELAY_BETWEEN_TASKS = 0.2
+DELAY_BETWEEN_TASKS = 0.2  # minimum gap between request starts, across workers
 
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (compatible; FWE-Biology-Table-Scraper/1.2)"
 }
 
-print_lock = threading.Lock()
-last_debug_lines = 0
-
-
-def clear_last_lines(n):
-    for _ in range(n):
-        sys.stdout.write("\033[F\033[K")
-
-
+# One keep-alive connection pool shared by all workers, with retries for
+# transient server errors and rate limiting
+SESSION = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=MAX_WORKERS,
+    pool_maxsize=MAX_WORKERS,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        respect_retry_after_header=True,
+    ),
+)
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
+
+_rate_lock = threading.Lock()
+_next_request_at = 0.0
+
+_PUNCT_RE = re.compile(r"[^\w\s]")
+_WS_RE = re.compile(r"\s+")
+
+HEADING_TAGS = ("h1", "h2", "h3", "h4")
+_HEADINGS_XPATH = "//*[" + " or ".join(f"self::{t}" for t in HEADING_TAGS) + "]"
+
+
+@lru_cache(maxsize=4096)
 def normalize_column(name: str) -> str:
+    # Parameter names repeat across species pages, so results are cached
     name = name.lower().strip()
-    name = re.sub(r"[^\w\s]", "", name)
-    name = re.sub(r"\s+", "_", name)
+    name = _PUNCT_RE.sub("", name)
+    name = _WS_RE.sub("_", name)
     return f"biology_{name}"
 
 
-def extract_species_name(soup: BeautifulSoup) -> str:
-    if soup.find("h1"):
-        return soup.find("h1").get_text(strip=True)
-    if soup.title:
-        return soup.title.get_text(strip=True)
+def element_text(element, sep: str = "") -> str:
+    """Join the stripped, non-empty text fragments of an element."""
+    return sep.join(t.strip() for t in element.itertext() if t.strip())
+
+
+def extract_species_name(tree: lxml_html.HtmlElement) -> str:
+    h1 = tree.find(".//h1")
+    if h1 is not None:
+        return element_text(h1)
+    title = tree.find(".//title")
+    if title is not None:
+        return element_text(title)
     return "Unknown species"
 
 
-def find_biology_header(soup: BeautifulSoup):
-    for h in soup.find_all(["h1", "h2", "h3", "h4"]):
-        if h.get_text(strip=True).lower() == "biology":
+def find_biology_header(tree: lxml_html.HtmlElement):
+    for h in tree.xpath(_HEADINGS_XPATH):
+        if element_text(h).lower() == "biology":
             return h
     return None
 
 
 def extract_biology_table(biology_header):
-    for sib in biology_header.find_next_siblings():
-        if sib.name in ["h1", "h2", "h3", "h4"]:
+    for sib in biology_header.itersiblings():
+        if not isinstance(sib.tag, str):
+            # skip comments and processing instructions
+            continue
+        if sib.tag in HEADING_TAGS:
             break
-        if sib.name == "table":
+        if sib.tag == "table":
             return sib
     return None
 
@@ -65,13 +97,13 @@ def parse_biology_table(table):
     data = {}
     parameters = []
 
-    for row in table.find_all("tr"):
-        cells = row.find_all(["td", "th"])
+    for row in table.iter("tr"):
+        cells = row.xpath(".//td|.//th")
         if len(cells) < 2:
             continue
 
-        param = cells[0].get_text(" ", strip=True)
-        value = cells[1].get_text(" ", strip=True)
+        param = element_text(cells[0], " ")
+        value = element_text(cells[1], " ")
 
         if not param or param.lower() == "parameter":
             continue
@@ -82,77 +114,93 @@ def parse_biology_table(table):
     return data, parameters
 
 
-def update_debug_display(species, parameters):
-    global last_debug_lines
-
-    with print_lock:
-        clear_last_lines(last_debug_lines)
-
-        lines = []
-        lines.append("🔍 CURRENT SPECIES")
-        lines.append(f"   {species}")
-        lines.append("")
-        lines.append(f"📋 Biology parameters found ({len(parameters)}):")
-
-        if parameters:
-            for p in parameters:
-                lines.append(f"   • {p}")
-        else:
-            lines.append("   (none)")
+def wait_for_request_slot():
+    """Space request starts DELAY_BETWEEN_TASKS apart across all workers."""
+    global _next_request_at
 
-        for line in lines:
-            print(line)
-
-        last_debug_lines = len(lines)
+    with _rate_lock:
+        now = time.monotonic()
+        wait = _next_request_at - now
+        _next_request_at = max(now, _next_request_at) + DELAY_BETWEEN_TASKS
+    if wait > 0:
+        time.sleep(wait)
 
 
 def scrape_species(url: str):
+    """Return (biology data, species name, parameter names) for one page."""
     try:
-        response = requests.get(url, headers=HEADERS, timeout=REQUEST_TIMEOUT)
+        wait_for_request_slot()
+        response = SESSION.get(url, headers=HEADERS, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
 
-        soup = BeautifulSoup(response.text, "lxml")
-        species = extract_species_name(soup)
+        # Parse the raw bytes so lxml honours the page's declared charset
+        tree = lxml_html.document_fromstring(response.content)
+        species = extract_species_name(tree)
 
-        biology_header = find_biology_header(soup)
-        if not biology_header:
-            update_debug_display(species, [])
-            return {}
+        biology_header = find_biology_header(tree)
+        if biology_header is None:
+            return {}, species, []
 
         table = extract_biology_table(biology_header)
-        if not table:
-            update_debug_display(species, [])
-            return {}
+        if table is None:
+            return {}, species, []
 
         data, parameters = parse_biology_table(table)
-        update_debug_display(species, parameters)
+        return data, species, parameters
+
+    except Exception:
+        return {}, "ERROR", []
 
-        return data
 
+def load_species_sheet(path: str) -> pd.DataFrame:
+    """Read the input sheet, reusing a Parquet copy while the workbook is unchanged."""
+    cache_path = f"{path}.parquet"
+    try:
+        if os.path.getmtime(cache_path) >= os.path.getmtime(path):
+            return pd.read_parquet(cache_path)
     except Exception:
-        update_debug_display("ERROR", [])
-        return {}
+        # No cache yet, or no Parquet engine installed
+        pass
+
+    df = pd.read_excel(path, engine="openpyxl")
+    try:
+        df.to_parquet(cache_path, index=False)
+    except Exception:
+        # Parquet needs pyarrow/fastparquet and Arrow-compatible columns
+        pass
+    return df
 
 
 def main():
-    df = pd.read_excel(INPUT_EXCEL)
+    parser = argparse.ArgumentParser(
+        description="Add MarLIN biology tables to a species sheet"
+    )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="list the biology parameters found per species",
+    )
+    args = parser.parse_args()
+
+    df = load_species_sheet(INPUT_EXCEL)
 
     if URL_COLUMN not in df.columns:
         raise ValueError(f"Column '{URL_COLUMN}' not found")
 
-    results = []
-
     with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-        futures = {
-            executor.submit(scrape_species, url): url
-            for url in df[URL_COLUMN]
-        }
+        futures = [executor.submit(scrape_species, url) for url in df[URL_COLUMN]]
 
         with tqdm(total=len(futures), desc="Scraping species", leave=True) as pbar:
             for future in as_completed(futures):
-                results.append(future.result())
+                _, species, parameters = future.result()
+                pbar.set_postfix_str(species[:40])
+                if args.verbose:
+                    found = ", ".join(parameters) if parameters else "(none)"
+                    tqdm.write(f"🔍 {species}: {found}")
                 pbar.update(1)
-                time.sleep(DELAY_BETWEEN_TASKS)
+
+    # Collect in input order so each result lines up with its spreadsheet row
+    results = [future.result()[0] for future in futures]
 
     biology_df = pd.DataFrame(results)
     df_out = pd.concat([df.reset_index(drop=True), biology_df], axis=1)
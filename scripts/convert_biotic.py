@@ -1,11 +1,11 @@
 """Convert BIOTIC multi-score rows into long Darwin Core trait rows and optional RDF (Turtle).
 
 Usage:
-    python scripts/convert_biotic.py --input <input_csv> --mapping <biotic_to_schema_mapping.csv> --out-csv <out_long_csv> [--out-ttl <out_ttl>]
+    python scripts/convert_biotic.py --input <input_csv> --mapping <biotic_to_schema_mapping.csv> --out-csv <out_long_csv> [--out-ttl <out_ttl>] [--strict-ttl]
 
 Features:
 - Expands BIOTIC score columns (0-3) into separate Darwin Core-style trait rows.
-- If available, produces a Turtle file using `rdflib` and stores per-taxon JSON in `dwc:dynamicProperties` summarizing BIOTIC scores and mapped ECO URIs.
+- Optionally produces a Turtle file with per-taxon trait resources linked to mapped ECO URIs. The Turtle is written directly as text; `--strict-ttl` builds and serializes it with `rdflib` instead (when installed), which validates every term.
 - Keeps provenance fields (measurementMethod, evidence, source_reference, timestamp) in output rows.
 
 The script is conservative and depends on the `biotic_to_schema_mapping.csv` to discover which input columns correspond to BIOTIC scores.
@@ -14,25 +14,50 @@ The script is conservative and depends on the `biotic_to_schema_mapping.csv` to
 from __future__ import annotations
 
 import argparse
-import csv
 import json
 import logging
 import os
-from collections import defaultdict
-from typing import Dict, List
+from typing import Dict, Iterable, Iterator, List, Tuple, Union
 
 import pandas as pd
 
 logger = logging.getLogger(__name__)
 
 try:
-    from rdflib import Graph, Literal, Namespace, URIRef, BNode, RDF, RDFS
+    from rdflib import Graph, Literal, Namespace, URIRef
+
     RDF_AVAILABLE = True
 except Exception:
     RDF_AVAILABLE = False
 
+try:
+    import pyarrow  # noqa: F401
+
+    # pyarrow's multithreaded CSV reader; used where no C-engine-only options are needed
+    CSV_ENGINE = "pyarrow"
+except ImportError:
+    CSV_ENGINE = "c"
+
 DWC = "http://rs.tdwg.org/dwc/terms/"
 EX = "http://example.org/"
+RO = "http://purl.obolibrary.org/obo/RO_"
+ECO = "http://purl.obolibrary.org/obo/ECO_"
+FOODON = "http://purl.obolibrary.org/obo/FOODON_"
+PROV = "http://www.w3.org/ns/prov#"
+DCTERMS = "http://purl.org/dc/terms/"
+RDFS_NS = "http://www.w3.org/2000/01/rdf-schema#"
+RDF_TYPE = "http://www.w3.org/1999/02/22-rdf-syntax-ns#type"
+
+TTL_PREFIXES = {
+    "dwc": DWC,
+    "ex": EX,
+    "ro": RO,
+    "eco": ECO,
+    "foodon": FOODON,
+    "prov": PROV,
+    "dcterms": DCTERMS,
+    "rdfs": RDFS_NS,
+}
 
 LONG_HEADER = [
     "taxonID",
@@ -48,18 +73,57 @@ LONG_HEADER = [
     "timestamp",
 ]
 
+# Input columns copied onto every output trait row
+ROW_COLUMNS = [
+    "taxonID",
+    "scientificName",
+    "measurementMethod",
+    "evidence",
+    "source_reference",
+    "timestamp",
+    "feeding_mode_term_uri",
+    "food_item_uri",
+    "relation_uri",
+]
+
+# Trait columns read by _iter_trait_triples (traitValue is exposed as "score")
+TTL_TRAIT_COLUMNS = [
+    "traitName",
+    "traitURI",
+    "traitValue",
+    "measurementMethod",
+    "evidence",
+    "source_reference",
+    "food_item_uri",
+    "relation_uri",
+]
+
 
 def load_biotic_mapping(mapping_csv: str) -> List[Dict]:
-    df = pd.read_csv(mapping_csv, comment="#")
+    # The mapping file uses '#' comments, which only the C engine supports
+    df = pd.read_csv(
+        mapping_csv,
+        comment="#",
+        dtype={
+            "biotic_category": str,
+            "schema_field": str,
+            "mapped_term_uri": str,
+            "default_score": "Int64",
+        },
+    )
     mappings = []
-    for _, row in df.iterrows():
+    for row in df.itertuples(index=False):
         # required columns: biotic_category, schema_field, mapped_term_uri
+        term_uri = getattr(row, "mapped_term_uri", None)
+        default_score = getattr(row, "default_score", None)
         mappings.append(
             {
-                "biotic_category": str(row.get("biotic_category")),
-                "schema_field": str(row.get("schema_field")),
-                "mapped_term_uri": row.get("mapped_term_uri") if not pd.isna(row.get("mapped_term_uri")) else None,
-                "default_score": int(row.get("default_score")) if not pd.isna(row.get("default_score")) else None,
+                "biotic_category": str(getattr(row, "biotic_category", None)),
+                "schema_field": str(getattr(row, "schema_field", None)),
+                "mapped_term_uri": term_uri if not pd.isna(term_uri) else None,
+                "default_score": (
+                    int(default_score) if not pd.isna(default_score) else None
+                ),
             }
         )
     return mappings
@@ -74,16 +138,186 @@ def load_vocab(vocab_csv: str):
     except Exception:
         return {}
     vocab = {}
-    for _, row in df.iterrows():
-        field = row.get("field")
-        label = row.get("label")
-        uri = row.get("uri") if not pd.isna(row.get("uri")) else None
+    # Read each column once; a missing column reads as all None
+    columns = [
+        df[name].tolist() if name in df.columns else [None] * len(df)
+        for name in ("field", "label", "uri")
+    ]
+    for field, label, uri in zip(*columns, strict=True):
         if not field or not label:
             continue
         vocab.setdefault(field, {})[label] = uri
     return vocab
 
 
+def _integer_scores(values: pd.Series) -> pd.Series:
+    """Parse a score column to numbers; blanks and non-integers become NaN.
+
+    Only plain integer strings are accepted, as int() would: "1.0" or "1e0"
+    are skipped rather than read as 1.
+    """
+    values = values.str.strip()
+    integers = values.where(values.str.fullmatch(r"[+-]?\d+", na=False))
+    return pd.to_numeric(integers, errors="coerce")
+
+
+# (subject, predicate, object, object_is_literal); only literal objects may be ints
+Triple = Tuple[str, str, Union[str, int], bool]
+
+
+def _provenance_triples(
+    trait_uri: str, activity: str, method_label: str, method_uri: str | None
+) -> Iterator[Triple]:
+    """Link a trait to the activity (measurement method) that generated it."""
+    yield trait_uri, PROV + "wasGeneratedBy", activity, False
+    yield activity, RDFS_NS + "label", method_label, True
+    # if vocab provides a URI for the method, link activity to it using prov:used
+    if method_uri:
+        yield activity, PROV + "used", method_uri, False
+
+
+def _food_link_triples(
+    subj: str, trait_uri: str, trait: Dict, food_links: set
+) -> Iterator[Triple]:
+    """Link a trait and, once per (relation, food), its taxon to a food item."""
+    food = trait.get("food_item_uri")
+    if not food:
+        return
+    rel_p = trait.get("relation_uri") or RO + "0002470"
+    yield trait_uri, rel_p, food, False
+    if (rel_p, food) not in food_links:
+        food_links.add((rel_p, food))
+        yield subj, rel_p, food, False
+
+
+def _iter_trait_triples(
+    per_taxon_traits: Dict[str, List[Dict]],
+    per_taxon_names: Dict[str, str],
+    vocab: Dict,
+    publisher: str | None,
+    dataset_date: str | None,
+) -> Iterator[Triple]:
+    """Yield ``(subject, predicate, object, object_is_literal)`` for the TTL export.
+
+    Subjects, predicates and IRI objects are plain strings, so the same
+    triples can be written as text or loaded into an rdflib graph.
+    """
+    sci_name_p = DWC + "scientificName"
+    has_trait_p = EX + "hasTrait"
+    score_p = EX + "score"
+    label_p = RDFS_NS + "label"
+    description_p = DCTERMS + "description"
+    source_p = DCTERMS + "source"
+    publisher_p = DCTERMS + "publisher"
+    date_p = DCTERMS + "date"
+    method_uris = vocab.get("measurementMethod", {}) if vocab else {}
+
+    for taxon, traits in per_taxon_traits.items():
+        subj = f"urn:taxon:{taxon}"
+        # add scientific name if available
+        yield subj, sci_name_p, per_taxon_names.get(taxon, "") or "", True
+
+        food_links: set = set()
+        # richer, fully normalized trait resources
+        for idx, t in enumerate(traits, start=1):
+            trait_uri = f"{EX}trait/{taxon}/{idx}"
+            yield subj, has_trait_p, trait_uri, False
+            # label and type
+            if t.get("traitName"):
+                yield trait_uri, label_p, t["traitName"], True
+            if t.get("traitURI"):
+                yield trait_uri, RDF_TYPE, t["traitURI"], False
+            # score
+            score = t.get("score")
+            if score is not None:
+                yield trait_uri, score_p, int(score), True
+            # provenance: use PROV and DCTERMS for source
+            method_label = t.get("measurementMethod")
+            if method_label:
+                yield from _provenance_triples(
+                    trait_uri,
+                    f"{EX}activity/{taxon}/{idx}",
+                    method_label,
+                    method_uris.get(method_label),
+                )
+            # evidence, source and (if provided) publisher/date at trait level
+            for pred, value in (
+                (description_p, t.get("evidence")),
+                (source_p, t.get("source_reference")),
+                (publisher_p, publisher),
+                (date_p, dataset_date),
+            ):
+                if value:
+                    yield trait_uri, pred, value, True
+            # optionally link to food items (trait-level and taxon-level relations)
+            yield from _food_link_triples(subj, trait_uri, t, food_links)
+
+
+# Characters that may not appear raw inside a Turtle IRIREF or string literal
+_TTL_IRI_ESCAPES = {c: f"%{c:02X}" for c in [*range(0x21), *map(ord, '<>"{}|^`\\')]}
+_TTL_STRING_ESCAPES = str.maketrans(
+    {"\\": "\\\\", '"': '\\"', "\n": "\\n", "\r": "\\r", "\t": "\\t"}
+)
+
+
+def _write_ttl_fast(out_ttl: str, triples: Iterable[Triple]) -> None:
+    """Write triples as Turtle text, one statement per line."""
+    # Predicates come from a small fixed set, so their Turtle form is memoized
+    predicate_names = {RDF_TYPE: "a"}
+
+    def predicate(iri: str) -> str:
+        name = predicate_names.get(iri)
+        if name is None:
+            name = f"<{iri.translate(_TTL_IRI_ESCAPES)}>"
+            for prefix, ns in TTL_PREFIXES.items():
+                local = iri[len(ns) :]
+                if iri.startswith(ns) and local.isidentifier():
+                    name = f"{prefix}:{local}"
+                    break
+            predicate_names[iri] = name
+        return name
+
+    with open(out_ttl, "w", encoding="utf-8") as fh:
+        for prefix, ns in TTL_PREFIXES.items():
+            fh.write(f"@prefix {prefix}: <{ns}> .\n")
+        fh.write("\n")
+        last_subj = subj_ref = None
+        for subj, pred, obj, is_literal in triples:
+            # Triples arrive grouped by subject, so reuse its escaped form
+            if subj != last_subj:
+                last_subj, subj_ref = subj, f"<{subj.translate(_TTL_IRI_ESCAPES)}>"
+            if isinstance(obj, int):
+                obj_ref = str(obj)
+            elif is_literal:
+                obj_ref = f'"{obj.translate(_TTL_STRING_ESCAPES)}"'
+            else:
+                obj_ref = f"<{obj.translate(_TTL_IRI_ESCAPES)}>"
+            fh.write(f"{subj_ref} {predicate(pred)} {obj_ref} .\n")
+
+
+def _write_ttl_rdflib(out_ttl: str, triples: Iterable[Triple]) -> None:
+    """Build an rdflib graph from the triples and serialize it as Turtle."""
+    g = Graph()
+    for prefix, ns in TTL_PREFIXES.items():
+        g.bind(prefix, Namespace(ns))
+
+    # Predicates, trait/method/food URIs and each trait's subject repeat across
+    # triples; build each URIRef once and reuse the same object
+    iris: Dict[str, URIRef] = {}
+
+    def iri(value: str) -> URIRef:
+        ref = iris.get(value)
+        if ref is None:
+            ref = iris[value] = URIRef(value)
+        return ref
+
+    g.addN(
+        (iri(subj), iri(pred), Literal(obj) if is_literal else iri(str(obj)), g)
+        for subj, pred, obj, is_literal in triples
+    )
+    g.serialize(destination=out_ttl, format="turtle")
+
+
 def expand_biotic_rows(
     input_csv: str,
     mapping_csv: str,
@@ -92,198 +326,98 @@ def expand_biotic_rows(
     vocab_csv: str | None = None,
     publisher: str | None = None,
     dataset_date: str | None = None,
+    strict_ttl: bool = False,
 ) -> Dict:
-    df = pd.read_csv(input_csv, dtype=str, keep_default_na=False)
+    df = pd.read_csv(input_csv, dtype=str, keep_default_na=False, engine=CSV_ENGINE)
     mappings = load_biotic_mapping(mapping_csv)
     vocab = load_vocab(vocab_csv) if vocab_csv else {}
 
-    out_rows = []
-    per_taxon_traits = defaultdict(list)
-    per_taxon_names = {}  # map taxon id/name to scientificName for TTL labels
-
-    for _, row in df.iterrows():
-        taxonID = row.get("taxonID", "")
-        scientificName = row.get("scientificName", "")
-        measurementMethod = row.get("measurementMethod", "")
-        evidence = row.get("evidence", "")
-        source_reference = row.get("source_reference", "")
-        timestamp = row.get("timestamp", "")
-        # remember a display name for TTL output
-        per_taxon_names[taxonID or scientificName] = scientificName
-
-        # Also support a generic dominant feeding mode column
-        dominant_score = None
-        dominant_term_uri = row.get("feeding_mode_term_uri") if row.get("feeding_mode_term_uri") else None
-        if row.get("feeding_mode_score"):
-            try:
-                dominant_score = int(row.get("feeding_mode_score"))
-            except Exception:
-                dominant_score = None
-
-        # For each BIOTIC mapping entry, extract the score column and produce trait rows if score > 0
-        for m in mappings:
-            col = m["schema_field"]
-            if col not in df.columns:
-                continue
-            val = row.get(col, "").strip()
-            if val == "":
-                continue
-            try:
-                score = int(val)
-            except Exception:
-                # skip non-numeric
-                continue
-            if score <= 0:
-                continue
-
-            trait_row = {
-                "taxonID": taxonID,
-                "scientificName": scientificName,
-                "traitName": "feeding_mode",
-                "traitValue": score,
-                "traitUnit": "",
-                "traitURI": m.get("mapped_term_uri") or "",
-                "traitScope": "organism_level",
-                "measurementMethod": measurementMethod,
-                "evidence": evidence,
-                "source_reference": source_reference,
-                "timestamp": timestamp,
-            }
-            out_rows.append(trait_row)
-
-            # add to per-taxon traits list (rich info for RDF)
-            per_taxon_traits[taxonID or scientificName].append({
-                "biotic_category": m["biotic_category"],
-                "score": score,
-                "term": m.get("mapped_term_uri"),
-                "traitName": "feeding_mode",
-                "traitURI": m.get("mapped_term_uri"),
-                "traitValue": score,
-                "measurementMethod": measurementMethod,
-                "evidence": evidence,
-                "source_reference": source_reference,
-                "timestamp": timestamp,
-                "food_item_uri": row.get("food_item_uri", "") if "food_item_uri" in row else "",
-                "relation_uri": row.get("relation_uri", "") if "relation_uri" in row else "",
-            })
-
-        # If a dominant mode is present, also create a dominant trait row
-        if dominant_score and dominant_score > 0 and dominant_term_uri:
-            trait_row = {
-                "taxonID": taxonID,
-                "scientificName": scientificName,
-                "traitName": "feeding_mode_dominant",
-                "traitValue": dominant_score,
-                "traitUnit": "",
-                "traitURI": dominant_term_uri,
-                "traitScope": "organism_level",
-                "measurementMethod": measurementMethod,
-                "evidence": evidence,
-                "source_reference": source_reference,
-                "timestamp": timestamp,
-            }
-            out_rows.append(trait_row)
-
-            per_taxon_traits[taxonID or scientificName].append({
-                "biotic_category": "dominant",
-                "score": dominant_score,
-                "term": dominant_term_uri,
-                "traitName": "feeding_mode_dominant",
-                "traitURI": dominant_term_uri,
-                "traitValue": dominant_score,
-                "measurementMethod": measurementMethod,
-                "evidence": evidence,
-                "source_reference": source_reference,
-                "timestamp": timestamp,
-                "food_item_uri": row.get("food_item_uri", "") if "food_item_uri" in row else "",
-                "relation_uri": row.get("relation_uri", "") if "relation_uri" in row else "",
-            })
+    # Only mappings whose score column is present in the input produce traits
+    present = set(df.columns)
+    missing = [m["schema_field"] for m in mappings if m["schema_field"] not in present]
+    if missing:
+        logger.debug("Input has no column for mapped fields: %s", ", ".join(missing))
+    mappings = [m for m in mappings if m["schema_field"] in present]
+
+    # Per-row values carried onto every trait row; absent columns read as ""
+    base = df.reindex(columns=ROW_COLUMNS, fill_value="")
+    taxon_keys = base["taxonID"].where(base["taxonID"] != "", base["scientificName"])
+    # remember a display name for TTL output (last row per taxon wins)
+    per_taxon_names = dict(zip(taxon_keys, base["scientificName"], strict=True))
+
+    # One vectorized pass per BIOTIC score column: keep rows scoring > 0
+    frames = []
+    for order, m in enumerate(mappings):
+        scores = _integer_scores(df[m["schema_field"]])
+        mask = scores > 0
+        if mask.any():
+            term = m.get("mapped_term_uri")
+            frames.append(
+                base.loc[mask].assign(
+                    traitName="feeding_mode",
+                    traitValue=scores[mask].astype(int),
+                    traitURI=term or "",
+                    biotic_category=m["biotic_category"],
+                    term=term,
+                    _order=order,
+                )
+            )
+
+    # Also support a generic dominant feeding mode column
+    if "feeding_mode_score" in df.columns:
+        scores = _integer_scores(df["feeding_mode_score"])
+        term_uris = base["feeding_mode_term_uri"]
+        mask = (scores > 0) & (term_uris != "")
+        if mask.any():
+            frames.append(
+                base.loc[mask].assign(
+                    traitName="feeding_mode_dominant",
+                    traitValue=scores[mask].astype(int),
+                    traitURI=term_uris[mask],
+                    biotic_category="dominant",
+                    term=term_uris[mask],
+                    _order=len(mappings),
+                )
+            )
+
+    if frames:
+        # Restore input row order, with each row's trait_rows in mapping order
+        trait_rows = pd.concat(frames)
+        trait_rows = trait_rows.assign(_row=trait_rows.index).sort_values(
+            ["_row", "_order"], kind="stable"
+        )
+    else:
+        trait_rows = base.iloc[0:0].assign(
+            traitName="", traitValue=0, traitURI="", biotic_category="", term=None
+        )
+    trait_rows = trait_rows.assign(traitUnit="", traitScope="organism_level")
 
     # write out CSV
-    with open(out_csv, "w", newline="", encoding="utf-8") as fh:
-        writer = csv.DictWriter(fh, fieldnames=LONG_HEADER)
-        writer.writeheader()
-        for r in out_rows:
-            writer.writerow({k: r.get(k, "") for k in LONG_HEADER})
+    trait_rows.to_csv(out_csv, columns=LONG_HEADER, index=False)
+
+    row_taxa = taxon_keys.loc[trait_rows.index].to_numpy()
 
-    # Optionally produce Turtle using rdflib (rich triples)
+    # Optionally produce Turtle (rich triples)
     if out_ttl:
-        if not RDF_AVAILABLE:
-            logger.warning("rdflib not installed; skipping TTL generation")
+        # per-taxon traits list (rich info for RDF), only built for TTL output
+        ttl_traits = trait_rows[TTL_TRAIT_COLUMNS].rename(
+            columns={"traitValue": "score"}
+        )
+        per_taxon_traits = {
+            taxon: group.to_dict("records")
+            for taxon, group in ttl_traits.groupby(row_taxa, sort=False)
+        }
+        triples = _iter_trait_triples(
+            per_taxon_traits, per_taxon_names, vocab, publisher, dataset_date
+        )
+        if strict_ttl and RDF_AVAILABLE:
+            _write_ttl_rdflib(out_ttl, triples)
         else:
-            g = Graph()
-            DWCN = Namespace(DWC)
-            EXN = Namespace(EX)
-            RON = Namespace("http://purl.obolibrary.org/obo/RO_")
-            ECON = Namespace("http://purl.obolibrary.org/obo/ECO_")
-            FOODONN = Namespace("http://purl.obolibrary.org/obo/FOODON_")
-            PROV = Namespace("http://www.w3.org/ns/prov#")
-            DCT = Namespace("http://purl.org/dc/terms/")
-            RDFS = Namespace("http://www.w3.org/2000/01/rdf-schema#")
-            g.bind("dwc", DWCN)
-            g.bind("ex", EXN)
-            g.bind("ro", RON)
-            g.bind("eco", ECON)
-            g.bind("foodon", FOODONN)
-            g.bind("prov", PROV)
-            g.bind("dcterms", DCT)
-            g.bind("rdfs", RDFS)
-
-            for taxon, traits in per_taxon_traits.items():
-                subj = URIRef(f"urn:taxon:{taxon}")
-                # add scientific name if available
-                sciname = per_taxon_names.get(taxon, "")
-                if sciname:
-                    g.add((subj, URIRef(DWC + "scientificName"), Literal(sciname)))
-                else:
-                    g.add((subj, URIRef(DWC + "scientificName"), Literal("")))
-
-                # richer, fully normalized trait resources
-                for idx, t in enumerate(traits, start=1):
-                    trait_uri = URIRef(f"{EX}trait/{taxon}/{idx}")
-                    g.add((subj, EXN.hasTrait, trait_uri))
-                    # label and type
-                    if t.get("traitName"):
-                        g.add((trait_uri, RDFS.label, Literal(t.get("traitName"))))
-                    if t.get("traitURI"):
-                        g.add((trait_uri, RDF.type, URIRef(t.get("traitURI"))))
-                    # score
-                    if t.get("score") is not None:
-                        g.add((trait_uri, EXN.score, Literal(int(t.get("score")))))
-                    # provenance: use PROV and DCTERMS for source
-                    if t.get("measurementMethod"):
-                        activity = URIRef(f"{EX}activity/{taxon}/{idx}")
-                        g.add((trait_uri, PROV.wasGeneratedBy, activity))
-                        g.add((activity, RDFS.label, Literal(t.get("measurementMethod"))))
-                        # if vocab provides a URI for the method, link activity to it using prov:used
-                        method_label = t.get("measurementMethod")
-                        method_uri = None
-                        if vocab and "measurementMethod" in vocab:
-                            method_uri = vocab.get("measurementMethod", {}).get(method_label)
-                        if method_uri:
-                            g.add((activity, PROV.used, URIRef(method_uri)))
-                    if t.get("evidence"):
-                        g.add((trait_uri, DCT.description, Literal(t.get("evidence"))))
-                    if t.get("source_reference"):
-                        g.add((trait_uri, DCT.source, Literal(t.get("source_reference"))))
-                    # attach publisher/date metadata at trait level if provided
-                    if publisher:
-                        g.add((trait_uri, DCT.publisher, Literal(publisher)))
-                    if dataset_date:
-                        g.add((trait_uri, DCT.date, Literal(dataset_date)))
-                    # optionally link to food items (trait-level and taxon-level relations)
-                    food = t.get("food_item_uri")
-                    rel = t.get("relation_uri")
-                    if food:
-                        if rel:
-                            g.add((trait_uri, URIRef(rel), URIRef(food)))
-                            g.add((subj, URIRef(rel), URIRef(food)))
-                        else:
-                            g.add((trait_uri, RON["0002470"], URIRef(food)))
-                            g.add((subj, RON["0002470"], URIRef(food)))
-            g.serialize(destination=out_ttl, format="turtle")
-
-    return {"rows_written": len(out_rows), "taxa": len(per_taxon_traits)}
+            if strict_ttl:
+                logger.warning("rdflib not installed; writing TTL without validation")
+            _write_ttl_fast(out_ttl, triples)
+
+    return {"rows_written": len(trait_rows), "taxa": len(pd.unique(row_taxa))}
 
 
 def main():
@@ -295,6 +429,11 @@ def main():
     parser.add_argument("--vocab", required=False, dest="vocab_csv")
     parser.add_argument("--publisher", required=False)
     parser.add_argument("--date", required=False, dest="dataset_date")
+    parser.add_argument(
+        "--strict-ttl",
+        action="store_true",
+        help="build the Turtle output with rdflib, which validates every term",
+    )
     args = parser.parse_args()
 
     res = expand_biotic_rows(
@@ -305,10 +444,11 @@ def main():
         vocab_csv=args.vocab_csv,
         publisher=args.publisher,
         dataset_date=args.dataset_date,
+        strict_ttl=args.strict_ttl,
     )
     print(f"Wrote {res['rows_written']} trait rows for {res['taxa']} taxa to {args.out_csv}")
     if args.out_ttl:
-        print(f"TTL written to {args.out_ttl} (if rdflib installed)")
+        print(f"TTL written to {args.out_ttl}")
 
 
 if __name__ == "__main__":
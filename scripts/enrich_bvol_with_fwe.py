@@ -1,24 +1,145 @@
 """Enrich bvol spreadsheet using FreshwaterEcology API
 
 Usage:
-  python scripts/enrich_bvol_with_fwe.py --input ../bvol_nomp_version_2024.xlsx --sheet "Biovolume file" --out schemas/bvol_with_fwe.xlsx --max-rows 200
+  python scripts/enrich_bvol_with_fwe.py --input ../bvol_nomp_version_2024.xlsx --sheet "Biovolume file" --out schemas/bvol_with_fwe.xlsx --max-rows 200 [--workers 4]
 
 Notes:
 - The script will look up taxa via FWE (organismgroup='al') using taxonname, genus, and q searches.
+  Each genus is queried once and its taxa are matched locally; per-row queries are only
+  issued when the genus query fails, comes back empty or is truncated. Rows repeating a
+  genus/species pair (one per size class) share a single lookup.
 - On match, it will try to extract biovolume/carbon/trophic-related parameters and add them as new columns.
-- Safe: writes incremental backups and a resumable output file.
+- Rows are looked up concurrently on a small thread pool (`--workers`), one checkpoint batch at a time.
+  The number of requests in flight adapts: it is halved when FWE throttles (429/503)
+  and grows back by one after a run of successful calls.
+- Safe: writes incremental backups (`<out>.partial.parquet`, or `.partial.csv` without a Parquet
+  engine) and a resumable output file. Only the final output is written as xlsx.
+  To resume an interrupted run, pass the checkpoint as `--input` (the sheet is ignored):
+    python scripts/enrich_bvol_with_fwe.py --input schemas/bvol_with_fwe.partial.parquet --sheet - --out schemas/bvol_with_fwe.xlsx
+  Rows already marked `fwe_found` are skipped; re-running on the final xlsx output works the same way.
+- The input sheet is cached next to the workbook as Parquet (`<input>.<sheet>.parquet`) when
+  pyarrow is available, so re-runs skip the Excel parse while the workbook is unchanged.
+- When requests-cache is installed, FWE query responses are cached on disk for a week
+  (`.fwe_cache.sqlite`), so re-runs and repeated genera are answered locally. Use `--no-cache` to disable.
 """
+
 from __future__ import annotations
 
 import argparse
 import json
-import time
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 import pandas as pd
+import requests
+
+try:
+    import requests_cache
+
+    _HAS_REQUESTS_CACHE = True
+except ImportError:
+    requests_cache = None
+    _HAS_REQUESTS_CACHE = False
 
 from apis import FreshwaterEcologyAPI
+from apis.base_api import create_session
+
+FWE_COLUMNS = [
+    "fwe_found",
+    "fwe_biovolume",
+    "fwe_carbon_pg_per_unit",
+    "fwe_trophic",
+    "fwe_raw_sample",
+]
+CHECKPOINT_EVERY = 20
+DEFAULT_WORKERS = 4
+GENUS_QUERY_LIMIT = 1000
+FWE_CACHE_NAME = ".fwe_cache"
+# Only trait queries are cached; token requests always go to the server
+FWE_CACHE_URLS: requests_cache.ExpirationPatterns = {
+    "www.freshwaterecology.info/fweapi2/v1/query*": timedelta(days=7)
+}
+# Response fields that may carry the taxon name, in order of preference
+_TAXON_NAME_FIELDS = ("taxonname", "taxon", "species", "name")
+# Consecutive successful calls before the admission limit grows by one
+ADMISSION_INCREASE_AFTER = 10
+# Response fields holding the trait name and its value, in order of preference
+_TRAIT_NAME_FIELDS = ("trait", "parameter", "ecoparam", "param")
+_TRAIT_VALUE_FIELDS = ("value", "val", "measurement")
+# Trait-name patterns routed to each output column
+_TRAIT_PATTERNS = {
+    "fwe_carbon_pg_per_unit": re.compile("carbon|carb"),
+    "fwe_biovolume": re.compile("biovol|volume"),
+    "fwe_trophic": re.compile("troph|feeding"),
+}
+_NUMERIC_TRAITS = ("fwe_carbon_pg_per_unit", "fwe_biovolume")
+_THROTTLED_RE = re.compile(r"\b(429|503)\b|too many requests", re.IGNORECASE)
+
+
+class AdmissionController:
+    """Bound the FWE requests in flight, adapting the limit to throttling.
+
+    The limit is halved (down to 1) when a call is throttled and raised by one
+    (up to ``max_limit``) after ``increase_after`` consecutive successful calls.
+    Use as a context manager around each request and report the outcome with
+    :meth:`record`.
+    """
+
+    def __init__(self, max_limit: int, increase_after: int = ADMISSION_INCREASE_AFTER):
+        self.max_limit = max(1, max_limit)
+        self.limit = self.max_limit
+        self.increase_after = increase_after
+        self.in_flight = 0
+        self._successes = 0
+        self._cond = threading.Condition()
+
+    def __enter__(self):
+        with self._cond:
+            self._cond.wait_for(lambda: self.in_flight < self.limit)
+            self.in_flight += 1
+        return self
+
+    def __exit__(self, *exc):
+        with self._cond:
+            self.in_flight -= 1
+            self._cond.notify()
+        return False
+
+    def record(self, throttled: bool) -> None:
+        with self._cond:
+            if throttled:
+                self._successes = 0
+                self.limit = max(1, self.limit // 2)
+                return
+            self._successes += 1
+            if self._successes >= self.increase_after and self.limit < self.max_limit:
+                self._successes = 0
+                self.limit += 1
+                self._cond.notify_all()
+
+
+def is_throttled(res) -> bool:
+    """True if a query result carries a rate-limit/unavailable error from the API."""
+    error = getattr(res, "attrs", {}).get("api_error")
+    return bool(error) and _THROTTLED_RE.search(str(error)) is not None
+
+
+def _first_present(frame: pd.DataFrame, fields, truthy: bool = True) -> pd.Series:
+    """Per row, the value of the first field that is set (and truthy, if requested)."""
+    result = pd.Series(None, index=frame.index, dtype=object)
+    for field in reversed(fields):
+        if field not in frame.columns:
+            continue
+        column = frame[field].astype(object)
+        mask = column.notna()
+        if truthy:
+            mask &= column.astype(bool)
+        result = column.where(mask, result)
+    return result
 
 
 def extract_traits_from_response(data) -> Dict[str, Any]:
@@ -30,111 +151,312 @@ def extract_traits_from_response(data) -> Dict[str, Any]:
         "fwe_trophic": None,
         "fwe_raw_sample": None,
     }
-    rows = []
     if isinstance(data, list):
-        rows = data
+        if not data:
+            return result
+        result["fwe_raw_sample"] = data[:3]
+        frame = pd.DataFrame([r for r in data if isinstance(r, dict)])
     else:
         try:
-            if not data.empty:
-                rows = data.to_dict(orient="records")
+            if data.empty:
+                return result
+            result["fwe_raw_sample"] = data.head(3).to_dict(orient="records")
+            frame = data
         except Exception:
-            rows = []
+            return result
+    result["fwe_found"] = True
 
-    if not rows:
-        return result
+    # Field names are matched case-insensitively; per row, the last set duplicate wins
+    frame = frame.set_axis([str(c).lower() for c in frame.columns], axis=1)
+    if frame.columns.has_duplicates:
+        frame = pd.DataFrame(
+            {
+                c: frame.loc[:, [c]].ffill(axis=1).iloc[:, -1]
+                for c in frame.columns.unique()
+            },
+            index=frame.index,
+        )
 
-    result["fwe_found"] = True
-    result["fwe_raw_sample"] = rows[:3]
-
-    for r in rows:
-        # try to fetch trait-like fields
-        # keys may be 'trait', 'parameter', 'ecoparam', 'parameterName', 'value'
-        keys = {k.lower(): v for k, v in (r.items() if isinstance(r, dict) else [])}
-        # join possible name fields
-        name = (
-            str(keys.get("trait") or keys.get("parameter") or keys.get("ecoparam") or keys.get("param") or "")).lower()
-        value = keys.get("value") or keys.get("val") or keys.get("measurement") or None
-        if value is None:
-            # try typical numeric keys
-            for candidate in ("value","val","V","measurement"):
-                if candidate in keys:
-                    value = keys[candidate]
-                    break
-        if not name:
+    names = _first_present(frame, _TRAIT_NAME_FIELDS).fillna("").astype(str).str.lower()
+    values = _first_present(frame, _TRAIT_VALUE_FIELDS)
+    values = values.where(
+        values.notna(), _first_present(frame, _TRAIT_VALUE_FIELDS, truthy=False)
+    )
+    values = values.astype(object).where(values.notna(), None)
+
+    # Later response rows take precedence, as they did when rows were scanned in order
+    for column, pattern in _TRAIT_PATTERNS.items():
+        matched = values[names.str.contains(pattern)]
+        if matched.empty:
             continue
-        if "carbon" in name or "carb" in name:
-            try:
-                result["fwe_carbon_pg_per_unit"] = float(value)
-            except Exception:
-                result["fwe_carbon_pg_per_unit"] = value
-        if "biovol" in name or "volume" in name:
+        value = matched.iat[-1]
+        if column in _NUMERIC_TRAITS:
             try:
-                result["fwe_biovolume"] = float(value)
+                value = float(value)
             except Exception:
-                result["fwe_biovolume"] = value
-        if "troph" in name or "trophy" in name or "feeding" in name:
-            result["fwe_trophic"] = value
+                pass
+        result[column] = value
 
     return result
 
 
-def enrich(input_path: Path, sheet: str, out_path: Path, max_rows: int = 200, api_key: str | None = None):
+def create_fwe_session(workers: int, use_cache: bool = True) -> requests.Session:
+    """Keep-alive session for FWE, caching query responses on disk when requests-cache is available."""
+    if not (use_cache and _HAS_REQUESTS_CACHE):
+        return create_session(pool_maxsize=workers)
+    cached = requests_cache.CachedSession(
+        FWE_CACHE_NAME,
+        backend="sqlite",
+        allowable_codes=(200,),
+        # Queries are POSTs with a JSON body, which is part of the cache key
+        allowable_methods=("GET", "POST"),
+        expire_after=requests_cache.DO_NOT_CACHE,
+        urls_expire_after=FWE_CACHE_URLS,
+    )
+    return create_session(pool_maxsize=workers, session=cached)
+
+
+def query_fwe(
+    api: FreshwaterEcologyAPI, controller: AdmissionController, **params
+) -> pd.DataFrame:
+    """Run one FWE query under the admission controller and report whether it was throttled."""
+    with controller:
+        res = api.query(organismgroup="al", **params)
+    controller.record(is_throttled(res))
+    return res
+
+
+def index_by_taxon_name(res) -> Dict[str, pd.DataFrame]:
+    """Split a genus-level FWE response into per-taxon frames keyed by lowercased name."""
+    if not isinstance(res, pd.DataFrame) or res.empty:
+        return {}
+    columns = {str(c).lower(): c for c in res.columns}
+    field = next((columns[f] for f in _TAXON_NAME_FIELDS if f in columns), None)
+    if field is None:
+        return {}
+    names = res[field].astype("string").str.strip().str.lower()
+    # iter(): dict() would call GroupBy.keys, which holds the grouping Series
+    return dict(iter(res.groupby(names, sort=False)))
+
+
+def fetch_genus(
+    api: FreshwaterEcologyAPI, controller: AdmissionController, genus: str
+) -> Optional[tuple[pd.DataFrame, Dict[str, pd.DataFrame]]]:
+    """Query all FWE records for a genus once; None if the query failed."""
+    try:
+        res = query_fwe(api, controller, genus=genus, limit=GENUS_QUERY_LIMIT)
+    except Exception as e:
+        print(f"API error for genus {genus}: {e}")
+        return None
+    if res.attrs.get("api_error"):
+        return None
+    return res, index_by_taxon_name(res)
+
+
+def fallback_queries(
+    methods: tuple[str, ...], genus: str, taxonname: Optional[str]
+) -> list[tuple[str, Dict[str, str]]]:
+    """The (method, params) FWE queries to try in order, skipping unfilled names."""
+    values = {"taxonname": taxonname, "genus": genus, "q": taxonname}
+    return [
+        (method, {method: value}) for method in methods if (value := values[method])
+    ]
+
+
+def lookup_taxon(
+    api: FreshwaterEcologyAPI,
+    controller: AdmissionController,
+    idx,
+    genus: str,
+    species: str,
+    genus_result: Optional[tuple[pd.DataFrame, Dict[str, pd.DataFrame]]] = None,
+) -> Optional[Dict[str, Any]]:
+    """Match a row against its genus records, then fall back to taxonname/genus/q queries."""
+    taxonname = f"{genus} {species}".strip() if genus and species else None
+    methods: tuple[str, ...] = ("taxonname", "genus", "q")
+
+    if genus_result is not None:
+        genus_rows, by_taxon = genus_result
+        if taxonname and taxonname.lower() in by_taxon:
+            return extract_traits_from_response(by_taxon[taxonname.lower()])
+        # A truncated genus response may simply not include this taxon
+        truncated = len(genus_rows) >= GENUS_QUERY_LIMIT
+        if not genus_rows.empty:
+            if not truncated:
+                # Same answer the per-row genus query would have given
+                return extract_traits_from_response(genus_rows.head(10))
+            methods = ("taxonname",)
+        else:
+            methods = ("q",)
+
+    for attempt_method, params in fallback_queries(methods, genus, taxonname):
+        try:
+            res = query_fwe(api, controller, limit=10, **params)
+            extracted = extract_traits_from_response(res)
+            if extracted["fwe_found"]:
+                return extracted
+        except Exception as e:
+            # log and continue
+            print(
+                f"API error for row {idx} ({taxonname}) with method {attempt_method}: {e}"
+            )
+
+    if genus_result is not None and not genus_result[0].empty:
+        return extract_traits_from_response(genus_result[0].head(10))
+    return None
+
+
+def load_sheet(input_path: Path, sheet: str) -> pd.DataFrame:
+    """Read the input sheet, reusing a Parquet copy while the workbook is unchanged.
+
+    A checkpoint written by write_checkpoint (.parquet or .csv) is read as is and
+    sheet is ignored, so an interrupted run can be resumed from it.
+    """
+    if input_path.suffix == ".parquet":
+        return pd.read_parquet(input_path)
+    if input_path.suffix == ".csv":
+        return pd.read_csv(input_path)
+    cache_path = input_path.with_name(f"{input_path.name}.{sheet}.parquet")
+    try:
+        if cache_path.stat().st_mtime >= input_path.stat().st_mtime:
+            return pd.read_parquet(cache_path)
+    except Exception:
+        # No cache yet, or no Parquet engine installed
+        pass
+
+    # Every column is kept: the whole sheet is written back with the FWE columns added
     df = pd.read_excel(input_path, sheet_name=sheet)
+    try:
+        df.to_parquet(cache_path, index=False)
+    except Exception:
+        # Parquet needs pyarrow/fastparquet and Arrow-compatible columns
+        pass
+    return df
+
+
+def write_checkpoint(df: pd.DataFrame, out_path: Path) -> Path:
+    """Write interim results next to out_path, as Parquet when possible, else as CSV."""
+    temp_out = out_path.with_suffix(".partial.parquet")
+    try:
+        df.to_parquet(temp_out, index=False)
+        return temp_out
+    except Exception:
+        # No Parquet engine, or a column mixing numbers and text
+        temp_out.unlink(missing_ok=True)
+    temp_out = out_path.with_suffix(".partial.csv")
+    df.to_csv(temp_out, index=False)
+    return temp_out
+
+
+def store_batch_results(
+    df: pd.DataFrame,
+    batch: list,
+    taxon_results: Dict[tuple[str, str], Optional[Dict[str, Any]]],
+) -> None:
+    """Write a batch's lookups into df, with one assignment per outcome."""
+    found_idx, found_rows, missed_idx = [], [], []
+    for idx, genus, species in batch:
+        success_data = taxon_results[(genus, species)]
+        if success_data:
+            found_idx.append(idx)
+            found_rows.append(
+                [
+                    True,
+                    success_data.get("fwe_biovolume"),
+                    success_data.get("fwe_carbon_pg_per_unit"),
+                    success_data.get("fwe_trophic"),
+                    json.dumps(success_data.get("fwe_raw_sample")),
+                ]
+            )
+        else:
+            missed_idx.append(idx)
+    if found_idx:
+        df.loc[found_idx, FWE_COLUMNS] = pd.DataFrame(
+            found_rows, index=found_idx, columns=FWE_COLUMNS, dtype=object
+        )
+    if missed_idx:
+        df.loc[missed_idx, "fwe_found"] = False
+
+
+def enrich(
+    input_path: Path,
+    sheet: str,
+    out_path: Path,
+    max_rows: int = 200,
+    api_key: str | None = None,
+    workers: int = DEFAULT_WORKERS,
+    use_cache: bool = True,
+):
+    df = load_sheet(input_path, sheet)
     # add columns if missing
-    for col in ["fwe_found", "fwe_biovolume", "fwe_carbon_pg_per_unit", "fwe_trophic", "fwe_raw_sample"]:
+    for col in FWE_COLUMNS:
         if col not in df.columns:
             df[col] = None
+    # Results are assigned in bulk; keep the columns able to hold any value
+    df[FWE_COLUMNS] = df[FWE_COLUMNS].astype(object)
 
-    api = FreshwaterEcologyAPI(api_key=api_key) if api_key else FreshwaterEcologyAPI()
+    workers = max(1, workers)
+    # One keep-alive session for every query, with a connection per worker thread
+    api = FreshwaterEcologyAPI(
+        api_key=api_key, session=create_fwe_session(workers, use_cache)
+    )
+    # Fetch the bearer token once, before worker threads start querying
+    api.authenticate()
 
-    processed = 0
-    for idx, row in df.iterrows():
-        if processed >= max_rows:
-            break
-        # skip already enriched rows
-        if pd.notna(row.get("fwe_found")) and row.get("fwe_found"):
-            processed += 1
-            continue
+    # The first max_rows rows, minus those already enriched in a previous run
+    head = df.head(max_rows)
+    found = head["fwe_found"]
+    done = (found.notna() & found.astype(bool)).to_numpy()
+    processed = int(done.sum())
+    todo = head[~done]
 
-        genus = str(row.get("Genus", "")).strip()
-        species = str(row.get("Species", "")).strip()
-        taxonname = f"{genus} {species}".strip() if genus and species else None
+    def names(column: str) -> list:
+        if column not in todo.columns:
+            return [""] * len(todo)
+        return [str(v).strip() for v in todo[column].to_numpy()]
 
-        success_data = None
-        for attempt_method in ("taxonname", "genus", "q"):
-            try:
-                if attempt_method == "taxonname" and taxonname:
-                    res = api.query(organismgroup="al", taxonname=taxonname, limit=10)
-                elif attempt_method == "genus" and genus:
-                    res = api.query(organismgroup="al", genus=genus, limit=10)
-                elif attempt_method == "q" and taxonname:
-                    res = api.query(organismgroup="al", q=taxonname, limit=10)
-                else:
-                    continue
-
-                extracted = extract_traits_from_response(res)
-                if extracted["fwe_found"]:
-                    success_data = extracted
-                    break
-            except Exception as e:
-                # log and continue
-                print(f"API error for row {idx} ({taxonname}) with method {attempt_method}: {e}")
-            time.sleep(1.0)  # rate limit
+    pending = list(zip(todo.index, names("Genus"), names("Species"), strict=True))
 
-        if success_data:
-            df.at[idx, "fwe_found"] = True
-            df.at[idx, "fwe_biovolume"] = success_data.get("fwe_biovolume")
-            df.at[idx, "fwe_carbon_pg_per_unit"] = success_data.get("fwe_carbon_pg_per_unit")
-            df.at[idx, "fwe_trophic"] = success_data.get("fwe_trophic")
-            df.at[idx, "fwe_raw_sample"] = json.dumps(success_data.get("fwe_raw_sample"))
-        else:
-            df.at[idx, "fwe_found"] = False
+    # Requests are I/O bound: look rows up concurrently, one checkpoint batch at a time.
+    # The controller shrinks the number of requests in flight while FWE is throttling.
+    controller = AdmissionController(workers)
+    genus_results: Dict[str, Any] = {}
+    # Size classes repeat a taxon over several rows; each (genus, species) is looked up once per run
+    taxon_results: Dict[tuple[str, str], Optional[Dict[str, Any]]] = {}
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for start in range(0, len(pending), CHECKPOINT_EVERY):
+            batch = pending[start : start + CHECKPOINT_EVERY]
+
+            # One request per genus not seen in an earlier batch
+            new_genera = list(
+                dict.fromkeys(g for _, g, _ in batch if g and g not in genus_results)
+            )
+            genus_results.update(
+                zip(
+                    new_genera,
+                    executor.map(lambda g: fetch_genus(api, controller, g), new_genera),
+                    strict=True,
+                )
+            )
+
+            new_taxa: dict[tuple[str, str], int] = {}
+            for idx, genus, species in batch:
+                if (genus, species) not in taxon_results:
+                    new_taxa.setdefault((genus, species), idx)
+
+            def lookup(item: tuple[tuple[str, str], int]) -> Optional[Dict[str, Any]]:
+                (genus, species), idx = item
+                return lookup_taxon(
+                    api, controller, idx, genus, species, genus_results.get(genus)
+                )
+
+            taxon_results.update(
+                zip(new_taxa, executor.map(lookup, new_taxa.items()), strict=True)
+            )
 
-        processed += 1
-        if processed % 20 == 0:
-            # write intermediate output
-            temp_out = out_path.with_suffix(".partial.xlsx")
-            df.to_excel(temp_out, index=False)
+            store_batch_results(df, batch, taxon_results)
+            processed += len(batch)
+            temp_out = write_checkpoint(df, out_path)
             print(f"Wrote interim results to {temp_out} (processed {processed})")
 
     # final write
@@ -144,11 +466,31 @@ def enrich(input_path: Path, sheet: str, out_path: Path, max_rows: int = 200, ap
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
-    parser.add_argument("--input", required=True)
-    parser.add_argument("--sheet", required=True)
+    parser.add_argument(
+        "--input",
+        required=True,
+        help="bvol workbook, or a .partial.parquet/.partial.csv checkpoint to resume from",
+    )
+    parser.add_argument(
+        "--sheet", required=True, help="sheet to enrich (ignored for checkpoints)"
+    )
     parser.add_argument("--out", required=True)
     parser.add_argument("--max-rows", type=int, default=200)
     parser.add_argument("--api-key", required=False)
+    parser.add_argument(
+        "--workers", type=int, default=DEFAULT_WORKERS, help="concurrent FWE lookups"
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true", help="do not cache FWE responses on disk"
+    )
     args = parser.parse_args()
 
-    enrich(Path(args.input), args.sheet, Path(args.out), max_rows=args.max_rows, api_key=args.api_key)
+    enrich(
+        Path(args.input),
+        args.sheet,
+        Path(args.out),
+        max_rows=args.max_rows,
+        api_key=args.api_key,
+        workers=args.workers,
+        use_cache=not args.no_cache,
+    )
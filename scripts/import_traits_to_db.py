@@ -7,11 +7,20 @@ This script populates the trait ontology database with data from:
 """
 
 import logging
+import os
 import sys
 from pathlib import Path
+from typing import Any, Dict, List, Tuple
 
 import pandas as pd
 
+try:
+    import python_calamine  # noqa: F401
+
+    _HAS_CALAMINE = True
+except ImportError:
+    _HAS_CALAMINE = False
+
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -23,6 +32,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# The Rust-based calamine reader parses xlsx much faster than openpyxl (pandas' default)
+EXCEL_ENGINE = "calamine" if _HAS_CALAMINE else None
+
 
 def parse_size_range(size_range_str: str) -> tuple:
     """
@@ -50,233 +62,406 @@ def parse_size_range(size_range_str: str) -> tuple:
         return None, None
 
 
-def import_phytoplankton_data(db, excel_path: str) -> int:
+def parse_size_ranges(size_ranges: pd.Series) -> tuple:
     """
-    Import phytoplankton trait data from bvol_nomp_version_2024.xlsx.
+    Column-wise parse_size_range: parse every size range string of a column at once.
 
     Returns:
-        Number of species imported
+        (min_values, max_values) Series aligned with size_ranges, None where missing or unparseable
     """
-    logger.info(f"Loading phytoplankton data from {excel_path}")
-    df = pd.read_excel(excel_path)
+    text = size_ranges.astype(object).where(
+        size_ranges.notna() & size_ranges.astype(bool)
+    )
+    text = text.dropna().astype(str).str.strip()
+
+    parts = text.str.split("-")
+    ranged = text.str.contains("-", regex=False)
+    first = pd.to_numeric(parts.str[0].str.strip(), errors="coerce")
+    second = pd.to_numeric(parts.str[1].str.strip(), errors="coerce")
+    min_values = first.where(
+        ranged, pd.to_numeric(text.where(~ranged), errors="coerce")
+    )
+    max_values = second.where(ranged, min_values)
+
+    failed = min_values.isna() | max_values.isna()
+    for size_range_str in text[failed]:
+        logger.warning(f"Could not parse size range: {size_range_str}")
 
-    logger.info(f"Loaded {len(df)} phytoplankton records")
+    def aligned(values):
+        values = values.where(~failed).reindex(size_ranges.index)
+        return values.astype(object).where(values.notna(), None)
 
-    species_count = 0
-    trait_value_count = 0
+    return aligned(min_values), aligned(max_values)
 
-    # Group by AphiaID to handle multiple size classes
-    grouped = df.groupby('AphiaID')
 
-    for aphia_id, group in grouped:
-        if pd.isna(aphia_id):
-            continue
+def _column_values(df: pd.DataFrame, column: str) -> list:
+    """
+    Values of a column as a list, with missing cells as None.
 
-        aphia_id = int(aphia_id)
+    A column the sheet does not have reads as all missing.
+    """
+    if column not in df.columns:
+        return [None] * len(df)
+    values = df[column].to_numpy(dtype=object, copy=True)
+    values[pd.isna(values)] = None
+    cells: list = values.tolist()
+    return cells
 
-        # Use first row for species-level data
-        first_row = group.iloc[0]
 
-        # Add species
-        species_id = db.add_species(
-            aphia_id=aphia_id,
-            scientific_name=first_row.get('Species') if pd.notna(first_row.get('Species')) else None,
-            genus=first_row.get('Genus') if pd.notna(first_row.get('Genus')) else None,
-            author=first_row.get('Author') if pd.notna(first_row.get('Author')) else None,
-            data_source='bvol_nomp_version_2024'
-        )
+# Size measurements (try different column name variations)
+SIZE_COLUMNS = {
+    "length_l1": ["Length(l1)μm", "Length(l1)µm"],
+    "length_l2": ["Length(l2)μm", "Length(l2)µm"],
+    "width": ["Width(w)μm", "Width(w)µm"],
+    "height": ["Height(h)μm", "Height(h)µm"],
+    "diameter_d1": ["Diameter(d1)μm", "Diameter(d1)µm"],
+    "diameter_d2": ["Diameter(d2)μm", "Diameter(d2)µm"],
+    "filament_length": ["Filament_length_of_cell(μm)", "Filament_length_of_cell(µm)"],
+}
+
+
+# Deletes the micro sign and the Greek mu, which bvol column names use interchangeably
+_MICRO_SIGNS = str.maketrans("", "", "µμ")
+
+
+def _normalize_column(name: str) -> str:
+    """Column name without micro signs (micro sign or Greek mu), lowercased."""
+    return name.translate(_MICRO_SIGNS).lower()
+
+
+def resolve_trait_columns(columns) -> dict:
+    """
+    Map each phytoplankton trait to the bvol column holding it.
+
+    Traits without a matching column are left out.
+    """
+    columns = [c for c in columns if isinstance(c, str)]
+    resolved = {}
+
+    # Encoding-normalized name -> actual column, first occurrence wins
+    normalized: Dict[str, str] = {}
+    for c in columns:
+        normalized.setdefault(_normalize_column(c), c)
+
+    if "Trophy" in columns:
+        resolved["trophic_type"] = "Trophy"
+    if "Geometric_shape" in columns:
+        resolved["geometric_shape"] = "Geometric_shape"
+
+    for trait_name, possible_cols in SIZE_COLUMNS.items():
+        for col in possible_cols:
+            # Match case-insensitively, whichever micro sign the sheet uses
+            actual = normalized.get(_normalize_column(col))
+            if actual is not None:
+                resolved[trait_name] = actual
+                break
+
+    # Biovolume
+    vol_cols = [
+        c
+        for c in columns
+        if "volume" in c.lower() and "counting_unit" in c and "formula" not in c.lower()
+    ]
+    if vol_cols:
+        resolved["biovolume"] = vol_cols[0]
+
+    # Carbon content
+    carbon_cols = [
+        c for c in columns if "Carbon_pg/counting_unit" in c and "formula" not in c
+    ]
+    if carbon_cols:
+        resolved["carbon_content"] = carbon_cols[0]
+
+    # Cells per counting unit
+    if "No_of_cells/counting_unit" in columns:
+        resolved["cells_per_unit"] = "No_of_cells/counting_unit"
+
+    return resolved
+
+
+# Species-level and size-class columns read from the bvol sheet
+BVOL_COLUMNS = [
+    "AphiaID",
+    "Species",
+    "Genus",
+    "Author",
+    "Division",
+    "Class",
+    "Order",
+    "WORMS Rank",
+    "HELCOM area",
+    "OSPAR area",
+    "SizeClassNo",
+    "SizeRange",
+]
+
+
+def _is_bvol_import_column(name) -> bool:
+    """True for the bvol columns import_phytoplankton_data uses."""
+    return name in BVOL_COLUMNS or bool(resolve_trait_columns([name]))
+
+
+def load_bvol_sheet(excel_path: str) -> pd.DataFrame:
+    """Read the columns the import uses, reusing a Parquet copy while the workbook is unchanged."""
+    cache_path = f"{excel_path}.parquet"
+    try:
+        if os.path.getmtime(cache_path) >= os.path.getmtime(excel_path):
+            return pd.read_parquet(cache_path)
+    except Exception:
+        # No cache yet, or no Parquet engine installed
+        pass
+
+    df = pd.read_excel(
+        excel_path,
+        engine=EXCEL_ENGINE,
+        usecols=_is_bvol_import_column,
+        dtype={"AphiaID": "Int64"},
+    )
+    try:
+        df.to_parquet(cache_path, index=False)
+    except Exception:
+        # Parquet needs pyarrow/fastparquet and Arrow-compatible columns
+        pass
+    return df
+
+
+def import_phytoplankton_data(db, excel_path: str) -> int:
+    """
+    Import phytoplankton trait data from bvol_nomp_version_2024.xlsx.
+
+    Rows are collected per table and written with one batch insert each.
+
+    Returns:
+        Number of species imported
+    """
+    logger.info(f"Loading phytoplankton data from {excel_path}")
+    df = load_bvol_sheet(excel_path)
 
-        if species_id:
-            species_count += 1
-
-            # Add taxonomy
-            db.add_taxonomy(
-                species_id=species_id,
-                kingdom='Chromista' if first_row.get('Division') not in ['CYANOBACTERIA'] else 'Bacteria',
-                division=first_row.get('Division') if pd.notna(first_row.get('Division')) else None,
-                class_name=first_row.get('Class') if pd.notna(first_row.get('Class')) else None,
-                order_name=first_row.get('Order') if pd.notna(first_row.get('Order')) else None,
-                genus=first_row.get('Genus') if pd.notna(first_row.get('Genus')) else None,
-                species=first_row.get('Species') if pd.notna(first_row.get('Species')) else None,
-                rank=first_row.get('WORMS Rank') if pd.notna(first_row.get('WORMS Rank')) else None
+    logger.info(f"Loaded {len(df)} phytoplankton records")
+
+    # Rows of each species together, species in AphiaID order, size classes in file order
+    df = df[df["AphiaID"].notna()].sort_values("AphiaID", kind="stable")
+    aphia_ids = df["AphiaID"].astype(int)
+
+    # Use first row of each species for species-level data
+    first_rows = df[~aphia_ids.duplicated()]
+
+    # Species-level columns as lists, missing cells as None, checked once per column
+    species_aphia_ids = aphia_ids[first_rows.index].tolist()
+    species_names = _column_values(first_rows, "Species")
+    genera = _column_values(first_rows, "Genus")
+    divisions = _column_values(first_rows, "Division")
+
+    species_ids = db.add_species_batch(
+        [
+            (aphia_id, name, genus, None, author, "bvol_nomp_version_2024")
+            for aphia_id, name, genus, author in zip(
+                species_aphia_ids,
+                species_names,
+                genera,
+                _column_values(first_rows, "Author"),
+                strict=True,
+            )
+        ]
+    )
+    species_count = len(species_ids)
+    first_species_ids = [species_ids[aphia_id] for aphia_id in species_aphia_ids]
+
+    db.add_taxonomy_batch(
+        [
+            (
+                species_id,
+                "Chromista" if division not in ["CYANOBACTERIA"] else "Bacteria",
+                None,
+                division,
+                class_name,
+                order_name,
+                None,
+                genus,
+                name,
+                rank,
+            )
+            for species_id, division, class_name, order_name, genus, name, rank in zip(
+                first_species_ids,
+                divisions,
+                _column_values(first_rows, "Class"),
+                _column_values(first_rows, "Order"),
+                genera,
+                species_names,
+                _column_values(first_rows, "WORMS Rank"),
+                strict=True,
             )
+        ]
+    )
+
+    # Geographic distribution
+    distribution_records: List[Tuple[int, str, Any]] = []
+    for area_type, column in (("HELCOM", "HELCOM area"), ("OSPAR", "OSPAR area")):
+        distribution_records.extend(
+            (species_id, area_type, area)
+            for species_id, area in zip(
+                first_species_ids, _column_values(first_rows, column), strict=True
+            )
+            if area is not None
+        )
+    # Keep each species' areas together, as they were added species by species
+    distribution_records.sort(key=lambda record: record[0])
+    db.add_geographic_distribution_batch(distribution_records)
+
+    # Size classes, keyed back to their rows
+    if "SizeClassNo" in df.columns:
+        sized = df[df["SizeClassNo"].notna().to_numpy()]
+    else:
+        sized = df.iloc[:0]
+    size_ranges = _column_values(sized, "SizeRange")
+    size_range_mins, size_range_maxs = parse_size_ranges(
+        pd.Series(size_ranges, index=sized.index)
+    )
+    size_class_records = [
+        (
+            species_ids[aphia_id],
+            int(size_class_no),
+            str(size_range) if size_range is not None else None,
+            size_range_min,
+            size_range_max,
+            None,
+        )
+        for aphia_id, size_class_no, size_range, size_range_min, size_range_max in zip(
+            aphia_ids[sized.index].tolist(),
+            _column_values(sized, "SizeClassNo"),
+            size_ranges,
+            size_range_mins.tolist(),
+            size_range_maxs.tolist(),
+            strict=True,
+        )
+    ]
+    size_class_ids = dict(
+        zip(sized.index, db.add_size_classes_batch(size_class_records), strict=True)
+    )
+
+    # Trait name -> source column, resolved once for the whole sheet
+    trait_columns = resolve_trait_columns(df.columns)
+
+    # One (row, trait, value) record per non-empty cell, row by row in trait order
+    long = (
+        df[list(trait_columns.values())]
+        .set_axis(list(trait_columns), axis=1)
+        .melt(var_name="trait_name", value_name="value", ignore_index=False)
+        .dropna(subset=["value"])
+        .sort_index(kind="stable")
+    )
+    species_of_row = aphia_ids.map(species_ids)
+    trait_records = [
+        (
+            species_id,
+            trait_name,
+            value,
+            size_class_ids.get(idx),
+            None,
+            "bvol_nomp_version_2024",
+            None,
+        )
+        for idx, species_id, trait_name, value in zip(
+            long.index,
+            species_of_row.loc[long.index].tolist(),
+            long["trait_name"].tolist(),
+            long["value"].tolist(),
+            strict=True,
+        )
+    ]
 
-            # Add geographic distribution
-            if pd.notna(first_row.get('HELCOM area')):
-                db.add_geographic_distribution(species_id, 'HELCOM', first_row['HELCOM area'])
-            if pd.notna(first_row.get('OSPAR area')):
-                db.add_geographic_distribution(species_id, 'OSPAR', first_row['OSPAR area'])
-
-            # Process each size class
-            for _, row in group.iterrows():
-                size_class_no = row.get('SizeClassNo')
-                size_range = row.get('SizeRange')
-
-                # Add size class
-                size_class_id = None
-                if pd.notna(size_class_no):
-                    size_range_min, size_range_max = parse_size_range(size_range)
-                    size_class_id = db.add_size_class(
-                        species_id=species_id,
-                        size_class_no=int(size_class_no),
-                        size_range=str(size_range) if pd.notna(size_range) else None,
-                        size_range_min=size_range_min,
-                        size_range_max=size_range_max
-                    )
-
-                # Add trait values for this size class
-
-                # Trophic type
-                if pd.notna(row.get('Trophy')):
-                    db.add_trait_value(
-                        species_id, 'trophic_type', row['Trophy'],
-                        size_class_id=size_class_id, data_source='bvol_nomp_version_2024'
-                    )
-                    trait_value_count += 1
-
-                # Geometric shape
-                if pd.notna(row.get('Geometric_shape')):
-                    db.add_trait_value(
-                        species_id, 'geometric_shape', row['Geometric_shape'],
-                        size_class_id=size_class_id, data_source='bvol_nomp_version_2024'
-                    )
-                    trait_value_count += 1
-
-                # Size measurements (try different column name variations)
-                size_columns = {
-                    'length_l1': ['Length(l1)μm', 'Length(l1)µm'],
-                    'length_l2': ['Length(l2)μm', 'Length(l2)µm'],
-                    'width': ['Width(w)μm', 'Width(w)µm'],
-                    'height': ['Height(h)μm', 'Height(h)µm'],
-                    'diameter_d1': ['Diameter(d1)μm', 'Diameter(d1)µm'],
-                    'diameter_d2': ['Diameter(d2)μm', 'Diameter(d2)µm'],
-                    'filament_length': ['Filament_length_of_cell(μm)', 'Filament_length_of_cell(µm)']
-                }
-
-                for trait_name, possible_cols in size_columns.items():
-                    for col in possible_cols:
-                        # Try to find matching column (case-insensitive, handle encoding)
-                        matching_cols = [c for c in row.index if col.replace('µ', '').replace('μ', '') in c]
-                        if matching_cols:
-                            value = row[matching_cols[0]]
-                            if pd.notna(value):
-                                db.add_trait_value(
-                                    species_id, trait_name, float(value),
-                                    size_class_id=size_class_id, data_source='bvol_nomp_version_2024'
-                                )
-                                trait_value_count += 1
-                            break
-
-                # Biovolume
-                vol_cols = [c for c in row.index if 'volume' in c.lower() and 'counting_unit' in c and 'formula' not in c.lower()]
-                if vol_cols:
-                    value = row[vol_cols[0]]
-                    if pd.notna(value):
-                        db.add_trait_value(
-                            species_id, 'biovolume', float(value),
-                            size_class_id=size_class_id, data_source='bvol_nomp_version_2024'
-                        )
-                        trait_value_count += 1
-
-                # Carbon content
-                carbon_cols = [c for c in row.index if 'Carbon_pg/counting_unit' in c and 'formula' not in c]
-                if carbon_cols:
-                    value = row[carbon_cols[0]]
-                    if pd.notna(value):
-                        db.add_trait_value(
-                            species_id, 'carbon_content', float(value),
-                            size_class_id=size_class_id, data_source='bvol_nomp_version_2024'
-                        )
-                        trait_value_count += 1
-
-                # Cells per counting unit
-                if 'No_of_cells/counting_unit' in row.index and pd.notna(row['No_of_cells/counting_unit']):
-                    db.add_trait_value(
-                        species_id, 'cells_per_unit', float(row['No_of_cells/counting_unit']),
-                        size_class_id=size_class_id, data_source='bvol_nomp_version_2024'
-                    )
-                    trait_value_count += 1
-
-        if species_count % 100 == 0:
-            logger.info(f"Imported {species_count} phytoplankton species...")
+    trait_value_count = db.add_trait_values_batch(trait_records)
 
     logger.info(f"Imported {species_count} phytoplankton species with {trait_value_count} trait values")
     return species_count
 
 
+# Enriched species trait name -> species_enriched.xlsx column
+ENRICHED_TRAIT_COLUMNS = {
+    # Morphological
+    "male_size_range": "biology_male_size_range",
+    "female_size_range": "biology_female_size_range",
+    "male_size_at_maturity": "biology_male_size_at_maturity",
+    "female_size_at_maturity": "biology_female_size_at_maturity",
+    "growth_form": "biology_growth_form",
+    "body_flexibility": "biology_body_flexibility",
+    # Ecological
+    "typical_abundance": "biology_typical_abundance",
+    "growth_rate": "biology_growth_rate",
+    "mobility": "biology_mobility",
+    "sociability": "biology_sociability",
+    "environmental_position": "biology_environmental_position",
+    "dependency": "biology_dependency",
+    "supports": "biology_supports",
+    # Trophic
+    "feeding_method": "biology_characteristic_feeding_method",
+    "diet_food_source": "biology_dietfood_source",
+    "feeds_on": "biology_typically_feeds_on",
+    # Other
+    "is_harmful": "biology_is_the_species_harmful",
+}
+
+
 def import_enriched_species_data(db, excel_path: str) -> int:
     """
     Import enriched species trait data from species_enriched.xlsx.
 
+    Species and trait values are each written with one batch insert.
+
     Returns:
         Number of species imported
     """
     logger.info(f"Loading enriched species data from {excel_path}")
-    df = pd.read_excel(excel_path)
+    df = pd.read_excel(excel_path, engine=EXCEL_ENGINE)
 
     logger.info(f"Loaded {len(df)} enriched species records")
 
-    species_count = 0
-    trait_value_count = 0
-
-    for _, row in df.iterrows():
-        aphia_id_col = 'aphiaID' if 'aphiaID' in row.index else 'AphiaID'
-
-        if pd.isna(row.get(aphia_id_col)):
-            continue
-
-        aphia_id = int(row[aphia_id_col])
-
-        # Add species
-        species_id = db.add_species(
-            aphia_id=aphia_id,
-            scientific_name=row.get('taxonomyName') if pd.notna(row.get('taxonomyName')) else None,
-            common_name=row.get('synonymCommonName') if pd.notna(row.get('synonymCommonName')) else None,
-            author=row.get('taxonomyAuthority') if pd.notna(row.get('taxonomyAuthority')) else None,
-            data_source='species_enriched'
-        )
-
-        if species_id:
-            species_count += 1
-
-            # Add trait values
-            trait_mappings = {
-                # Morphological
-                'male_size_range': 'biology_male_size_range',
-                'female_size_range': 'biology_female_size_range',
-                'male_size_at_maturity': 'biology_male_size_at_maturity',
-                'female_size_at_maturity': 'biology_female_size_at_maturity',
-                'growth_form': 'biology_growth_form',
-                'body_flexibility': 'biology_body_flexibility',
-
-                # Ecological
-                'typical_abundance': 'biology_typical_abundance',
-                'growth_rate': 'biology_growth_rate',
-                'mobility': 'biology_mobility',
-                'sociability': 'biology_sociability',
-                'environmental_position': 'biology_environmental_position',
-                'dependency': 'biology_dependency',
-                'supports': 'biology_supports',
-
-                # Trophic
-                'feeding_method': 'biology_characteristic_feeding_method',
-                'diet_food_source': 'biology_dietfood_source',
-                'feeds_on': 'biology_typically_feeds_on',
-
-                # Other
-                'is_harmful': 'biology_is_the_species_harmful',
-            }
-
-            for trait_name, column_name in trait_mappings.items():
-                if column_name in row.index and pd.notna(row[column_name]):
-                    db.add_trait_value(
-                        species_id, trait_name, row[column_name],
-                        data_source='species_enriched'
-                    )
-                    trait_value_count += 1
-
-        if species_count % 100 == 0:
-            logger.info(f"Imported {species_count} enriched species...")
+    aphia_id_col = "aphiaID" if "aphiaID" in df.columns else "AphiaID"
+    if aphia_id_col not in df.columns:
+        logger.warning(f"No AphiaID column in {excel_path}")
+        return 0
+    df = df[df[aphia_id_col].notna()]
+    aphia_ids = df[aphia_id_col].astype(int)
+
+    # The first row of a repeated AphiaID creates the species; later rows only add traits
+    species_ids = db.add_species_batch(
+        [
+            (aphia_id, name, None, common_name, author, "species_enriched")
+            for aphia_id, name, common_name, author in zip(
+                aphia_ids.tolist(),
+                _column_values(df, "taxonomyName"),
+                _column_values(df, "synonymCommonName"),
+                _column_values(df, "taxonomyAuthority"),
+                strict=True,
+            )
+        ]
+    )
+    species_count = len(df)
+
+    trait_columns = {
+        trait_name: column
+        for trait_name, column in ENRICHED_TRAIT_COLUMNS.items()
+        if column in df.columns
+    }
+    long = (
+        df[list(trait_columns.values())]
+        .set_axis(list(trait_columns), axis=1)
+        .melt(var_name="trait_name", value_name="value", ignore_index=False)
+        .dropna(subset=["value"])
+        .sort_index(kind="stable")
+    )
+    species_of_row = aphia_ids.map(species_ids)
+    trait_value_count = db.add_trait_values_batch(
+        [
+            (species_id, trait_name, value, None, None, "species_enriched", None)
+            for species_id, trait_name, value in zip(
+                species_of_row.loc[long.index].tolist(),
+                long["trait_name"].tolist(),
+                long["value"].tolist(),
+                strict=True,
+            )
+        ]
+    )
 
     logger.info(f"Imported {species_count} enriched species with {trait_value_count} trait values")
     return species_count
@@ -308,20 +493,21 @@ def main():
     db.initialize_trait_categories()
     db.initialize_traits()
 
-    # Import data
+    # Import data, with fsync-heavy SQLite defaults relaxed for the bulk load
     total_species = 0
 
-    logger.info("\n" + "=" * 70)
-    logger.info("IMPORTING PHYTOPLANKTON DATA")
-    logger.info("=" * 70)
-    phyto_count = import_phytoplankton_data(db, str(bvol_path))
-    total_species += phyto_count
-
-    logger.info("\n" + "=" * 70)
-    logger.info("IMPORTING ENRICHED SPECIES DATA")
-    logger.info("=" * 70)
-    enriched_count = import_enriched_species_data(db, str(species_path))
-    total_species += enriched_count
+    with db.bulk_import():
+        logger.info("\n" + "=" * 70)
+        logger.info("IMPORTING PHYTOPLANKTON DATA")
+        logger.info("=" * 70)
+        phyto_count = import_phytoplankton_data(db, str(bvol_path))
+        total_species += phyto_count
+
+        logger.info("\n" + "=" * 70)
+        logger.info("IMPORTING ENRICHED SPECIES DATA")
+        logger.info("=" * 70)
+        enriched_count = import_enriched_species_data(db, str(species_path))
+        total_species += enriched_count
 
     # Get statistics
     logger.info("\n" + "=" * 70)
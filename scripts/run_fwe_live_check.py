@@ -4,9 +4,13 @@ Usage:
   python scripts/run_fwe_live_check.py --api-key <KEY> [--limit N]
 
 The script will not store the key; it only uses it for this run and prints brief summaries.
+The status check runs concurrently with authentication and the sample query.
 """
+
 import argparse
 import json
+from concurrent.futures import ThreadPoolExecutor
+
 from apis import FreshwaterEcologyAPI
 
 parser = argparse.ArgumentParser()
@@ -15,14 +19,25 @@ parser.add_argument("--limit", type=int, default=5)
 args = parser.parse_args()
 
 api = FreshwaterEcologyAPI(api_key=args.api_key)
-print("Checking status...")
-status = api.get_status()
+
+
+def authenticate_and_query():
+    token = api.authenticate()
+    return token, api.query(organismgroup="fi", genus="Salmo", limit=args.limit)
+
+
+print(
+    "Checking status, authenticating and running sample query (organismgroup=fi, genus=Salmo)..."
+)
+# The status endpoint needs no token, so it does not have to wait for authentication
+with ThreadPoolExecutor(max_workers=2) as executor:
+    status_future = executor.submit(api.get_status)
+    query_future = executor.submit(authenticate_and_query)
+    status = status_future.result()
+    token, df = query_future.result()
+
 print("Status:", status)
-print("Authenticating...")
-token = api.authenticate()
 print("Token obtained?", bool(token))
-print("Running sample query (organismgroup=fi, genus=Salmo)...")
-df = api.query(organismgroup="fi", genus="Salmo", limit=args.limit)
 print("Rows returned:", len(df))
 if not df.empty:
     print(json.dumps(df.head().to_dict(orient="records"), indent=2))
@@ -10,14 +10,20 @@ This script validates:
 6. Size class queries
 """
 
+import functools
+import io
 import logging
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from apis.trait_ontology_db import get_trait_db
+from apis.trait_ontology_db import TraitOntologyDB, get_trait_db
 
 logging.basicConfig(
     level=logging.INFO,
@@ -26,6 +32,99 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# Query text kept in module constants so repeated runs hit sqlite3's statement cache
+_SQL_SIZE_CLASSES = """
+    SELECT sc.size_class_id, sc.size_class_no, sc.size_range,
+           sc.size_range_min, sc.size_range_max,
+           t.trait_name, tv.value_numeric, tv.value_text
+    FROM size_classes sc
+    LEFT JOIN trait_values tv ON tv.size_class_id = sc.size_class_id
+    LEFT JOIN traits t ON t.trait_id = tv.trait_id
+    WHERE sc.species_id = ?
+    ORDER BY sc.size_class_no, sc.size_class_id, tv.value_id
+"""
+_SQL_TAXONOMY = """
+    SELECT kingdom, phylum, class, order_name, family, genus, species, rank
+    FROM taxonomic_hierarchy
+    WHERE species_id = ?
+"""
+_SQL_HELCOM_SPECIES = """
+    SELECT s.aphia_id, s.scientific_name, 'HELCOM' AS area_type,
+           (SELECT gd.area_value FROM geographic_distribution gd
+            WHERE gd.species_id = s.species_id AND gd.area_type = 'HELCOM'
+            LIMIT 1) AS area_value
+    FROM species s
+    WHERE EXISTS (
+        SELECT 1 FROM geographic_distribution gd
+        WHERE gd.species_id = s.species_id AND gd.area_type = 'HELCOM'
+    )
+    LIMIT 10
+"""
+
+# Tests run concurrently in main(); they only read from the database
+TEST_WORKERS = 4
+
+_thread_local = threading.local()
+
+
+def _db():
+    """Database handle for the calling thread.
+
+    sqlite3 connections may only be used by the thread that opened them, so worker
+    threads each open their own connection to the shared database file.
+    """
+    if threading.current_thread() is threading.main_thread():
+        return get_trait_db()
+    db = getattr(_thread_local, "db", None)
+    if db is None:
+        db = _thread_local.db = TraitOntologyDB(get_trait_db().db_path)
+    return db
+
+
+class _ThreadOutput:
+    """sys.stdout stand-in that keeps each worker thread's output in its own buffer."""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self._local = threading.local()
+
+    def write(self, text):
+        return getattr(self._local, "buffer", self.stream).write(text)
+
+    def flush(self):
+        self.stream.flush()
+
+    def capture(self, test):
+        """Run a test and return everything it printed."""
+        self._local.buffer = io.StringIO()
+        try:
+            test()
+            return self._local.buffer.getvalue()
+        finally:
+            del self._local.buffer
+
+
+# Species exercised by the tests below
+PHYTOPLANKTON_APHIA_ID = 146564  # Aphanocapsa elachista
+ENRICHED_APHIA_ID = 141433  # Abra alba
+
+
+@functools.lru_cache(maxsize=None)
+def _species_by_aphia_id():
+    """Look up all test species in one query, once per run; the tests are read-only."""
+    return _db().get_species_by_aphia_ids([PHYTOPLANKTON_APHIA_ID, ENRICHED_APHIA_ID])
+
+
+def _species(aphia_id):
+    return _species_by_aphia_id().get(aphia_id)
+
+
+@functools.lru_cache(maxsize=None)
+def _statistics():
+    """Compute database statistics once per run."""
+    return _db().get_statistics()
+
+
 def print_separator(title=""):
     """Print a visual separator."""
     if title:
@@ -40,8 +139,7 @@ def test_statistics():
     """Test 1: Get database statistics."""
     print_separator("TEST 1: Database Statistics")
 
-    db = get_trait_db()
-    stats = db.get_statistics()
+    stats = _statistics()
 
     print(f"\nTotal species: {stats['total_species']}")
     print(f"Total traits defined: {stats['total_traits']}")
@@ -63,13 +161,11 @@ def test_species_lookup():
     """Test 2: Query species by AphiaID."""
     print_separator("TEST 2: Species Lookup by AphiaID")
 
-    db = get_trait_db()
-
     # Test phytoplankton species (Aphanocapsa elachista)
-    aphia_id = 146564
+    aphia_id = PHYTOPLANKTON_APHIA_ID
     print(f"\nLooking up phytoplankton species: AphiaID {aphia_id}")
 
-    species = db.get_species_by_aphia_id(aphia_id)
+    species = _species(aphia_id)
     if species:
         print(f"  Found: {species['scientific_name']}")
         print(f"  Data source: {species['data_source']}")
@@ -78,10 +174,10 @@ def test_species_lookup():
         print(f"  Species not found!")
 
     # Test enriched species (Abra alba)
-    aphia_id = 141433
+    aphia_id = ENRICHED_APHIA_ID
     print(f"\nLooking up enriched species: AphiaID {aphia_id}")
 
-    species = db.get_species_by_aphia_id(aphia_id)
+    species = _species(aphia_id)
     if species:
         print(f"  Found: {species['scientific_name']}")
         print(f"  Common name: {species.get('common_name', 'N/A')}")
@@ -95,10 +191,10 @@ def test_trait_values():
     """Test 3: Retrieve trait values for species."""
     print_separator("TEST 3: Trait Value Retrieval")
 
-    db = get_trait_db()
+    db = _db()
 
     # Test phytoplankton with multiple size classes
-    aphia_id = 146564
+    aphia_id = PHYTOPLANKTON_APHIA_ID
     print(f"\nRetrieving all traits for AphiaID {aphia_id}:")
 
     traits = db.get_traits_for_species(aphia_id)
@@ -130,10 +226,10 @@ def test_category_filtering():
     """Test 4: Filter traits by category."""
     print_separator("TEST 4: Category Filtering")
 
-    db = get_trait_db()
+    db = _db()
 
     # Test enriched species
-    aphia_id = 141433
+    aphia_id = ENRICHED_APHIA_ID
     print(f"\nRetrieving ecological traits for AphiaID {aphia_id}:")
 
     eco_traits = db.get_traits_for_species(aphia_id, category='ecological')
@@ -154,7 +250,7 @@ def test_trait_queries():
     """Test 5: Query species by trait criteria."""
     print_separator("TEST 5: Query Species by Trait")
 
-    db = get_trait_db()
+    db = _db()
 
     # Query by numeric trait
     print("\nQuerying species with biovolume between 1.0 and 10.0 um3:")
@@ -182,46 +278,41 @@ def test_size_classes():
     """Test 6: Query size class information."""
     print_separator("TEST 6: Size Class Queries")
 
-    db = get_trait_db()
+    db = _db()
 
     # Get species with multiple size classes
-    aphia_id = 146564
+    aphia_id = PHYTOPLANKTON_APHIA_ID
     print(f"\nRetrieving size classes for AphiaID {aphia_id}:")
 
-    species = db.get_species_by_aphia_id(aphia_id)
+    species = _species(aphia_id)
     if species:
         species_id = species['species_id']
 
-        # Get size class information
+        # Get size classes and their trait values in one round trip
         cursor = db.conn.cursor()
-        cursor.execute("""
-            SELECT size_class_no, size_range, size_range_min, size_range_max
-            FROM size_classes
-            WHERE species_id = ?
-            ORDER BY size_class_no
-        """, (species_id,))
-
-        size_classes = cursor.fetchall()
+        cursor.execute(_SQL_SIZE_CLASSES, (species_id,))
+
+        size_classes = [
+            (key, list(rows))
+            for key, rows in groupby(cursor.fetchall(), key=itemgetter(0, 1, 2, 3, 4))
+        ]
         print(f"  Found {len(size_classes)} size classes:")
 
-        for sc in size_classes:
-            size_class_no, size_range, size_min, size_max = sc
+        for (_, size_class_no, size_range, size_min, size_max), _ in size_classes:
             print(f"    Size class {size_class_no}: {size_range}")
             if size_min is not None and size_max is not None:
                 print(f"      Range: {size_min} - {size_max}")
 
-        # Get trait values for specific size class
+        # Show trait values for a specific size class
         if size_classes:
             print(f"\n  Trait values for size class 1:")
-            cursor.execute("""
-                SELECT t.trait_name, tv.value_numeric, tv.value_text
-                FROM trait_values tv
-                JOIN traits t ON tv.trait_id = t.trait_id
-                JOIN size_classes sc ON tv.size_class_id = sc.size_class_id
-                WHERE tv.species_id = ? AND sc.size_class_no = 1
-            """, (species_id,))
-
-            traits = cursor.fetchall()
+            traits = [
+                row[5:]
+                for (_, size_class_no, *_), rows in size_classes
+                if size_class_no == 1
+                for row in rows
+                if row[5] is not None
+            ]
             for trait_name, val_num, val_text in traits[:10]:  # Show first 10
                 value = val_num if val_num is not None else val_text
                 print(f"      {trait_name}: {value}")
@@ -231,21 +322,17 @@ def test_taxonomy():
     """Test 7: Taxonomic hierarchy queries."""
     print_separator("TEST 7: Taxonomic Hierarchy")
 
-    db = get_trait_db()
+    db = _db()
 
-    aphia_id = 146564
+    aphia_id = PHYTOPLANKTON_APHIA_ID
     print(f"\nRetrieving taxonomy for AphiaID {aphia_id}:")
 
-    species = db.get_species_by_aphia_id(aphia_id)
+    species = _species(aphia_id)
     if species:
         species_id = species['species_id']
 
         cursor = db.conn.cursor()
-        cursor.execute("""
-            SELECT kingdom, phylum, class, "order", family, genus, species, rank
-            FROM taxonomic_hierarchy
-            WHERE species_id = ?
-        """, (species_id,))
+        cursor.execute(_SQL_TAXONOMY, (species_id,))
 
         taxonomy = cursor.fetchone()
         if taxonomy:
@@ -264,19 +351,13 @@ def test_geographic_distribution():
     """Test 8: Geographic distribution queries."""
     print_separator("TEST 8: Geographic Distribution")
 
-    db = get_trait_db()
+    db = _db()
 
     # Find species in HELCOM area
     print("\nQuerying species in HELCOM area:")
 
     cursor = db.conn.cursor()
-    cursor.execute("""
-        SELECT DISTINCT s.aphia_id, s.scientific_name, gd.area_type, gd.area_value
-        FROM species s
-        JOIN geographic_distribution gd ON s.species_id = gd.species_id
-        WHERE gd.area_type = 'HELCOM'
-        LIMIT 10
-    """)
+    cursor.execute(_SQL_HELCOM_SPECIES)
 
     results = cursor.fetchall()
     print(f"  Found {len(results)} species (showing first 10):")
@@ -289,16 +370,29 @@ def main():
     """Run all tests."""
     logger.info("Starting TraitOntologyDB tests")
 
+    tests = [
+        test_statistics,
+        test_species_lookup,
+        test_trait_values,
+        test_category_filtering,
+        test_trait_queries,
+        test_size_classes,
+        test_taxonomy,
+        test_geographic_distribution,
+    ]
+
     try:
-        # Run all test functions
-        test_statistics()
-        test_species_lookup()
-        test_trait_values()
-        test_category_filtering()
-        test_trait_queries()
-        test_size_classes()
-        test_taxonomy()
-        test_geographic_distribution()
+        get_trait_db()  # open the shared database before the workers do
+        # Run the independent tests concurrently, then print their output in order
+        output = _ThreadOutput(sys.stdout)
+        sys.stdout = output
+        try:
+            with ThreadPoolExecutor(max_workers=TEST_WORKERS) as executor:
+                futures = [executor.submit(output.capture, test) for test in tests]
+        finally:
+            sys.stdout = output.stream
+        for future in futures:
+            sys.stdout.write(future.result())
 
         print_separator("ALL TESTS COMPLETED SUCCESSFULLY")
 
@@ -307,6 +401,5 @@ def main():
         print_separator("TESTS FAILED")
         raise
 
-
 if __name__ == "__main__":
     main()
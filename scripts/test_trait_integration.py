@@ -7,8 +7,10 @@ This script verifies:
 3. Sample trait queries return expected results
 """
 
+import io
 import logging
 import sys
+from contextlib import redirect_stdout
 from pathlib import Path
 
 # Add parent directory to path
@@ -29,6 +31,16 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _run_buffered(test, *args):
+    """Run a test with its output collected and written to stdout in one go."""
+    buffer = io.StringIO()
+    try:
+        with redirect_stdout(buffer):
+            return test(*args)
+    finally:
+        sys.stdout.write(buffer.getvalue())
+
+
 def test_database_initialization():
     """Test 1: Verify trait database can be initialized."""
     print("=" * 70)
@@ -177,7 +189,7 @@ def main():
     print("=" * 70 + "\n")
 
     # Initialize database
-    trait_db = test_database_initialization()
+    trait_db = _run_buffered(test_database_initialization)
     if not trait_db:
         print("\n[FAIL] FAILED: Could not initialize database")
         return
@@ -186,16 +198,16 @@ def main():
     tests_passed = 0
     total_tests = 5
 
-    if test_statistics(trait_db):
+    if _run_buffered(test_statistics, trait_db):
         tests_passed += 1
 
-    if test_trait_lookup(trait_db):
+    if _run_buffered(test_trait_lookup, trait_db):
         tests_passed += 1
 
-    if test_trait_query(trait_db):
+    if _run_buffered(test_trait_query, trait_db):
         tests_passed += 1
 
-    if test_categorical_query(trait_db):
+    if _run_buffered(test_categorical_query, trait_db):
         tests_passed += 1
 
     # Summary
@@ -1,12 +1,17 @@
 """Quick OLS URI validator and canonicalizer
 
 Usage:
-    python scripts/validate_uris.py --csv schemas/traits_freshwater.csv --ttl schemas/traits_freshwater.ttl
+    python scripts/validate_uris.py --csv schemas/traits_freshwater.csv --ttl schemas/traits_freshwater.ttl [--no-cache]
 
 - Checks URI-like values in selected CSV columns against the EBI OLS API
-- Replaces matched values with the canonical OLS iri
-- Writes a backed-up copy of original file and replaces original in-place
+  (all IRIs in the file are looked up once, concurrently, before rows are rewritten)
+- Replaces matched values with the canonical OLS iri; IRIs already in canonical OBO PURL form
+  (http://purl.obolibrary.org/obo/ENVO_00000447) are accepted without a lookup
+- Writes a backed-up copy of original file and replaces original in-place; rows are streamed
+  through a temporary file, so the CSV is never held in memory
 - Produces a small report of replacements and not-found entries
+- When requests-cache is installed, OLS responses are cached on disk for 30 days
+  (`.ols_cache.sqlite`), so re-runs only query URIs not seen before. Use `--no-cache` to disable.
 """
 
 import argparse
@@ -16,11 +21,36 @@ import os
 import re
 import shutil
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from pathlib import Path
+from typing import Optional
 from urllib.parse import quote_plus
 
 import requests
 
+try:
+    import requests_cache
+
+    _HAS_REQUESTS_CACHE = True
+except ImportError:
+    requests_cache = None
+    _HAS_REQUESTS_CACHE = False
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from apis.base_api import create_session
+
 OLS_BASE = "https://www.ebi.ac.uk/ols/api"
+# IRI lookups issued in parallel while prefetching
+OLS_WORKERS = 16
+OLS_CACHE_NAME = ".ols_cache"
+OLS_CACHE_EXPIRE = timedelta(days=30)
+# Retries for 429/5xx and connection errors, with exponential backoff (Retry-After honoured)
+OLS_RETRIES = 5
+OLS_BACKOFF_FACTOR = 0.5
 
 # Columns in the CSV we will validate (comma-separated URIs may appear)
 URI_COLUMNS = [
@@ -39,31 +69,115 @@ CURIE_PREFIXES = {
     "RO": "http://purl.obolibrary.org/obo/RO_",
 }
 
+# Column -> allowed ontology names (lowercase)
+COLUMN_ONTOLOGY = {
+    "traitURI": frozenset({"eco", "pco", "to"}),
+    "feeding_mode_term_uri": frozenset({"eco", "pco"}),
+    "food_item_uri": frozenset({"foodon"}),
+    "relation_uri": frozenset({"ro"}),
+    "habitat_envo_uri": frozenset({"envo"}),
+    "substrate_envo_uri": frozenset({"envo"}),
+}
+
+# CURIE ids that are expanded to OBO IRIs: numeric (possibly zero-padded) or upper-case words
+_CURIE_NUMERIC_RE = re.compile(r"^\d+$|^0+\d+")
+_CURIE_WORD_RE = re.compile(r"^[A-Za-z0-9_]+$")
+# IRIs already in canonical OBO PURL form, e.g. http://purl.obolibrary.org/obo/ENVO_00000123
+_CANON_OBO_RE = re.compile(r"^https?://purl\.obolibrary\.org/obo/([A-Z]+)_\d+$")
+
+
+# IRI -> (canonical_iri, ontology_name) answers already fetched in this run
+_iri_results: dict[str, tuple[Optional[str], Optional[str]]] = {}
+# IRIs whose lookup failed because OLS could not be reached; left for a later run
+_failed_iris: set[str] = set()
+# Session for all OLS requests; see get_session()
+_session = None
+
+
+def create_ols_session(use_cache=True):
+    """Keep-alive session for OLS, caching responses on disk when requests-cache is available.
+
+    The connection pool holds one connection per prefetch worker, so concurrent lookups
+    reuse open TLS connections to OLS.
+    """
+    cached = None
+    if use_cache and _HAS_REQUESTS_CACHE:
+        cached = requests_cache.CachedSession(
+            OLS_CACHE_NAME,
+            backend="sqlite",
+            allowable_codes=(200,),
+            expire_after=OLS_CACHE_EXPIRE,
+        )
+    return create_session(
+        pool_maxsize=OLS_WORKERS,
+        session=cached,
+        retry_total=OLS_RETRIES,
+        backoff_factor=OLS_BACKOFF_FACTOR,
+    )
+
+
+def get_session():
+    """The session OLS requests go through, created with the on-disk cache on first use."""
+    global _session
+    if _session is None:
+        _session = create_ols_session()
+    return _session
+
 
 def query_ols_by_iri(iri):
-    """Query OLS terms endpoint by IRI. Return tuple (canonical_iri, ontology_name) or (None, None)."""
-    url = f"{OLS_BASE}/terms?iri={quote_plus(iri)}"
+    """Query OLS terms endpoint by IRI. Return tuple (canonical_iri, ontology_name) or (None, None).
+
+    (None, None) is also returned when OLS could not be reached; such IRIs are listed in
+    _failed_iris and not remembered as unknown.
+    """
+    if iri not in _iri_results and iri not in _failed_iris:
+        result = _resolve_iri(iri)
+        if result is not None:
+            _iri_results[iri] = result
+    return _iri_results.get(iri, (None, None))
+
+
+def _resolve_iri(iri):
+    """_fetch_ols_by_iri, but returns None (and records the IRI) instead of raising on network errors."""
     try:
-        r = requests.get(url, timeout=10)
-        r.raise_for_status()
-        j = r.json()
-        terms = j.get("_embedded", {}).get("terms", [])
-        if terms:
-            t = terms[0]
-            return t.get("iri"), t.get("ontology_name") or t.get("ontology")
+        return _fetch_ols_by_iri(iri)
+    except (requests.RequestException, ValueError) as e:
+        print(f"OLS query error for {iri}: {e}")
+        _failed_iris.add(iri)
+        return None
     except Exception as e:
+        # An unexpected response shape: treat the IRI as unknown rather than abort the run
         print(f"OLS query error for {iri}: {e}")
+        return None, None
+
+
+def _fetch_ols_by_iri(iri):
+    """(canonical_iri, ontology_name) for an IRI, or (None, None) if OLS does not know it.
+
+    Raises requests.RequestException when OLS cannot be reached or keeps failing after retries.
+    """
+    # Only the first matching term is used
+    url = f"{OLS_BASE}/terms?iri={quote_plus(iri)}&size=1"
+    r = get_session().get(url, timeout=10)
+    if r.status_code == 404:
+        return None, None
+    r.raise_for_status()
+    terms = r.json().get("_embedded", {}).get("terms", [])
+    if terms:
+        t = terms[0]
+        return t.get("iri"), t.get("ontology_name") or t.get("ontology")
     return None, None
 
 
 def search_ols_by_label(label, ontology_filter=None):
     """Fallback: search for a label (q) and optionally filter by ontology; return (iri, ontology_name) or (None, None)."""
     q = quote_plus(label)
-    url = f"{OLS_BASE}/search?q={q}&rows=20"
+    # Only the top hit's iri and ontology are used, so ask OLS for just those
+    url = f"{OLS_BASE}/search?q={q}&rows=1&fieldList=iri,ontology_name,ontology"
     if ontology_filter:
         url += f"&ontology={ontology_filter}"
     try:
-        r = requests.get(url, timeout=10)
+        r = get_session().get(url, timeout=10)
         r.raise_for_status()
         j = r.json()
         docs = j.get("response", {}).get("docs", [])
@@ -75,48 +189,117 @@ def search_ols_by_label(label, ontology_filter=None):
     return None, None
 
 
+def _split_curie(part):
+    """Split a CURIE like ECO:0000213 into (prefix, rest) if canonicalize_value would expand it, else None."""
+    if ":" not in part:
+        return None
+    pre, rest = part.split(":", 1)
+    pre = pre.upper()
+    if pre not in CURIE_PREFIXES:
+        return None
+    if _CURIE_NUMERIC_RE.match(rest) or (rest.isupper() and _CURIE_WORD_RE.match(rest)):
+        return pre, rest
+    return None
+
+
+def _expand_curie(pre, rest):
+    """Canonical OBO IRI for a CURIE, e.g. ECO:213 -> http://purl.obolibrary.org/obo/ECO_0000213."""
+    rest_norm = rest.zfill(7) if rest.isdigit() else rest
+    return CURIE_PREFIXES[pre] + rest_norm
+
+
+def _canonical_obo_iri(iri, expected_ontologies):
+    """(http_iri, ontology_name) for an OBO PURL that needs no OLS lookup, else (None, None).
+
+    Only IRIs from a known CURIE prefix that is allowed by expected_ontologies (a lowercase
+    frozenset; empty allows all) are accepted as is.
+    """
+    m = _CANON_OBO_RE.match(iri)
+    if not m or m.group(1) not in CURIE_PREFIXES:
+        return None, None
+    ontology = m.group(1).lower()
+    if expected_ontologies and ontology not in expected_ontologies:
+        return None, None
+    return "http://" + iri.split("://", 1)[1], ontology
+
+
+def iri_candidates(value, expected_ontologies=frozenset()):
+    """IRIs canonicalize_value would look up by IRI for this cell value."""
+    for p in (p.strip() for p in (value or "").split(";")):
+        if p.startswith("http://") or p.startswith("https://"):
+            if not _canonical_obo_iri(p, expected_ontologies)[0]:
+                yield p
+        elif p:
+            curie = _split_curie(p)
+            if curie:
+                yield _expand_curie(*curie)
+
+
+def prefetch_iris(iris, max_workers=OLS_WORKERS):
+    """Look up many IRIs concurrently, so later query_ols_by_iri calls are answered from memory."""
+    pending = [
+        iri
+        for iri in dict.fromkeys(iris)
+        if iri not in _iri_results and iri not in _failed_iris
+    ]
+    if not pending:
+        return
+    get_session()  # create it before the worker threads need it
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(pending))) as executor:
+        _iri_results.update(
+            (iri, result)
+            for iri, result in zip(
+                pending, executor.map(_resolve_iri, pending), strict=True
+            )
+            if result is not None
+        )
+
+
+def _canonicalize_part(p, expected_ontologies):
+    """(canonical_iri, ontology_name) for one URI or CURIE of a cell, or (None, None)."""
+    canon = canon_ont = None
+    # If looks like a URI, query OLS directly (canonical OBO PURLs are accepted as is)
+    if p.startswith("http://") or p.startswith("https://"):
+        canon, canon_ont = _canonical_obo_iri(p, expected_ontologies)
+        if not canon:
+            canon, canon_ont = query_ols_by_iri(p)
+        if not canon:
+            # try to search by last path segment or short form
+            short = p.split("/")[-1]
+            short = short.replace("_", ":") if "_" in short else short
+            canon, canon_ont = search_ols_by_label(short)
+    # Try CURIE like ECO:0000213 or ECO:DepositFeeding
+    elif ":" in p:
+        pre, rest = p.split(":", 1)
+        pre = pre.upper()
+        curie = _split_curie(p)
+        if curie:
+            # numeric (or upper-case) id: expand to canonical OBO form, e.g. ECO_0000213
+            canon, canon_ont = query_ols_by_iri(_expand_curie(*curie))
+        if not canon:
+            # Try to search by label
+            canon, canon_ont = search_ols_by_label(rest, ontology_filter=pre.lower())
+    return canon, canon_ont
+
+
 def canonicalize_value(value, expected_ontologies=None):
     """Given a string value (uri, semicolon-list, or CURIE), try to canonicalize each URI inside and return new string and mapping.
 
     expected_ontologies: set/list of ontology short names (e.g., {'envo','eco','foodon','ro'}) to restrict matches.
+        A frozenset is taken to be lowercase already and used as is.
     """
     if not value or not value.strip():
         return value, {}
 
-    expected_ontologies = {e.lower() for e in (expected_ontologies or [])}
+    if not isinstance(expected_ontologies, frozenset):
+        expected_ontologies = frozenset(e.lower() for e in (expected_ontologies or []))
 
     parts = [p.strip() for p in value.split(";") if p.strip()]
     new_parts = []
     mapping = {}
     for p in parts:
         original = p
-        canon = None
-        canon_ont = None
-        # If looks like a URI, query OLS directly
-        if p.startswith("http://") or p.startswith("https://"):
-            canon, canon_ont = query_ols_by_iri(p)
-            if not canon:
-                # try to search by last path segment or short form
-                short = p.split("/")[-1]
-                short = short.replace("_", ":") if "_" in short else short
-                canon, canon_ont = search_ols_by_label(short)
-        else:
-            # Try CURIE like ECO:0000213 or ECO:DepositFeeding
-            if ":" in p:
-                pre, rest = p.split(":", 1)
-                pre = pre.upper()
-                if pre in CURIE_PREFIXES and re.match(r"^\d+$|^0+\d+|^[A-Za-z0-9_]+$", rest):
-                    # if numeric id (or mixed), expand
-                    if re.match(r"^\d+$", rest) or re.match(r"^0+\d+", rest) or rest.isupper():
-                        # numeric form possibly like 0000213 or 213
-                        # form to canonical OBO: ECO_0000213
-                        # ensure underscore
-                        rest_norm = rest.zfill(7) if rest.isdigit() else rest
-                        candidate = CURIE_PREFIXES[pre] + rest_norm
-                        canon, canon_ont = query_ols_by_iri(candidate)
-                if not canon:
-                    # Try to search by label
-                    canon, canon_ont = search_ols_by_label(rest, ontology_filter=pre.lower())
+        canon, canon_ont = _canonicalize_part(p, expected_ontologies)
         # Accept replacement only if ontology matches expected_ontologies when provided
         if canon and (not expected_ontologies or (canon_ont and canon_ont.lower() in expected_ontologies)):
             new_parts.append(canon)
@@ -127,53 +310,81 @@ def canonicalize_value(value, expected_ontologies=None):
     return ";".join(new_parts), mapping
 
 
+def _canonicalize_cell(col, val, resolved, replaced):
+    """New value for one URI cell, recording its replacements in replaced.
+
+    resolved memoizes canonicalize_value per (column, value), since cells repeat a
+    small vocabulary.
+    """
+    if (col, val) not in resolved:
+        expected = COLUMN_ONTOLOGY.get(col, None)
+        resolved[col, val] = canonicalize_value(val, expected_ontologies=expected)
+    newval, mapping = resolved[col, val]
+    # Only commit replacements where at least one part matched allowed ontology
+    if not any(v for v in mapping.values() if v is not None):
+        return val
+    for k, v in mapping.items():
+        if v and k != v:
+            replaced[k] = v
+    return newval
+
+
 def process_csv(path):
     bak = path + ".bak"
     shutil.copy(path, bak)
     print(f"Backup written to {bak}")
     replaced = {}
     checked = 0
+    # (column, value) -> canonicalize_value result; see _canonicalize_cell
+    resolved = {}
 
-    # Column -> allowed ontology prefixes mapping
-    COLUMN_ONTOLOGY = {
-        "traitURI": {"eco", "pco", "to"},
-        "feeding_mode_term_uri": {"eco", "pco"},
-        "food_item_uri": {"foodon"},
-        "relation_uri": {"ro"},
-        "habitat_envo_uri": {"envo"},
-        "substrate_envo_uri": {"envo"},
-    }
-
+    # First pass: resolve every IRI in the file up front, concurrently, without keeping the rows
     with open(path, newline="", encoding="utf-8") as fh:
-        reader = list(csv.DictReader(fh))
-        fieldnames = reader[0].keys() if reader else []
-
-    for row in reader:
-        for col in URI_COLUMNS:
-            if col in row:
-                val = row[col]
-                if val and val.strip():
-                    checked += 1
-                    expected = COLUMN_ONTOLOGY.get(col, None)
-                    newval, mapping = canonicalize_value(val, expected_ontologies=expected)
-                    # Only commit replacements where at least one part matched allowed ontology
-                    if any(v for v in mapping.values() if v is not None):
-                        row[col] = newval
-                        for k, v in mapping.items():
-                            if v and k != v:
-                                replaced[k] = v
-
-    # write back
-    out_path = path
-    with open(out_path, "w", newline="", encoding="utf-8") as fh:
-        writer = csv.DictWriter(fh, fieldnames=list(fieldnames))
-        writer.writeheader()
-        for row in reader:
-            writer.writerow(row)
+        prefetch_iris(
+            iri
+            for row in csv.DictReader(fh)
+            for col in URI_COLUMNS
+            if row.get(col)
+            for iri in iri_candidates(row[col], COLUMN_ONTOLOGY.get(col, frozenset()))
+        )
+
+    # Second pass: canonicalize row by row, streaming into a temporary file next to the CSV
+    out = tempfile.NamedTemporaryFile(
+        "w",
+        newline="",
+        encoding="utf-8",
+        dir=os.path.dirname(os.path.abspath(path)),
+        delete=False,
+    )
+    try:
+        with open(path, newline="", encoding="utf-8") as fh, out:
+            reader = csv.DictReader(fh)
+            writer = csv.DictWriter(out, fieldnames=reader.fieldnames or [])
+            writer.writeheader()
+            for row in reader:
+                for col in URI_COLUMNS:
+                    val = row.get(col)
+                    if val and val.strip():
+                        checked += 1
+                        row[col] = _canonicalize_cell(col, val, resolved, replaced)
+                writer.writerow(row)
+    except BaseException:
+        os.unlink(out.name)
+        raise
+
+    # write back, keeping the original file's permissions
+    shutil.copymode(path, out.name)
+    os.replace(out.name, path)
 
     print(f"Checked {checked} URI-containing cells; replacements made: {len(replaced)}")
     for k, v in replaced.items():
         print(f"  {k} -> {v}")
+    if _failed_iris:
+        print(
+            f"OLS could not be reached for {len(_failed_iris)} IRIs; re-run to retry them:"
+        )
+        for iri in sorted(_failed_iris):
+            print(f"  {iri}")
     return replaced
 
 
@@ -197,8 +408,14 @@ def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("--csv", required=True)
     parser.add_argument("--ttl", required=False)
+    parser.add_argument(
+        "--no-cache", action="store_true", help="do not cache OLS responses on disk"
+    )
     args = parser.parse_args()
 
+    global _session
+    _session = create_ols_session(use_cache=not args.no_cache)
+
     if not os.path.exists(args.csv):
         print("CSV not found", args.csv)
         sys.exit(1)
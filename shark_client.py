@@ -23,11 +23,22 @@ Additional Features:
 - Mock data for offline testing
 """
 
-from typing import Any, Dict, List, Optional
+import functools
+from datetime import timedelta
+from types import MappingProxyType
+from typing import Any, Dict, List, Optional, Union
 
 import pandas as pd
 import requests
 
+try:
+    import requests_cache
+
+    _HAS_REQUESTS_CACHE = True
+except ImportError:
+    requests_cache = None
+    _HAS_REQUESTS_CACHE = False
+
 # Import the separate API implementations
 from apis import (
     AlgaeBaseApi,
@@ -40,6 +51,7 @@ from apis import (
     SharkApi,
     WormsApi,
 )
+from apis.base_api import create_session
 from apis.mock_data import (
     get_mock_shark_datasets,
     get_mock_shark_parameters,
@@ -49,6 +61,321 @@ from apis.mock_data import (
     get_mock_dyntaxa_taxa,
     get_mock_worms_taxa,
 )
+from app_modules.utils import to_arrow_dtypes
+
+# On-disk HTTP cache for name resolution. Taxonomic identifiers are
+# near-immutable, so repeat searches are served locally; other endpoints
+# (SHARK monitoring data, dataset downloads, ...) are not cached.
+TAXA_CACHE_NAME = "taxa_cache"
+TAXA_CACHE_EXPIRE_AFTER = {
+    "dyntaxa": timedelta(days=7),
+    "worms": timedelta(days=7),
+    "algaebase": timedelta(days=7),
+    "obis": timedelta(days=1),  # occurrence counts grow, refresh daily
+}
+
+# Reference lists (per endpoint, relative paths) that change over days or
+# weeks; cached in the same database and refreshed daily.
+REFERENCE_CACHE_EXPIRE_AFTER = timedelta(days=1)
+REFERENCE_ENDPOINTS = {
+    "shark": ("datasets", "stations", "parameters", "codes", "options"),
+    "ioc_hab": ("list",),
+    "ioc_toxins": ("toxins",),
+    "nordic_microalgae": ("taxa",),
+}
+
+# Low-cardinality text columns stored as pandas categoricals in results, so
+# unique/nunique in the summary panels work on small category codes.
+CATEGORICAL_COLUMNS = (
+    "parameter",
+    "station",
+    "rank",
+    "genus",
+    "class",
+    "toxicity",
+    "type",
+    "harmfulness",
+)
+
+
+def _categorize(df: pd.DataFrame) -> pd.DataFrame:
+    """Return df with known low-cardinality columns converted to categoricals."""
+    columns = [col for col in CATEGORICAL_COLUMNS if col in df.columns]
+    if not columns:
+        return df
+    # Shallow copy so frames cached by the API clients are left untouched
+    df = df.copy(deep=False)
+    for col in columns:
+        try:
+            df[col] = df[col].astype("category")
+        except TypeError:
+            # Unhashable values (e.g. nested dicts) cannot be categories
+            pass
+    return df
+
+
+@functools.lru_cache(maxsize=1)
+def _mock_datasets() -> pd.DataFrame:
+    """Return mock dataset data for testing."""
+    return pd.DataFrame(
+        [
+            {
+                "id": "PHYTO",
+                "name": "Phytoplankton",
+                "description": "Phytoplankton monitoring data",
+            },
+            {
+                "id": "ZOOBENTHOS",
+                "name": "Zoobenthos",
+                "description": "Benthic fauna monitoring data",
+            },
+            {
+                "id": "EPIPHYTIC",
+                "name": "Epiphytic",
+                "description": "Epiphytic algae monitoring data",
+            },
+            {
+                "id": "SEDIMENT",
+                "name": "Sediment",
+                "description": "Sediment chemistry data",
+            },
+            {
+                "id": "PHYSCHEM",
+                "name": "Physical Chemical",
+                "description": "Physical and chemical parameters",
+            },
+        ]
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _mock_stations() -> pd.DataFrame:
+    """Return mock station data for testing."""
+    return pd.DataFrame(
+        [
+            {
+                "id": "BY1",
+                "name": "Byfjorden 1",
+                "latitude": 58.4,
+                "longitude": 11.3,
+            },
+            {
+                "id": "BY2",
+                "name": "Byfjorden 2",
+                "latitude": 58.3,
+                "longitude": 11.2,
+            },
+            {
+                "id": "BY5",
+                "name": "Byfjorden 5",
+                "latitude": 58.2,
+                "longitude": 11.1,
+            },
+            {
+                "id": "BY10",
+                "name": "Byfjorden 10",
+                "latitude": 58.1,
+                "longitude": 11.0,
+            },
+        ]
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _mock_parameters() -> pd.DataFrame:
+    """Return mock parameter data for testing."""
+    return pd.DataFrame(
+        [
+            {"id": "TEMP", "name": "Temperature", "unit": "°C"},
+            {"id": "SAL", "name": "Salinity", "unit": "PSU"},
+            {"id": "CHL", "name": "Chlorophyll a", "unit": "µg/L"},
+            {"id": "PH", "name": "pH", "unit": ""},
+            {"id": "O2", "name": "Oxygen", "unit": "mg/L"},
+        ]
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _mock_dyntaxa_taxa() -> pd.DataFrame:
+    """Return mock Dyntaxa taxa data for testing."""
+    return pd.DataFrame(
+        [
+            {
+                "scientificName": "Baltic herring",
+                "taxonId": 1001,
+                "rank": "species",
+            },
+            {"scientificName": "Atlantic cod", "taxonId": 1002, "rank": "species"},
+            {
+                "scientificName": "European perch",
+                "taxonId": 1003,
+                "rank": "species",
+            },
+        ]
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _mock_worms_records() -> pd.DataFrame:
+    """Return mock WoRMS records for testing."""
+    return pd.DataFrame(
+        [
+            {
+                "AphiaID": 126436,
+                "scientificname": "Clupea harengus",
+                "rank": "Species",
+            },
+            {
+                "AphiaID": 126439,
+                "scientificname": "Gadus morhua",
+                "rank": "Species",
+            },
+            {
+                "AphiaID": 154641,
+                "scientificname": "Perca fluviatilis",
+                "rank": "Species",
+            },
+        ]
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _mock_algaebase_taxa() -> pd.DataFrame:
+    """Return mock AlgaeBase taxa data for testing."""
+    return pd.DataFrame(
+        [
+            {
+                "name": "Skeletonema costatum",
+                "genus": "Skeletonema",
+                "class": "Bacillariophyceae",
+            },
+            {
+                "name": "Thalassiosira rotula",
+                "genus": "Thalassiosira",
+                "class": "Bacillariophyceae",
+            },
+            {
+                "name": "Chaetoceros curvisetus",
+                "genus": "Chaetoceros",
+                "class": "Bacillariophyceae",
+            },
+        ]
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _mock_hab_list() -> pd.DataFrame:
+    """Return mock IOC-UNESCO HAB list for testing."""
+    return pd.DataFrame(
+        [
+            {
+                "species": "Alexandrium catenella",
+                "toxicity": "High",
+                "region": "Global",
+            },
+            {"species": "Dinophysis acuta", "toxicity": "High", "region": "Global"},
+            {
+                "species": "Pseudo-nitzschia multiseries",
+                "toxicity": "Medium",
+                "region": "Global",
+            },
+        ]
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _mock_toxin_list() -> pd.DataFrame:
+    """Return mock IOC-UNESCO toxin list for testing."""
+    return pd.DataFrame(
+        [
+            {
+                "toxin": "Saxitoxin",
+                "type": "Neurotoxin",
+                "source": "Dinoflagellates",
+            },
+            {
+                "toxin": "Okadaic acid",
+                "type": "Diarrhetic",
+                "source": "Dinoflagellates",
+            },
+            {"toxin": "Domoic acid", "type": "Neurotoxin", "source": "Diatoms"},
+        ]
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _mock_nordic_microalgae_taxa() -> pd.DataFrame:
+    """Return mock Nordic Microalgae taxa for testing."""
+    return pd.DataFrame(
+        [
+            {
+                "name": "Aphanizomenon flos-aquae",
+                "harmfulness": "Toxic",
+                "region": "Nordic",
+            },
+            {
+                "name": "Microcystis aeruginosa",
+                "harmfulness": "Toxic",
+                "region": "Nordic",
+            },
+            {
+                "name": "Nodularia spumigena",
+                "harmfulness": "Toxic",
+                "region": "Nordic",
+            },
+        ]
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _mock_obis_records() -> pd.DataFrame:
+    """Return mock OBIS records for testing."""
+    return pd.DataFrame(
+        [
+            {
+                "species": "Clupea harengus",
+                "longitude": 11.3,
+                "latitude": 58.4,
+                "depth": 10,
+            },
+            {
+                "species": "Gadus morhua",
+                "longitude": 11.2,
+                "latitude": 58.3,
+                "depth": 15,
+            },
+            {
+                "species": "Perca fluviatilis",
+                "longitude": 11.1,
+                "latitude": 58.2,
+                "depth": 5,
+            },
+        ]
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _mock_plankton_toolbox_taxa() -> pd.DataFrame:
+    """Return mock Plankton Toolbox taxa for testing."""
+    return pd.DataFrame(
+        [
+            {
+                "name": "Skeletonema costatum",
+                "biovolume": 1500,
+                "category": "Diatom",
+            },
+            {
+                "name": "Thalassiosira rotula",
+                "biovolume": 1200,
+                "category": "Diatom",
+            },
+            {
+                "name": "Chaetoceros curvisetus",
+                "biovolume": 1800,
+                "category": "Diatom",
+            },
+        ]
+    )
 
 
 class SHARKClient:
@@ -67,8 +394,26 @@ class SHARKClient:
     - Nordic Microalgae
     """
 
+    # API endpoints for the different databases; read-only and shared by all
+    # clients (an instance only gets its own mapping for a custom SHARK URL)
+    _ENDPOINTS = MappingProxyType(
+        {
+            "shark": "https://sharkdata.smhi.se/api/",
+            "dyntaxa": "https://taxon.artdatabanken.se/api/",
+            "worms": "https://www.marinespecies.org/rest/",
+            "algaebase": "https://www.algaebase.org/api/",
+            "ioc_hab": "https://www.marinespecies.org/hab/api/",  # Updated HAB endpoint
+            "ioc_toxins": "https://toxins.hais.ioc-unesco.org/api/",
+            "obis": "https://api.obis.org/",
+            "nordic_microalgae": "https://nordicmicroalgae.org/api/",
+        }
+    )
+
     def __init__(
-        self, base_url: str = "https://sharkdata.smhi.se/api/", use_mock: bool = False
+        self,
+        base_url: str = _ENDPOINTS["shark"],
+        use_mock: bool = False,
+        use_cache: bool = True,
     ):
         """
         Initialize SHARK client.
@@ -76,286 +421,168 @@ class SHARKClient:
         Args:
             base_url: Base URL for SHARK API
             use_mock: Whether to use mock data for testing when API is unavailable
+            use_cache: Whether to cache taxonomic lookups on disk (requires
+                requests-cache)
         """
         self.base_url = base_url
         self.use_mock = use_mock
-        self.session = requests.Session()
 
-        # API endpoints for different databases
-        self.endpoints = {
-            "shark": base_url,
-            "dyntaxa": "https://taxon.artdatabanken.se/api/",
-            "worms": "https://www.marinespecies.org/rest/",
-            "algaebase": "https://www.algaebase.org/api/",
-            "ioc_hab": "https://www.marinespecies.org/hab/api/",  # Updated HAB endpoint
-            "ioc_toxins": "https://toxins.hais.ioc-unesco.org/api/",
-            "obis": "https://api.obis.org/",
-            "nordic_microalgae": "https://nordicmicroalgae.org/api/",
-        }
+        if base_url == self._ENDPOINTS["shark"]:
+            self.endpoints = self._ENDPOINTS
+        else:
+            self.endpoints = MappingProxyType({**self._ENDPOINTS, "shark": base_url})
+        self.session = self._create_session(use_cache)
 
-        # Initialize API clients
-        self.shark_api = SharkApi(base_url, self.session)
-        self.dyntaxa_api = DyntaxaApi(self.endpoints["dyntaxa"], self.session)
-        self.worms_api = WormsApi(self.endpoints["worms"], self.session)
-        self.algaebase_api = AlgaeBaseApi(self.endpoints["algaebase"], self.session)
-        self.ioc_hab_api = IocHabApi(self.endpoints["ioc_hab"], self.session)
-        self.ioc_toxins_api = IocToxinsApi(self.endpoints["ioc_toxins"], self.session)
-        self.obis_api = ObisApi(self.endpoints["obis"], self.session)
-        self.nordic_microalgae_api = NordicMicroalgaeApi(
-            self.endpoints["nordic_microalgae"], self.session
-        )
-        self.plankton_toolbox_api = PlanktonToolboxApi()  # No specific base URL yet
+    # API clients are created on first use; most sessions only touch a few of them
+    @functools.cached_property
+    def shark_api(self) -> SharkApi:
+        return SharkApi(self.base_url, self.session)
+
+    @functools.cached_property
+    def dyntaxa_api(self) -> DyntaxaApi:
+        return DyntaxaApi(self.endpoints["dyntaxa"], self.session)
+
+    @functools.cached_property
+    def worms_api(self) -> WormsApi:
+        return WormsApi(self.endpoints["worms"], self.session)
+
+    @functools.cached_property
+    def algaebase_api(self) -> AlgaeBaseApi:
+        return AlgaeBaseApi(self.endpoints["algaebase"], self.session)
+
+    @functools.cached_property
+    def ioc_hab_api(self) -> IocHabApi:
+        return IocHabApi(self.endpoints["ioc_hab"], self.session)
+
+    @functools.cached_property
+    def ioc_toxins_api(self) -> IocToxinsApi:
+        return IocToxinsApi(self.endpoints["ioc_toxins"], self.session)
+
+    @functools.cached_property
+    def obis_api(self) -> ObisApi:
+        return ObisApi(self.endpoints["obis"], self.session)
+
+    @functools.cached_property
+    def nordic_microalgae_api(self) -> NordicMicroalgaeApi:
+        return NordicMicroalgaeApi(self.endpoints["nordic_microalgae"], self.session)
+
+    @functools.cached_property
+    def plankton_toolbox_api(self) -> PlanktonToolboxApi:
+        return PlanktonToolboxApi()  # No specific base URL yet
 
-        # Freshwater Ecology (freshwaterecology.info) integration
+    @functools.cached_property
+    def fwe_api(self):
+        """Freshwater Ecology (freshwaterecology.info) client, or None if unavailable."""
         try:
             from apis.freshwater_ecology_api import FreshwaterEcologyApi
 
-            self.fwe_api = FreshwaterEcologyApi()
+            return FreshwaterEcologyApi()
         except Exception:
             # If import fails (e.g., during packaging), provide a placeholder attribute
-            self.fwe_api = None
+            return None
+
+    def _create_session(self, use_cache: bool) -> requests.Session:
+        """
+        Create the HTTP session shared by all sub-API clients.
+
+        The session retries transient errors and keeps a pool of connections
+        open per host, sized for the concurrent per-taxon lookups. When
+        requests-cache is installed, taxonomic endpoints listed in
+        TAXA_CACHE_EXPIRE_AFTER and the reference lists in REFERENCE_ENDPOINTS
+        are cached in a local SQLite database (served stale if the API is
+        down) and all other URLs bypass the cache.
+        """
+        if not (use_cache and _HAS_REQUESTS_CACHE):
+            return create_session()
+
+        def _pattern(name, path=""):
+            return f"{self.endpoints[name].split('://', 1)[-1]}{path}*"
+
+        # First matching pattern wins: keep dataset downloads out of the cache
+        urls_expire_after: requests_cache.ExpirationPatterns = {
+            _pattern("shark", "datasets/*/download"): requests_cache.DO_NOT_CACHE
+        }
+        urls_expire_after.update(
+            (_pattern(name), expire_after)
+            for name, expire_after in TAXA_CACHE_EXPIRE_AFTER.items()
+        )
+        urls_expire_after.update(
+            (_pattern(name, path), REFERENCE_CACHE_EXPIRE_AFTER)
+            for name, paths in REFERENCE_ENDPOINTS.items()
+            for path in paths
+        )
+        cached = requests_cache.CachedSession(
+            TAXA_CACHE_NAME,
+            backend="sqlite",
+            allowable_codes=(200,),
+            allowable_methods=("GET",),
+            expire_after=requests_cache.DO_NOT_CACHE,
+            urls_expire_after=urls_expire_after,
+            stale_if_error=True,
+        )
+        return create_session(session=cached)
+
+    def clear_cache(self) -> None:
+        """Remove all cached HTTP responses (no-op without requests-cache)."""
+        cache = getattr(self.session, "cache", None)
+        if cache is not None:
+            cache.clear()
+
+    def close(self) -> None:
+        """Close the shared HTTP session and its pooled connections."""
+        self.session.close()
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
 
     def _get_mock_datasets(self) -> pd.DataFrame:
         """Return mock dataset data for testing."""
-        return pd.DataFrame(
-            [
-                {
-                    "id": "PHYTO",
-                    "name": "Phytoplankton",
-                    "description": "Phytoplankton monitoring data",
-                },
-                {
-                    "id": "ZOOBENTHOS",
-                    "name": "Zoobenthos",
-                    "description": "Benthic fauna monitoring data",
-                },
-                {
-                    "id": "EPIPHYTIC",
-                    "name": "Epiphytic",
-                    "description": "Epiphytic algae monitoring data",
-                },
-                {
-                    "id": "SEDIMENT",
-                    "name": "Sediment",
-                    "description": "Sediment chemistry data",
-                },
-                {
-                    "id": "PHYSCHEM",
-                    "name": "Physical Chemical",
-                    "description": "Physical and chemical parameters",
-                },
-            ]
-        )
+        return _mock_datasets().copy(deep=False)
 
     def _get_mock_stations(self) -> pd.DataFrame:
         """Return mock station data for testing."""
-        return pd.DataFrame(
-            [
-                {
-                    "id": "BY1",
-                    "name": "Byfjorden 1",
-                    "latitude": 58.4,
-                    "longitude": 11.3,
-                },
-                {
-                    "id": "BY2",
-                    "name": "Byfjorden 2",
-                    "latitude": 58.3,
-                    "longitude": 11.2,
-                },
-                {
-                    "id": "BY5",
-                    "name": "Byfjorden 5",
-                    "latitude": 58.2,
-                    "longitude": 11.1,
-                },
-                {
-                    "id": "BY10",
-                    "name": "Byfjorden 10",
-                    "latitude": 58.1,
-                    "longitude": 11.0,
-                },
-            ]
-        )
+        return _mock_stations().copy(deep=False)
 
     def _get_mock_parameters(self) -> pd.DataFrame:
         """Return mock parameter data for testing."""
-        return pd.DataFrame(
-            [
-                {"id": "TEMP", "name": "Temperature", "unit": "°C"},
-                {"id": "SAL", "name": "Salinity", "unit": "PSU"},
-                {"id": "CHL", "name": "Chlorophyll a", "unit": "µg/L"},
-                {"id": "PH", "name": "pH", "unit": ""},
-                {"id": "O2", "name": "Oxygen", "unit": "mg/L"},
-            ]
-        )
+        return _mock_parameters().copy(deep=False)
 
     def _get_mock_dyntaxa_taxa(self) -> pd.DataFrame:
         """Return mock Dyntaxa taxa data for testing."""
-        return pd.DataFrame(
-            [
-                {
-                    "scientificName": "Baltic herring",
-                    "taxonId": 1001,
-                    "rank": "species",
-                },
-                {"scientificName": "Atlantic cod", "taxonId": 1002, "rank": "species"},
-                {
-                    "scientificName": "European perch",
-                    "taxonId": 1003,
-                    "rank": "species",
-                },
-            ]
-        )
+        return _mock_dyntaxa_taxa().copy(deep=False)
 
     def _get_mock_worms_records(self) -> pd.DataFrame:
         """Return mock WoRMS records for testing."""
-        return pd.DataFrame(
-            [
-                {
-                    "AphiaID": 126436,
-                    "scientificname": "Clupea harengus",
-                    "rank": "Species",
-                },
-                {
-                    "AphiaID": 126439,
-                    "scientificname": "Gadus morhua",
-                    "rank": "Species",
-                },
-                {
-                    "AphiaID": 154641,
-                    "scientificname": "Perca fluviatilis",
-                    "rank": "Species",
-                },
-            ]
-        )
+        return _mock_worms_records().copy(deep=False)
 
     def _get_mock_algaebase_taxa(self) -> pd.DataFrame:
         """Return mock AlgaeBase taxa data for testing."""
-        return pd.DataFrame(
-            [
-                {
-                    "name": "Skeletonema costatum",
-                    "genus": "Skeletonema",
-                    "class": "Bacillariophyceae",
-                },
-                {
-                    "name": "Thalassiosira rotula",
-                    "genus": "Thalassiosira",
-                    "class": "Bacillariophyceae",
-                },
-                {
-                    "name": "Chaetoceros curvisetus",
-                    "genus": "Chaetoceros",
-                    "class": "Bacillariophyceae",
-                },
-            ]
-        )
+        return _mock_algaebase_taxa().copy(deep=False)
 
     def _get_mock_hab_list(self) -> pd.DataFrame:
         """Return mock IOC-UNESCO HAB list for testing."""
-        return pd.DataFrame(
-            [
-                {
-                    "species": "Alexandrium catenella",
-                    "toxicity": "High",
-                    "region": "Global",
-                },
-                {"species": "Dinophysis acuta", "toxicity": "High", "region": "Global"},
-                {
-                    "species": "Pseudo-nitzschia multiseries",
-                    "toxicity": "Medium",
-                    "region": "Global",
-                },
-            ]
-        )
+        return _mock_hab_list().copy(deep=False)
 
     def _get_mock_toxin_list(self) -> pd.DataFrame:
         """Return mock IOC-UNESCO toxin list for testing."""
-        return pd.DataFrame(
-            [
-                {
-                    "toxin": "Saxitoxin",
-                    "type": "Neurotoxin",
-                    "source": "Dinoflagellates",
-                },
-                {
-                    "toxin": "Okadaic acid",
-                    "type": "Diarrhetic",
-                    "source": "Dinoflagellates",
-                },
-                {"toxin": "Domoic acid", "type": "Neurotoxin", "source": "Diatoms"},
-            ]
-        )
+        return _mock_toxin_list().copy(deep=False)
 
     def _get_mock_nordic_microalgae_taxa(self) -> pd.DataFrame:
         """Return mock Nordic Microalgae taxa for testing."""
-        return pd.DataFrame(
-            [
-                {
-                    "name": "Aphanizomenon flos-aquae",
-                    "harmfulness": "Toxic",
-                    "region": "Nordic",
-                },
-                {
-                    "name": "Microcystis aeruginosa",
-                    "harmfulness": "Toxic",
-                    "region": "Nordic",
-                },
-                {
-                    "name": "Nodularia spumigena",
-                    "harmfulness": "Toxic",
-                    "region": "Nordic",
-                },
-            ]
-        )
+        return _mock_nordic_microalgae_taxa().copy(deep=False)
 
     def _get_mock_obis_records(self) -> pd.DataFrame:
         """Return mock OBIS records for testing."""
-        return pd.DataFrame(
-            [
-                {
-                    "species": "Clupea harengus",
-                    "longitude": 11.3,
-                    "latitude": 58.4,
-                    "depth": 10,
-                },
-                {
-                    "species": "Gadus morhua",
-                    "longitude": 11.2,
-                    "latitude": 58.3,
-                    "depth": 15,
-                },
-                {
-                    "species": "Perca fluviatilis",
-                    "longitude": 11.1,
-                    "latitude": 58.2,
-                    "depth": 5,
-                },
-            ]
-        )
+        return _mock_obis_records().copy(deep=False)
 
     def _get_mock_plankton_toolbox_taxa(self) -> pd.DataFrame:
         """Return mock Plankton Toolbox taxa for testing."""
-        return pd.DataFrame(
-            [
-                {
-                    "name": "Skeletonema costatum",
-                    "biovolume": 1500,
-                    "category": "Diatom",
-                },
-                {
-                    "name": "Thalassiosira rotula",
-                    "biovolume": 1200,
-                    "category": "Diatom",
-                },
-                {
-                    "name": "Chaetoceros curvisetus",
-                    "biovolume": 1800,
-                    "category": "Diatom",
-                },
-            ]
-        )
+        return _mock_plankton_toolbox_taxa().copy(deep=False)
 
     # ============================================================================
     # SHARK (Swedish Ocean Archive) Methods
@@ -391,8 +618,10 @@ class SHARKClient:
         limit: int = 1000,
     ) -> pd.DataFrame:
         """Search for data in SHARK database."""
-        return self.shark_api.search_data(
-            parameter, station, dataset, start_date, end_date, limit
+        return _categorize(
+            self.shark_api.search_data(
+                parameter, station, dataset, start_date, end_date, limit
+            )
         )
 
     def get_quality_control_info(self, dataset: str) -> Dict[str, Any]:
@@ -414,7 +643,9 @@ class SHARKClient:
     # Taxonomic database methods
     def match_dyntaxa_taxa(self, taxa_list: List[str]) -> pd.DataFrame:
         """Match taxa against Dyntaxa database."""
-        return self.dyntaxa_api.match_dyntaxa_taxa(taxa_list)
+        return _categorize(
+            to_arrow_dtypes(self.dyntaxa_api.match_dyntaxa_taxa(taxa_list))
+        )
 
     def construct_dyntaxa_table(self, taxon_ids: List[int]) -> pd.DataFrame:
         """Construct Dyntaxa table for given taxa."""
@@ -422,7 +653,7 @@ class SHARKClient:
 
     def get_worms_records(self, taxa_list: List[str]) -> pd.DataFrame:
         """Get WoRMS records for taxa."""
-        return self.worms_api.get_worms_records(taxa_list)
+        return _categorize(to_arrow_dtypes(self.worms_api.get_worms_records(taxa_list)))
 
     def add_worms_taxonomy(self, aphia_ids: List[int]) -> pd.DataFrame:
         """Add WoRMS taxonomy to data."""
@@ -443,7 +674,9 @@ class SHARKClient:
 
     def match_algaebase_taxa(self, search_terms: List[str]) -> pd.DataFrame:
         """Match taxa against AlgaeBase."""
-        return self.algaebase_api.match_algaebase_taxa(search_terms)
+        return _categorize(
+            to_arrow_dtypes(self.algaebase_api.match_algaebase_taxa(search_terms))
+        )
 
     def match_algaebase_genus(self, genus_names: List[str]) -> pd.DataFrame:
         """Match genera against AlgaeBase."""
@@ -451,17 +684,27 @@ class SHARKClient:
 
     def get_hab_list(self) -> pd.DataFrame:
         """Get HAB species list."""
-        return self.ioc_hab_api.get_hab_list()
+        return _categorize(self.ioc_hab_api.get_hab_list())
 
     def get_toxin_list(self) -> pd.DataFrame:
         """Get marine toxins list."""
-        return self.ioc_toxins_api.get_toxin_list()
+        return _categorize(self.ioc_toxins_api.get_toxin_list())
 
     def get_nordic_microalgae_taxa(
         self, search_params: Optional[Dict[str, Any]] = None
     ) -> pd.DataFrame:
         """Get Nordic microalgae taxa."""
-        return self.nordic_microalgae_api.get_nordic_microalgae_taxa(search_params)
+        return _categorize(
+            to_arrow_dtypes(
+                self.nordic_microalgae_api.get_nordic_microalgae_taxa(search_params)
+            )
+        )
+
+    def get_nordic_harmful_taxa(self) -> pd.DataFrame:
+        """Get Nordic microalgae taxa flagged as toxic."""
+        return _categorize(
+            to_arrow_dtypes(self.nordic_microalgae_api.get_harmful_taxa())
+        )
 
     def get_nua_harmfulness(self, taxon_ids: List[int]) -> pd.DataFrame:
         """Get NUA harmfulness information."""
@@ -490,10 +733,18 @@ class SHARKClient:
     ) -> pd.DataFrame:
         """Get OBIS occurrence records."""
         # Note: geometry parameter not currently supported in OBISAPI
-        return self.obis_api.get_obis_records(taxa_list)
+        return to_arrow_dtypes(self.obis_api.get_obis_records(taxa_list))
+
+    def lookup_xy(
+        self, data: Union[pd.DataFrame, List[Dict[str, float]]]
+    ) -> pd.DataFrame:
+        """Lookup coordinates for OBIS data.
 
-    def lookup_xy(self, data: pd.DataFrame) -> pd.DataFrame:
-        """Lookup coordinates for OBIS data."""
+        Accepts a list of {"latitude", "longitude"} dicts, or a DataFrame with
+        those columns.
+        """
+        if isinstance(data, pd.DataFrame):
+            data = data.to_dict("records")
         return self.obis_api.lookup_xy(data)
 
     def get_nomp_list(self) -> pd.DataFrame:
@@ -31,3 +31,26 @@ def test_match_algaebase_taxa_fallback_on_error():
     assert isinstance(df, pd.DataFrame)
     assert not df.empty
     assert "name" in df.columns
+
+
+@responses.activate
+def test_match_algaebase_genus_keeps_input_order_and_skips_failures():
+    api = AlgaeBaseAPI()
+    url = api.base_url.rstrip("/") + "/genus"
+    for genus in ("Fucus", "Ulva"):
+        responses.add(
+            responses.GET,
+            url,
+            match=[responses.matchers.query_param_matcher({"genus": genus})],
+            json=[{"genus": genus}],
+            status=200,
+        )
+    responses.add(
+        responses.GET,
+        url,
+        match=[responses.matchers.query_param_matcher({"genus": "Nope"})],
+        status=404,
+    )
+
+    df = api.match_algaebase_genus(["Fucus", "Nope", "Ulva"])
+    assert df["genus"].tolist() == ["Fucus", "Ulva"]
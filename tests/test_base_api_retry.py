@@ -15,3 +15,25 @@ def test_default_session_has_retry_adapter():
     assert "http://" in d.session.adapters
     # The adapter should be a requests.adapters.HTTPAdapter
     assert isinstance(d.session.adapters["https://"], requests.adapters.HTTPAdapter)
+
+
+def test_create_session_sizes_connection_pool():
+    from apis.base_api import create_session
+
+    session = create_session(pool_maxsize=16)
+    adapter = session.adapters["https://"]
+    assert adapter is session.adapters["http://"]
+    assert adapter._pool_maxsize == 16
+    assert 429 in adapter.max_retries.status_forcelist
+
+
+def test_parse_json_accepts_what_json_accepts():
+    from apis.base_api import BaseMarineAPI
+
+    response = requests.Response()
+    response._content = b'[{"AphiaID": 1, "depth": NaN}]'
+    response.encoding = "utf-8"
+
+    data = BaseMarineAPI._parse_json(response)
+    assert data[0]["AphiaID"] == 1
+    assert data[0]["depth"] != data[0]["depth"]  # NaN
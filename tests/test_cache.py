@@ -0,0 +1,21 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from app_modules.cache import TTLCache
+
+
+def test_ttl_cache_is_safe_to_share_between_threads():
+    # With a zero TTL every hit expires, so gets race each other to delete entries
+    cache = TTLCache(ttl_seconds=0)
+
+    def hammer(n):
+        for i in range(2000):
+            key = f"k{i % 8}"
+            cache.set(key, n)
+            cache.get(key)
+            if i % 100 == 0:
+                cache.cleanup_expired()
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(hammer, range(8)))
+
+    assert cache.size() <= 8
@@ -3,6 +3,8 @@ import json
 import tempfile
 from pathlib import Path
 
+import pandas as pd
+
 from scripts import convert_biotic
 
 
@@ -56,3 +58,74 @@ GBIF:98765,Capitella capitata,gut_content,expert_curation,doi:10.x,2025-06-01,3,
     else:
         # if rdflib not available, TTL might not be written
         assert True
+
+
+def test_expand_biotic_rows_keeps_row_order_and_skips_invalid_scores(tmp_path: Path):
+    input_csv = tmp_path / "sample.csv"
+    input_csv.write_text(
+        """taxonID,scientificName,feeding_surface_deposit_score,feeding_suspension_score,feeding_mode_score,feeding_mode_term_uri
+T1,Alpha,2,abc,1,
+T2,Beta,,3,2,http://example.org/dominant
+T1,Alpha,1,2.5,,
+"""
+    )
+    mapping_csv = Path(__file__).parents[1] / "schemas" / "biotic_to_schema_mapping.csv"
+    out_csv = tmp_path / "out_long.csv"
+
+    res = convert_biotic.expand_biotic_rows(
+        str(input_csv), str(mapping_csv), str(out_csv)
+    )
+
+    assert res == {"rows_written": 4, "taxa": 2}
+    lines = out_csv.read_text().splitlines()
+    assert lines[0] == ",".join(convert_biotic.LONG_HEADER)
+    rows = [line.split(",")[:4] for line in lines[1:]]
+    assert rows == [
+        ["T1", "Alpha", "feeding_mode", "2"],
+        ["T2", "Beta", "feeding_mode", "3"],
+        ["T2", "Beta", "feeding_mode_dominant", "2"],
+        ["T1", "Alpha", "feeding_mode", "1"],
+    ]
+
+
+def test_fast_ttl_escapes_literals_and_iris(tmp_path: Path):
+    input_csv = tmp_path / "sample.csv"
+    input_csv.write_text(
+        "taxonID,scientificName,evidence,feeding_suspension_score\n"
+        ',Abra alba,"said ""maybe""",2\n'
+    )
+    mapping_csv = Path(__file__).parents[1] / "schemas" / "biotic_to_schema_mapping.csv"
+    out_ttl = tmp_path / "out.ttl"
+
+    convert_biotic.expand_biotic_rows(
+        str(input_csv), str(mapping_csv), str(tmp_path / "out.csv"), str(out_ttl)
+    )
+
+    ttl = out_ttl.read_text()
+    assert ttl.startswith("@prefix dwc: <http://rs.tdwg.org/dwc/terms/> .")
+    assert '<urn:taxon:Abra%20alba> dwc:scientificName "Abra alba" .' in ttl
+    assert "ex:hasTrait <http://example.org/trait/Abra%20alba/1>" in ttl
+    assert 'dcterms:description "said \\"maybe\\"" .' in ttl
+    assert "ex:score 2 ." in ttl
+
+
+def test_load_vocab_groups_labels_by_field(tmp_path: Path):
+    vocab_csv = tmp_path / "vocab.csv"
+    vocab_csv.write_text(
+        "field,label,uri\n"
+        "mobility,Low,http://example.org/low\n"
+        "mobility,High,\n"
+        ",Orphan,http://example.org/orphan\n"
+    )
+
+    assert convert_biotic.load_vocab(str(vocab_csv)) == {
+        "mobility": {"Low": "http://example.org/low", "High": ""}
+    }
+
+
+def test_integer_scores_accepts_only_plain_integers():
+    values = pd.Series(["3", " 2 ", "+1", "-4", "1.0", " 2.0 ", "1e0", "abc", ""])
+    scores = convert_biotic._integer_scores(values)
+
+    assert scores[:4].tolist() == [3, 2, 1, -4]
+    assert scores[4:].isna().all()
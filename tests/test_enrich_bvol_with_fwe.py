@@ -0,0 +1,211 @@
+import pandas as pd
+import pytest
+
+from scripts import enrich_bvol_with_fwe as enrich_mod
+
+
+def _api_result(error=None):
+    df = pd.DataFrame()
+    df.attrs["api_error"] = error
+    return df
+
+
+def test_admission_controller_halves_on_throttle_and_recovers():
+    controller = enrich_mod.AdmissionController(4, increase_after=2)
+
+    controller.record(throttled=True)
+    assert controller.limit == 2
+    controller.record(throttled=True)
+    controller.record(throttled=True)
+    assert controller.limit == 1
+
+    for _ in range(4):
+        controller.record(throttled=False)
+    assert controller.limit == 3
+
+    for _ in range(10):
+        controller.record(throttled=False)
+    assert controller.limit == 4
+
+    with controller:
+        assert controller.in_flight == 1
+    assert controller.in_flight == 0
+
+
+def test_is_throttled_reads_api_error():
+    assert enrich_mod.is_throttled(_api_result("429 Client Error: Too Many Requests"))
+    assert enrich_mod.is_throttled(_api_result("503 Server Error: Service Unavailable"))
+    assert not enrich_mod.is_throttled(_api_result("404 Client Error: Not Found"))
+    assert not enrich_mod.is_throttled(_api_result())
+    assert not enrich_mod.is_throttled([])
+
+
+class _GenusOnlyFWE:
+    """Fake FWE client that only answers genus queries."""
+
+    def __init__(self):
+        self.calls = []
+
+    def query(self, **params):
+        self.calls.append(params)
+        if params.get("genus") == "Aulacoseira":
+            return pd.DataFrame(
+                [
+                    {
+                        "taxon": "Aulacoseira granulata",
+                        "trait": "biovolume",
+                        "value": 5,
+                    },
+                    {"taxon": "Aulacoseira ambigua", "trait": "carbon", "value": 2},
+                ]
+            )
+        return _api_result()
+
+
+def test_lookup_taxon_matches_rows_from_a_single_genus_query():
+    api = _GenusOnlyFWE()
+    controller = enrich_mod.AdmissionController(2)
+
+    genus_result = enrich_mod.fetch_genus(api, controller, "Aulacoseira")
+    exact = enrich_mod.lookup_taxon(
+        api, controller, 0, "Aulacoseira", "granulata", genus_result
+    )
+    other = enrich_mod.lookup_taxon(
+        api, controller, 1, "Aulacoseira", "italica", genus_result
+    )
+
+    assert len(api.calls) == 1
+    assert exact["fwe_biovolume"] == 5.0
+    assert exact["fwe_carbon_pg_per_unit"] is None
+    # Taxa missing from the genus records get the genus-level answer
+    assert other["fwe_carbon_pg_per_unit"] == 2.0
+
+    missing = enrich_mod.lookup_taxon(
+        api,
+        controller,
+        2,
+        "Cyclotella",
+        "meneghiniana",
+        enrich_mod.fetch_genus(api, controller, "Cyclotella"),
+    )
+    assert missing is None
+    assert api.calls[-1] == {
+        "organismgroup": "al",
+        "limit": 10,
+        "q": "Cyclotella meneghiniana",
+    }
+
+
+def test_extract_traits_routes_values_by_trait_name():
+    rows = [
+        {"trait": "carbon", "value": "n/a"},
+        {"Parameter": "Carbon content", "Value": "1.5"},
+        {"trait": "Biovolume", "val": 0},
+        {"ecoparam": "feeding type", "value": "grazer"},
+        {"value": 99},
+    ]
+
+    from_list = enrich_mod.extract_traits_from_response(rows)
+    from_frame = enrich_mod.extract_traits_from_response(pd.DataFrame(rows))
+
+    for result in (from_list, from_frame):
+        assert result["fwe_found"] is True
+        assert result["fwe_biovolume"] == 0.0
+        # Later rows take precedence, whatever the case of their field names
+        assert result["fwe_carbon_pg_per_unit"] == 1.5
+        assert result["fwe_trophic"] == "grazer"
+        assert len(result["fwe_raw_sample"]) == 3
+
+    assert enrich_mod.extract_traits_from_response([])["fwe_found"] is False
+
+
+class _FakeFWEClient(_GenusOnlyFWE):
+    def __init__(self, api_key=None, session=None):
+        super().__init__()
+        self.instances.append(self)
+
+    def authenticate(self):
+        pass
+
+
+def test_enrich_writes_results_for_pending_rows(tmp_path, monkeypatch):
+    clients = []
+    monkeypatch.setattr(_FakeFWEClient, "instances", clients, raising=False)
+    monkeypatch.setattr(enrich_mod, "FreshwaterEcologyAPI", _FakeFWEClient)
+    source = tmp_path / "bvol.xlsx"
+    pd.DataFrame(
+        {
+            "Genus": ["Aulacoseira", "Cyclotella", "Aulacoseira", "Cyclotella"],
+            "Species": ["granulata", "meneghiniana", "ambigua", "meneghiniana"],
+            "fwe_found": [None, None, True, None],
+        }
+    ).to_excel(source, index=False)
+    out = tmp_path / "out.xlsx"
+
+    enrich_mod.enrich(source, "Sheet1", out, workers=2, use_cache=False)
+
+    # One query per genus, plus a single fallback for the repeated Cyclotella taxon
+    assert len(clients[0].calls) == 3
+    result = pd.read_excel(out)
+    assert not out.with_suffix(".partial.xlsx").exists()
+    assert (
+        out.with_suffix(".partial.parquet").exists()
+        or out.with_suffix(".partial.csv").exists()
+    )
+    assert result["fwe_found"].tolist() == [True, False, True, False]
+    assert result.loc[0, "fwe_biovolume"] == 5
+    assert pd.isna(result.loc[1, "fwe_biovolume"])
+    # Rows enriched by an earlier run are left alone
+    assert pd.isna(result.loc[2, "fwe_carbon_pg_per_unit"])
+
+
+def test_load_sheet_caches_the_sheet_as_parquet(tmp_path, monkeypatch):
+    pytest.importorskip("pyarrow")
+    source = tmp_path / "bvol.xlsx"
+    pd.DataFrame({"Genus": ["Aulacoseira"], "Species": ["granulata"]}).to_excel(
+        source, sheet_name="Biovolume file", index=False
+    )
+    cache_path = tmp_path / "bvol.xlsx.Biovolume file.parquet"
+
+    # Cache miss: the workbook is parsed and the Parquet copy written
+    first = enrich_mod.load_sheet(source, "Biovolume file")
+    assert cache_path.exists()
+    assert first["Genus"].tolist() == ["Aulacoseira"]
+
+    # Cache hit: the workbook is not parsed again
+    def fail_read_excel(*args, **kwargs):
+        raise AssertionError("read_excel called despite a fresh Parquet cache")
+
+    monkeypatch.setattr(enrich_mod.pd, "read_excel", fail_read_excel)
+    second = enrich_mod.load_sheet(source, "Biovolume file")
+    pd.testing.assert_frame_equal(first, second)
+
+
+@pytest.mark.parametrize("suffix", [".parquet", ".csv"])
+def test_enrich_resumes_from_a_checkpoint(tmp_path, monkeypatch, suffix):
+    if suffix == ".parquet":
+        pytest.importorskip("pyarrow")
+    clients = []
+    monkeypatch.setattr(_FakeFWEClient, "instances", clients, raising=False)
+    monkeypatch.setattr(enrich_mod, "FreshwaterEcologyAPI", _FakeFWEClient)
+    checkpoint = tmp_path / f"out.partial{suffix}"
+    frame = pd.DataFrame(
+        {
+            "Genus": ["Aulacoseira", "Cyclotella"],
+            "Species": ["granulata", "meneghiniana"],
+            "fwe_found": [None, True],
+        }
+    )
+    if suffix == ".parquet":
+        frame.to_parquet(checkpoint, index=False)
+    else:
+        frame.to_csv(checkpoint, index=False)
+    out = tmp_path / "out.xlsx"
+
+    enrich_mod.enrich(checkpoint, "-", out, workers=1, use_cache=False)
+
+    # Only the row left pending by the interrupted run is looked up
+    assert [call.get("genus") for call in clients[0].calls] == ["Aulacoseira"]
+    result = pd.read_excel(out)
+    assert result["fwe_found"].tolist() == [True, True]
+    assert result.loc[0, "fwe_biovolume"] == 5
@@ -1,7 +1,8 @@
 import pytest
+import responses
+from responses import matchers
 
-from gbif_client import GBIFClient
-
+from gbif_client import GBIF_API_URL, GBIFClient
 
 def test_gbif_client_methods_return_defaults_when_pygbif_missing(monkeypatch):
     # Simulate pygbif missing by toggling the _HAS_PYGBIF flag
@@ -17,9 +18,6 @@ def test_gbif_client_methods_return_defaults_when_pygbif_missing(monkeypatch):
     # search_occurrences should return empty dict
     assert client.search_occurrences(taxon_key=1) == {}
 
-    # get_occurrence_count should return 0
-    assert client.get_occurrence_count(taxon_key=1) == 0
-
     # get_datasets should return []
     assert client.get_datasets() == []
 
@@ -29,3 +27,93 @@ def test_search_species_invalid_name_raises(bad_name):
     client = GBIFClient()
     with pytest.raises(ValueError):
         client.search_species(bad_name)
+
+
+@responses.activate
+def test_species_lookups_are_cached(monkeypatch):
+    from app_modules.cache import clear_all_caches
+
+    clear_all_caches()
+    calls = {"suggest": 0, "usage": 0, "count": 0}
+
+    class FakeSpecies:
+        @staticmethod
+        def name_suggest(q, limit):
+            calls["suggest"] += 1
+            return [{"key": 1, "canonicalName": q}]
+
+        @staticmethod
+        def name_usage(key):
+            calls["usage"] += 1
+            return {"key": key}
+
+    def count_callback(request):
+        calls["count"] += 1
+        return 200, {}, '{"count": 42, "results": []}'
+
+    responses.add_callback(
+        responses.GET, f"{GBIF_API_URL}/occurrence/search", callback=count_callback
+    )
+
+    monkeypatch.setattr("gbif_client._HAS_PYGBIF", True)
+    monkeypatch.setattr("gbif_client.species", FakeSpecies)
+    client = GBIFClient()
+
+    try:
+        assert client.search_species("Abra alba") == client.search_species(
+            " abra ALBA "
+        )
+        assert client.get_species_info(7) == client.get_species_info(7) == {"key": 7}
+        assert client.get_occurrence_count(taxon_key=7) == 42
+        assert client.get_occurrence_count(taxon_key=7) == 42
+        assert calls == {"suggest": 1, "usage": 1, "count": 1}
+
+        # Different limit or country is a different query
+        client.search_species("Abra alba", limit=5)
+        client.get_occurrence_count(taxon_key=7, country="SE")
+        assert calls == {"suggest": 2, "usage": 1, "count": 2}
+    finally:
+        clear_all_caches()
+
+
+@responses.activate
+def test_occurrence_count_queries_rest_endpoint(monkeypatch):
+    from app_modules.cache import clear_all_caches
+
+    clear_all_caches()
+    monkeypatch.setattr("gbif_client._HAS_PYGBIF", True)
+    responses.add(
+        responses.GET,
+        f"{GBIF_API_URL}/occurrence/search",
+        json={"count": 7},
+        match=[
+            matchers.query_param_matcher(
+                {"taxonKey": "5", "country": "SE", "limit": "0"}
+            )
+        ],
+    )
+    responses.add(responses.GET, f"{GBIF_API_URL}/occurrence/search", status=503)
+
+    client = GBIFClient()
+    try:
+        assert client.get_occurrence_count(taxon_key=5, country="SE") == 7
+        # Errors return 0 and are not cached
+        assert client.get_occurrence_count(taxon_key=6) == 0
+        assert client.get_occurrence_count(taxon_key=6) == 0
+        assert len(responses.calls) == 3
+    finally:
+        clear_all_caches()
+
+
+@responses.activate
+def test_occurrence_count_does_not_need_pygbif(monkeypatch):
+    from app_modules.cache import clear_all_caches
+
+    clear_all_caches()
+    monkeypatch.setattr("gbif_client._HAS_PYGBIF", False)
+    responses.add(responses.GET, f"{GBIF_API_URL}/occurrence/search", json={"count": 3})
+
+    try:
+        assert GBIFClient().get_occurrence_count(taxon_key=1) == 3
+    finally:
+        clear_all_caches()
@@ -0,0 +1,43 @@
+import pytest
+
+pytest.importorskip("lxml")
+pytest.importorskip("tqdm")
+
+import getmarlin  # noqa: E402
+
+PAGE = b"""
+<html><head><title>Marlin</title></head><body>
+<h1>Pecten maximus</h1>
+<h2>Biology</h2>
+<!-- parameters -->
+<table>
+  <tr><th>Parameter</th><th>Value</th></tr>
+  <tr><td>Typical abundance</td><td>Low density</td></tr>
+  <tr><td>Male size range</td><td>10-15 cm</td></tr>
+</table>
+<h2>Distribution</h2>
+<table><tr><td>Region</td><td>Atlantic</td></tr></table>
+</body></html>
+"""
+
+
+class _Response:
+    content = PAGE
+
+    def raise_for_status(self):
+        pass
+
+
+def test_scrape_species_reads_table_under_bare_biology_heading(monkeypatch):
+    # A heading with no child elements is falsy in lxml; it must still be found
+    monkeypatch.setattr(getmarlin, "wait_for_request_slot", lambda: None)
+    monkeypatch.setattr(getmarlin.SESSION, "get", lambda *a, **k: _Response())
+
+    data, species, parameters = getmarlin.scrape_species("https://example.org/p")
+
+    assert species == "Pecten maximus"
+    assert parameters == ["Typical abundance", "Male size range"]
+    assert data == {
+        "biology_typical_abundance": "Low density",
+        "biology_male_size_range": "10-15 cm",
+    }
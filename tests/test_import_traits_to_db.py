@@ -0,0 +1,180 @@
+"""
+Tests for scripts/import_traits_to_db.py
+"""
+
+import pandas as pd
+import pytest
+
+from apis.trait_ontology_db import TraitOntologyDB
+from scripts import import_traits_to_db as importer
+
+
+@pytest.fixture
+def trait_db(tmp_path):
+    db = TraitOntologyDB(str(tmp_path / "traits.db"))
+    db.initialize_trait_categories()
+    db.initialize_traits()
+    yield db
+    db.close()
+
+
+@pytest.fixture
+def bvol_file(tmp_path):
+    path = tmp_path / "bvol.xlsx"
+    pd.DataFrame(
+        [
+            {
+                "AphiaID": 200,
+                "Species": "Aa bb",
+                "Genus": "Aa",
+                "Division": "CYANOBACTERIA",
+                "HELCOM area": "BAL",
+                "SizeClassNo": 1,
+                "SizeRange": "1.3-2",
+                "Trophy": "AU",
+                "Length(l1)µm": 1.5,
+                "Calculated_volume_µm3/counting_unit": 10.0,
+                "Calculated_Carbon_pg/counting_unit": 2.0,
+            },
+            {
+                "AphiaID": 200,
+                "Species": "Aa bb",
+                "Genus": "Aa",
+                "SizeClassNo": 2,
+                "SizeRange": "5",
+                "Calculated_Carbon_pg/counting_unit": 3.0,
+            },
+            {"AphiaID": 100, "Genus": "Cc", "Division": "DINO", "Trophy": "MX"},
+            {"AphiaID": None, "Species": "no id"},
+        ]
+    ).to_excel(path, index=False)
+    return str(path)
+
+
+def test_import_phytoplankton_data_writes_all_tables(trait_db, bvol_file):
+    assert importer.import_phytoplankton_data(trait_db, bvol_file) == 2
+
+    assert trait_db.get_species_by_aphia_id(200)["scientific_name"] == "Aa bb"
+    assert trait_db.get_species_by_aphia_id(100)["scientific_name"] is None
+
+    traits = trait_db.get_traits_for_species_batch([100, 200])
+    assert [(t["trait_name"], t["value_categorical"]) for t in traits[100]] == [
+        ("trophic_type", "MX")
+    ]
+    carbon = [
+        (t["size_class_no"], t["size_range"], t["value_numeric"])
+        for t in traits[200]
+        if t["trait_name"] == "carbon_content"
+    ]
+    assert carbon == [(1, "1.3-2", 2.0), (2, "5", 3.0)]
+    assert {t["trait_name"] for t in traits[200]} == {
+        "trophic_type",
+        "length_l1",
+        "biovolume",
+        "carbon_content",
+    }
+
+    conn = trait_db._get_connection()
+    kingdoms = conn.execute(
+        "SELECT kingdom FROM taxonomic_hierarchy ORDER BY species_id"
+    ).fetchall()
+    assert [tuple(row) for row in kingdoms] == [("Chromista",), ("Bacteria",)]
+    areas = conn.execute(
+        "SELECT area_type, area_value FROM geographic_distribution"
+    ).fetchall()
+    assert [tuple(row) for row in areas] == [("HELCOM", "BAL")]
+
+
+def test_import_phytoplankton_data_reuses_existing_species(trait_db, bvol_file):
+    importer.import_phytoplankton_data(trait_db, bvol_file)
+    assert importer.import_phytoplankton_data(trait_db, bvol_file) == 2
+    assert trait_db.get_statistics()["total_species"] == 2
+
+
+def test_resolve_trait_columns_ignores_micro_sign_variant():
+    resolved = importer.resolve_trait_columns(
+        [
+            "AphiaID",
+            "Trophy",
+            "Length(l1)µm",
+            "WIDTH(w)μm",
+            "Volume_formula/counting_unit",
+            "Calculated_volume_µm3/counting_unit",
+            "Calculated_Carbon_pg/counting_unit",
+        ]
+    )
+    assert resolved == {
+        "trophic_type": "Trophy",
+        "length_l1": "Length(l1)µm",
+        "width": "WIDTH(w)μm",
+        "biovolume": "Calculated_volume_µm3/counting_unit",
+        "carbon_content": "Calculated_Carbon_pg/counting_unit",
+    }
+
+
+def test_import_enriched_species_data_batches_species_and_traits(trait_db, tmp_path):
+    path = tmp_path / "species_enriched.xlsx"
+    pd.DataFrame(
+        [
+            {"aphiaID": 10, "taxonomyName": "Foo", "biology_growth_form": "Erect"},
+            {"aphiaID": None, "taxonomyName": "no id", "biology_mobility": "Low"},
+            {"aphiaID": 10, "taxonomyName": "Foo again", "biology_mobility": "High"},
+        ]
+    ).to_excel(path, index=False)
+
+    assert importer.import_enriched_species_data(trait_db, str(path)) == 2
+
+    assert trait_db.get_species_by_aphia_id(10)["scientific_name"] == "Foo"
+    traits = trait_db.get_traits_for_species(10)
+    assert [(t["trait_name"], t["value_categorical"]) for t in traits] == [
+        ("growth_form", "Erect"),
+        ("mobility", "High"),
+    ]
+
+
+def test_connection_is_tuned_for_reads(trait_db):
+    conn = trait_db._get_connection()
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+    assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+
+
+def test_bulk_import_restores_pragmas(trait_db, bvol_file):
+    conn = trait_db._get_connection()
+
+    conn.execute("PRAGMA synchronous=FULL")
+
+    with trait_db.bulk_import():
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+        assert conn.execute("PRAGMA cache_size").fetchone()[0] == -262144
+        importer.import_phytoplankton_data(trait_db, bvol_file)
+
+    assert conn.execute("PRAGMA synchronous").fetchone()[0] == 2
+    assert conn.execute("PRAGMA cache_size").fetchone()[0] == -65536
+    assert trait_db.get_statistics()["total_species"] == 2
+
+
+def test_parse_size_ranges_matches_scalar_parser():
+    values = ["1.3-2", "5", None, "bad", "5-", "1-2-3", " 3 - 4 ", "", 2.5]
+    mins, maxs = importer.parse_size_ranges(pd.Series(values, dtype=object))
+    assert list(zip(mins, maxs, strict=True)) == [
+        importer.parse_size_range(v) for v in values
+    ]
+
+
+def test_bulk_import_analyzes_lookup_indexes(trait_db, bvol_file):
+    with trait_db.bulk_import():
+        importer.import_phytoplankton_data(trait_db, bvol_file)
+
+    conn = trait_db._get_connection()
+    analyzed = {row[0] for row in conn.execute("SELECT idx FROM sqlite_stat1")}
+    assert {"idx_trait_values_species_size", "idx_size_classes_species_no"} <= analyzed
+
+
+def test_get_species_by_aphia_ids_matches_single_lookup(trait_db, bvol_file):
+    importer.import_phytoplankton_data(trait_db, bvol_file)
+
+    species = trait_db.get_species_by_aphia_ids([200, 999, 100, 200])
+    assert sorted(species) == [100, 200]
+    assert species[200] == trait_db.get_species_by_aphia_id(200)
+    assert trait_db.get_species_by_aphia_ids([]) == {}
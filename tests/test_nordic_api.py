@@ -40,3 +40,36 @@ def test_get_nua_harmfulness_success():
     assert isinstance(df, pd.DataFrame)
     assert not df.empty
     assert df.iloc[0]["taxon_id"] == taxon_id
+
+
+@responses.activate
+def test_get_harmful_taxa_filters_and_caches():
+    api = NordicMicroalgaeAPI()
+    url = api.base_url.rstrip("/") + "/taxa"
+    sample = [
+        {"name": "Nodularia spumigena", "harmfulness": "Toxic"},
+        {"name": "Skeletonema marinoi", "harmfulness": "Harmless"},
+        {"name": "Unknown alga", "harmfulness": None},
+    ]
+    responses.add(responses.GET, url, json=sample, status=200)
+
+    df = api.get_harmful_taxa()
+    assert df["name"].tolist() == ["Nodularia spumigena"]
+
+    # Second call is served from the cached result
+    api.get_harmful_taxa()
+    assert len(responses.calls) == 1
+
+
+@responses.activate
+def test_get_nua_harmfulness_keeps_input_order():
+    api = NordicMicroalgaeAPI()
+    for taxon_id in (1, 2, 3):
+        url = api.base_url.rstrip("/") + f"/taxa/{taxon_id}/harmfulness"
+        responses.add(
+            responses.GET, url, json={"harmfulness": f"level {taxon_id}"}, status=200
+        )
+
+    df = api.get_nua_harmfulness([3, 1, 2])
+    assert df["taxon_id"].tolist() == [3, 1, 2]
+    assert df["harmfulness"].tolist() == ["level 3", "level 1", "level 2"]
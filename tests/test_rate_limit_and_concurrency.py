@@ -74,3 +74,26 @@ def test_concurrent_obis_calls(monkeypatch):
     assert len(results) == len(inputs)
     for df in results:
         assert isinstance(df, pd.DataFrame)
+
+
+def test_get_obis_records_fans_out_concurrently(monkeypatch):
+    api = OBISAPI()
+
+    def slow_make_request(endpoint, method="GET", params=None, data=None):
+        time.sleep(0.1)
+        return params["scientificname"]
+
+    def handle_response(response):
+        return {"results": [{"species": response}]}
+
+    monkeypatch.setattr(api, "_make_request", slow_make_request)
+    monkeypatch.setattr(api, "_handle_response", handle_response)
+
+    names = [f"Species {i}" for i in range(5)]
+    start = time.perf_counter()
+    df = api.get_obis_records(names)
+    elapsed = time.perf_counter() - start
+
+    # Results keep input order and requests overlap instead of running serially
+    assert df["species"].tolist() == names
+    assert elapsed < 0.4
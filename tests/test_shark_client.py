@@ -0,0 +1,83 @@
+import pytest
+import requests
+
+from apis.base_api import MAX_CONCURRENT_REQUESTS
+from shark_client import (
+    REFERENCE_CACHE_EXPIRE_AFTER,
+    TAXA_CACHE_EXPIRE_AFTER,
+    SHARKClient,
+)
+
+
+def test_session_retries_and_pools_connections():
+    client = SHARKClient(use_cache=False)
+    adapter = client.session.get_adapter(client.endpoints["worms"])
+
+    assert isinstance(adapter, requests.adapters.HTTPAdapter)
+    assert adapter._pool_maxsize == MAX_CONCURRENT_REQUESTS
+    assert 503 in adapter.max_retries.status_forcelist
+    assert client.worms_api.session is client.session
+
+
+def test_close_releases_session(monkeypatch):
+    closed = []
+    with SHARKClient(use_cache=False) as client:
+        monkeypatch.setattr(client.session, "close", lambda: closed.append(True))
+    assert closed == [True]
+
+
+def test_sub_apis_are_created_on_first_use():
+    client = SHARKClient(use_cache=False)
+    assert "worms_api" not in vars(client)
+
+    worms_api = client.worms_api
+    assert worms_api.base_url == client.endpoints["worms"]
+    assert client.worms_api is worms_api
+    assert "obis_api" not in vars(client)
+
+
+def test_mock_frames_are_built_once_and_copied():
+    client = SHARKClient(use_cache=False)
+    first = client._get_mock_stations()
+    first.attrs["api_fallback"] = True
+    first["extra"] = 1
+
+    second = client._get_mock_stations()
+    assert "extra" not in second.columns
+    assert "api_fallback" not in second.attrs
+    assert first["id"].tolist() == second["id"].tolist()
+
+
+def test_cache_covers_reference_lists_but_not_downloads(tmp_path, monkeypatch):
+    pytest.importorskip("requests_cache")
+    from requests_cache import DO_NOT_CACHE
+    from requests_cache.policy.expiration import get_url_expiration
+
+    monkeypatch.chdir(tmp_path)
+    client = SHARKClient()
+    patterns = client.session.settings.urls_expire_after
+    shark = client.endpoints["shark"]
+
+    assert (
+        get_url_expiration(shark + "stations", patterns) == REFERENCE_CACHE_EXPIRE_AFTER
+    )
+    assert (
+        get_url_expiration(shark + "datasets/PHYTO/download", patterns) == DO_NOT_CACHE
+    )
+    assert get_url_expiration(shark + "data?limit=10", patterns) is None
+    assert get_url_expiration(
+        client.endpoints["worms"] + "AphiaRecordsByNames", patterns
+    ) == (TAXA_CACHE_EXPIRE_AFTER["worms"])
+    client.clear_cache()
+
+
+def test_endpoints_are_shared_and_read_only():
+    first, second = SHARKClient(use_cache=False), SHARKClient(use_cache=False)
+    assert first.endpoints is second.endpoints
+    with pytest.raises(TypeError):
+        first.endpoints["worms"] = "https://example.org/"
+
+    custom = SHARKClient(base_url="https://example.org/shark/", use_cache=False)
+    assert custom.endpoints["shark"] == "https://example.org/shark/"
+    assert custom.endpoints["worms"] == first.endpoints["worms"]
+    assert first.endpoints["shark"] == "https://sharkdata.smhi.se/api/"
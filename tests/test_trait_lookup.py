@@ -0,0 +1,134 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from apis import trait_lookup
+from apis.trait_lookup import TraitLookup
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(trait_lookup, "DEFAULT_CACHE_DIR", cache_dir)
+    return cache_dir
+
+
+@pytest.fixture
+def trait_files(tmp_path):
+    bvol = pd.DataFrame(
+        {
+            "AphiaID": [149000, 149000, 149100, None],
+            "Species": [
+                "Coscinodiscus radiatus",
+                "Coscinodiscus radiatus",
+                "Chaetoceros sp.",
+                "Coscinodiscus unknown",
+            ],
+            "Genus": ["Coscinodiscus", "Coscinodiscus", "Chaetoceros", "Coscinodiscus"],
+            "SizeClassNo": [1, 2, 1, 1],
+        }
+    )
+    species = pd.DataFrame(
+        {
+            "aphiaID": [141433, 149001],
+            "taxonomyName": ["Abra alba", "Coscinodiscus wailesii"],
+            "synonymCommonName": ["White furrow shell", np.nan],
+        }
+    )
+    bvol_path = tmp_path / "bvol.xlsx"
+    species_path = tmp_path / "species.xlsx"
+    bvol.to_excel(bvol_path, index=False)
+    species.to_excel(species_path, index=False)
+    return str(bvol_path), str(species_path)
+
+
+def test_search_by_species_name_matches_substrings_in_both_datasets(trait_files):
+    lookup = TraitLookup(*trait_files)
+
+    results = lookup.search_by_species_name("COSCINO")
+
+    assert [(r["aphia_id"], r["source"]) for r in results] == [
+        (149000, "bvol_nomp_version_2024"),
+        (149000, "bvol_nomp_version_2024"),
+        (149001, "species_enriched"),
+    ]
+    assert results[0]["genus"] == "Coscinodiscus"
+    assert "common_name" in results[-1]
+
+
+def test_search_by_species_name_treats_query_literally(trait_files):
+    lookup = TraitLookup(*trait_files)
+
+    assert [r["species"] for r in lookup.search_by_species_name("sp.")] == [
+        "Chaetoceros sp."
+    ]
+    assert lookup.search_by_species_name("(") == []
+
+
+def test_aphia_lookups_use_row_index(trait_files):
+    lookup = TraitLookup(*trait_files)
+
+    phyto = lookup.get_phytoplankton_traits(149000)
+    assert phyto["multiple_size_classes"] is True
+    assert [c["size_class_no"] for c in phyto["size_classes"]] == [1, 2]
+
+    single = lookup.get_phytoplankton_traits(np.int64(149100))
+    assert single["species"] == "Chaetoceros sp."
+    assert single["multiple_size_classes"] is False
+
+    species = lookup.get_species_traits(141433)
+    assert species["taxonomy_name"] == "Abra alba"
+    assert species["common_name"] == "White furrow shell"
+
+    assert lookup.get_phytoplankton_traits(1) is None
+    assert lookup.get_species_traits(149000) is None
+
+
+def test_parsed_workbooks_are_cached_until_the_file_changes(
+    trait_files, isolated_cache_dir, monkeypatch
+):
+    bvol_path, species_path = trait_files
+    expected = TraitLookup(bvol_path, species_path).get_all_traits(141433)
+    assert len(list(isolated_cache_dir.glob("*.pkl*"))) == 2
+
+    def fail_read_excel(*args, **kwargs):
+        raise AssertionError("workbook should come from the cache")
+
+    with monkeypatch.context() as m:
+        m.setattr(trait_lookup.pd, "read_excel", fail_read_excel)
+        assert TraitLookup(bvol_path, species_path).get_all_traits(141433) == expected
+
+    # A rewritten workbook invalidates its cached copy
+    pd.DataFrame({"aphiaID": [1], "taxonomyName": ["Replaced"]}).to_excel(
+        species_path, index=False
+    )
+    lookup = TraitLookup(bvol_path, species_path)
+    assert lookup.get_species_traits(141433) is None
+    assert lookup.get_species_traits(1)["taxonomy_name"] == "Replaced"
+
+
+def test_get_all_traits_is_cached_until_reload(trait_files, monkeypatch):
+    lookup = TraitLookup(*trait_files)
+    first = lookup.get_all_traits(141433)
+    assert first["data_sources"] == ["species_enriched"]
+
+    def fail(*args, **kwargs):
+        raise AssertionError("expected a cached result")
+
+    with monkeypatch.context() as m:
+        m.setattr(lookup, "get_species_traits", fail)
+        assert lookup.get_all_traits(141433) is first
+
+    lookup.reload()
+    assert not lookup._species_loaded
+    again = lookup.get_all_traits(141433)
+    assert again is not first and again == first
+
+
+def test_trait_cache_without_zstandard(trait_files, isolated_cache_dir, monkeypatch):
+    monkeypatch.setattr(trait_lookup, "_HAS_ZSTD", False)
+    bvol_path, species_path = trait_files
+
+    expected = TraitLookup(bvol_path, species_path).get_all_traits(149000)
+    assert sorted(p.suffix for p in isolated_cache_dir.iterdir()) == [".pkl", ".pkl"]
+    assert TraitLookup(bvol_path, species_path).get_all_traits(149000) == expected
@@ -0,0 +1,29 @@
+"""
+Tests for app_modules/utils.py
+"""
+
+import pandas as pd
+import pytest
+
+from app_modules import utils
+from app_modules.utils import to_arrow_dtypes
+
+
+def test_to_arrow_dtypes_empty_dataframe_returned_unchanged():
+    df = pd.DataFrame()
+    assert to_arrow_dtypes(df) is df
+
+
+def test_to_arrow_dtypes_without_pyarrow(monkeypatch):
+    monkeypatch.setattr(utils, "_HAS_PYARROW", False)
+    df = pd.DataFrame({"Species Name": ["Abra alba"]})
+    assert to_arrow_dtypes(df) is df
+
+
+def test_to_arrow_dtypes_converts_columns():
+    pytest.importorskip("pyarrow")
+    df = pd.DataFrame({"Species Name": ["Abra alba", "Fucus"], "Count": [1, 2]})
+    result = to_arrow_dtypes(df)
+    assert str(result["Species Name"].dtype) == "string[pyarrow]"
+    assert str(result["Count"].dtype) == "int64[pyarrow]"
+    assert result["Species Name"].tolist() == ["Abra alba", "Fucus"]
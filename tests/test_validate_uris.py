@@ -0,0 +1,223 @@
+import csv
+from pathlib import Path
+
+import pytest
+
+from scripts import validate_uris
+
+
+@pytest.fixture
+def fake_ols(monkeypatch):
+    """Answer IRI lookups from a dict and record every request."""
+    calls = []
+    known = {
+        "http://purl.obolibrary.org/obo/ENVO_0000447": (
+            "http://purl.obolibrary.org/obo/ENVO_00000447",
+            "envo",
+        ),
+    }
+
+    def fetch(iri):
+        calls.append(iri)
+        return known.get(iri, (None, None))
+
+    # An uncached session, so prefetch_iris() does not write .ols_cache.sqlite
+    session = validate_uris.create_ols_session(use_cache=False)
+    monkeypatch.setattr(validate_uris, "_session", session)
+    monkeypatch.setattr(validate_uris, "_iri_results", {})
+    monkeypatch.setattr(validate_uris, "_failed_iris", set())
+    monkeypatch.setattr(validate_uris, "_fetch_ols_by_iri", fetch)
+    monkeypatch.setattr(
+        validate_uris, "search_ols_by_label", lambda *a, **k: (None, None)
+    )
+    return calls
+
+
+def _write_csv(path: Path, rows):
+    with open(path, "w", newline="", encoding="utf-8") as fh:
+        writer = csv.DictWriter(fh, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def test_process_csv_resolves_each_iri_once(tmp_path: Path, fake_ols):
+    path = tmp_path / "traits.csv"
+    _write_csv(
+        path,
+        [
+            {"taxon": "a", "habitat_envo_uri": "ENVO:447", "relation_uri": ""},
+            {
+                "taxon": "b",
+                "habitat_envo_uri": "envo:447; ENVO:999",
+                "relation_uri": "",
+            },
+        ],
+    )
+
+    replaced = validate_uris.process_csv(str(path))
+
+    assert sorted(fake_ols) == [
+        "http://purl.obolibrary.org/obo/ENVO_0000447",
+        "http://purl.obolibrary.org/obo/ENVO_0000999",
+    ]
+    assert replaced == {
+        "ENVO:447": "http://purl.obolibrary.org/obo/ENVO_00000447",
+        "envo:447": "http://purl.obolibrary.org/obo/ENVO_00000447",
+    }
+    with open(path, newline="", encoding="utf-8") as fh:
+        rows = list(csv.DictReader(fh))
+    assert (
+        rows[1]["habitat_envo_uri"]
+        == "http://purl.obolibrary.org/obo/ENVO_00000447;ENVO:999"
+    )
+    assert (tmp_path / "traits.csv.bak").exists()
+
+
+def test_create_ols_session_caches_unless_disabled(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    requests_cache = pytest.importorskip("requests_cache")
+
+    assert isinstance(validate_uris.create_ols_session(), requests_cache.CachedSession)
+    assert not isinstance(
+        validate_uris.create_ols_session(use_cache=False), requests_cache.CachedSession
+    )
+
+
+def test_ols_session_pools_a_connection_per_worker():
+    session = validate_uris.create_ols_session(use_cache=False)
+    adapter = session.get_adapter(validate_uris.OLS_BASE)
+    assert adapter._pool_maxsize == validate_uris.OLS_WORKERS
+
+
+class _FakeResponse:
+    def __init__(self, payload):
+        self._payload = payload
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self._payload
+
+
+class _FakeSession:
+    def __init__(self, payload):
+        self.payload = payload
+        self.urls = []
+
+    def get(self, url, timeout=None):
+        self.urls.append(url)
+        return _FakeResponse(self.payload)
+
+
+def test_search_ols_by_label_requests_only_the_top_hit(monkeypatch):
+    session = _FakeSession(
+        {
+            "response": {
+                "docs": [
+                    {
+                        "iri": "http://purl.obolibrary.org/obo/ENVO_00000447",
+                        "ontology_name": "envo",
+                    }
+                ]
+            }
+        }
+    )
+    monkeypatch.setattr(validate_uris, "_session", session)
+
+    assert validate_uris.search_ols_by_label("marine", ontology_filter="envo") == (
+        "http://purl.obolibrary.org/obo/ENVO_00000447",
+        "envo",
+    )
+    assert "rows=1&fieldList=iri,ontology_name,ontology" in session.urls[0]
+    assert session.urls[0].endswith("&ontology=envo")
+
+
+def test_canonical_obo_iris_skip_ols(fake_ols):
+    value = "https://purl.obolibrary.org/obo/ENVO_00000447;http://purl.obolibrary.org/obo/RO_0002110"
+
+    newval, mapping = validate_uris.canonicalize_value(
+        value, expected_ontologies={"envo"}
+    )
+
+    assert fake_ols == ["http://purl.obolibrary.org/obo/RO_0002110"]
+    assert (
+        newval
+        == "http://purl.obolibrary.org/obo/ENVO_00000447;http://purl.obolibrary.org/obo/RO_0002110"
+    )
+    assert mapping == {
+        "https://purl.obolibrary.org/obo/ENVO_00000447": "http://purl.obolibrary.org/obo/ENVO_00000447",
+        "http://purl.obolibrary.org/obo/RO_0002110": None,
+    }
+    assert list(validate_uris.iri_candidates(value, frozenset({"envo"}))) == [
+        "http://purl.obolibrary.org/obo/RO_0002110"
+    ]
+
+
+def test_process_csv_canonicalizes_repeated_cells_once(
+    tmp_path: Path, fake_ols, monkeypatch
+):
+    searches = []
+    monkeypatch.setattr(
+        validate_uris,
+        "search_ols_by_label",
+        lambda *a, **k: searches.append(a) or (None, None),
+    )
+    path = tmp_path / "traits.csv"
+    _write_csv(path, [{"taxon": t, "food_item_uri": "FOODON:fish"} for t in "abc"])
+
+    validate_uris.process_csv(str(path))
+
+    assert searches == [("fish",)]
+
+
+def test_unreachable_iris_are_reported_not_cached(
+    tmp_path: Path, fake_ols, monkeypatch, capsys
+):
+    def fetch(iri):
+        fake_ols.append(iri)
+        raise validate_uris.requests.ConnectionError("OLS down")
+
+    monkeypatch.setattr(validate_uris, "_fetch_ols_by_iri", fetch)
+    path = tmp_path / "traits.csv"
+    _write_csv(path, [{"taxon": t, "habitat_envo_uri": "ENVO:447"} for t in "ab"])
+
+    assert validate_uris.process_csv(str(path)) == {}
+
+    assert fake_ols == ["http://purl.obolibrary.org/obo/ENVO_0000447"]
+    assert validate_uris._iri_results == {}
+    assert validate_uris._failed_iris == {"http://purl.obolibrary.org/obo/ENVO_0000447"}
+    assert "re-run to retry them" in capsys.readouterr().out
+
+
+def test_ols_session_retries_with_backoff():
+    session = validate_uris.create_ols_session(use_cache=False)
+    retry = session.get_adapter(validate_uris.OLS_BASE).max_retries
+    assert retry.total == validate_uris.OLS_RETRIES
+    assert retry.backoff_factor == validate_uris.OLS_BACKOFF_FACTOR
+    assert retry.respect_retry_after_header
+
+
+def test_unexpected_ols_body_is_treated_as_unknown(monkeypatch):
+    class _Response:
+        status_code = 200
+
+        def raise_for_status(self):
+            pass
+
+        def json(self):
+            return ["not", "a", "dict"]
+
+    class _Session:
+        def get(self, url, timeout):
+            return _Response()
+
+    monkeypatch.setattr(validate_uris, "_session", _Session())
+    monkeypatch.setattr(validate_uris, "_iri_results", {})
+    monkeypatch.setattr(validate_uris, "_failed_iris", set())
+    iri = "http://purl.obolibrary.org/obo/ENVO_0000447"
+
+    validate_uris.prefetch_iris([iri])
+
+    assert validate_uris._iri_results == {iri: (None, None)}
+    assert validate_uris._failed_iris == set()
@@ -1,19 +1,19 @@
 import pandas as pd
 import responses
+from responses import matchers
 
 from apis import WoRMSAPI
-
+from apis.worms_api import WORMS_BATCH_SIZE
 
 @responses.activate
 def test_get_worms_records_success():
     api = WoRMSAPI()
-    name = "Fucus%20vesiculosus"
-    url = api.base_url.rstrip("/") + f"/AphiaRecordsByName/{name}"
+    url = api.base_url.rstrip("/") + "/AphiaRecordsByNames"
 
-    sample = [{"AphiaID": 1, "scientificname": "Fucus vesiculosus"}]
+    sample = [[{"AphiaID": 1, "scientificname": "Fucus vesiculosus"}]]
     responses.add(responses.GET, url, json=sample, status=200)
 
-    df = api.get_worms_records(["Fucus%20vesiculosus"])
+    df = api.get_worms_records(["Fucus vesiculosus"])
     assert isinstance(df, pd.DataFrame)
     assert not df.empty
     assert df.iloc[0]["scientificname"] == "Fucus vesiculosus"
@@ -22,8 +22,7 @@ def test_get_worms_records_success():
 @responses.activate
 def test_get_worms_records_fallback():
     api = WoRMSAPI()
-    name = "Nobody"
-    url = api.base_url.rstrip("/") + f"/AphiaRecordsByName/{name}"
+    url = api.base_url.rstrip("/") + "/AphiaRecordsByNames"
 
     responses.add(responses.GET, url, status=404)
 
@@ -31,3 +30,75 @@ def test_get_worms_records_fallback():
     # Should fall back to mock data and return DataFrame
     assert isinstance(df, pd.DataFrame)
     assert not df.empty
+
+
+@responses.activate
+def test_get_worms_records_batches_names():
+    api = WoRMSAPI()
+    url = api.base_url.rstrip("/") + "/AphiaRecordsByNames"
+    names = [f"Species {i}" for i in range(WORMS_BATCH_SIZE + 1)]
+
+    # Names without a match come back as null entries
+    responses.add(
+        responses.GET,
+        url,
+        json=[[{"AphiaID": 1, "scientificname": names[0]}]]
+        + [None] * (WORMS_BATCH_SIZE - 1),
+        status=200,
+        match=[
+            matchers.query_param_matcher(
+                {
+                    "scientificnames[]": names[:WORMS_BATCH_SIZE],
+                    "like": "true",
+                    "marine_only": "true",
+                }
+            )
+        ],
+    )
+    responses.add(
+        responses.GET,
+        url,
+        json=[[{"AphiaID": 2, "scientificname": names[-1]}]],
+        status=200,
+        match=[
+            matchers.query_param_matcher(
+                {"scientificnames[]": names[-1], "like": "true", "marine_only": "true"}
+            )
+        ],
+    )
+
+    df = api.get_worms_records(names)
+    assert len(responses.calls) == 2
+    assert df["AphiaID"].tolist() == [1, 2]
+
+
+@responses.activate
+def test_get_worms_records_splits_batches_that_are_too_large():
+    api = WoRMSAPI()
+    url = api.base_url.rstrip("/") + "/AphiaRecordsByNames"
+    names = ["Aaa", "Bbb", "Ccc"]
+
+    def params(batch):
+        return [
+            matchers.query_param_matcher(
+                {"scientificnames[]": batch, "like": "true", "marine_only": "true"}
+            )
+        ]
+
+    responses.add(responses.GET, url, status=414, match=params(names))
+    responses.add(
+        responses.GET,
+        url,
+        json=[[{"AphiaID": 1, "scientificname": "Aaa"}]],
+        match=params("Aaa"),
+    )
+    responses.add(
+        responses.GET,
+        url,
+        json=[None, [{"AphiaID": 3, "scientificname": "Ccc"}]],
+        match=params(["Bbb", "Ccc"]),
+    )
+
+    df = api.get_worms_records(names)
+    assert df["AphiaID"].tolist() == [1, 3]
+    assert not df.attrs["api_fallback"]